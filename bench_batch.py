@@ -0,0 +1,61 @@
+"""
+Throughput benchmark: one-script-per-deck vs. the warm batch engine.
+
+    python bench_batch.py -n 20 --theme dark
+
+The old flow starts a fresh interpreter per deck (python generate_ppt_1.py out.pptx);
+the engine builds all N decks with render_many() in this process.
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+# theme -> (script, deck it renders)
+SCRIPTS = {'dark': ('generate_ppt_1.py', 'q3'), 'white': ('generate_ppt_white.py', 'q3_compact')}
+
+
+def synthetic_specs(n):
+    return [{'name': f'Employee {i:04d}'} for i in range(n)]
+
+
+def bench_subprocess(n, theme, out_dir):
+    script = os.path.join(HERE, SCRIPTS[theme][0])
+    start = time.perf_counter()
+    for i in range(n):
+        subprocess.run([sys.executable, script, os.path.join(out_dir, f'deck_{i}.pptx')],
+                       check=True, stdout=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def bench_engine(n, theme, out_dir):
+    # Timed from the import so the one-off pptx import cost is included.
+    start = time.perf_counter()
+    sys.path.insert(0, HERE)
+    from deck_engine import render_many
+    render_many(synthetic_specs(n), out_dir, theme, deck=SCRIPTS[theme][1])
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=20, help='decks per run (default 20)')
+    ap.add_argument('--theme', choices=sorted(SCRIPTS), default='dark')
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as a, tempfile.TemporaryDirectory() as b:
+        t_sub = bench_subprocess(args.n, args.theme, a)
+        t_eng = bench_engine(args.n, args.theme, b)
+
+    print(f'{args.n} {args.theme} decks')
+    print(f'  one script per deck : {t_sub:7.2f}s  {args.n / t_sub:7.2f} decks/s')
+    print(f'  batch engine        : {t_eng:7.2f}s  {args.n / t_eng:7.2f} decks/s')
+    print(f'  speedup             : {t_sub / t_eng:7.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+"""
+Native charts: aggregation and embedding time on a 10M-row build log.
+
+    python bench_charts.py --rows 10000000 -n 50
+
+A --rows log (12 teams of very different sizes, one quarter of days) is
+written as .npz and timed: loading it, aggregating each
+metric cold (vectorized group-bys over all rows), reading the aggregate back
+from the disk cache as a fresh process would, and building the chart XML
+plus workbook. Finally n q3 decks with the log as their build_data are
+rendered from an empty cache (both charts on the results slide), counting
+how often data was aggregated, charts built and parts embedded. (Aggregation
+against a plain-Python reference, and building each dataset once per batch,
+are tested in tests/test_charts.py.)
+"""
+
+import argparse
+import io
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from dataclasses import replace
+
+import numpy as np
+
+import charts
+import deck_content
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+TEAMS = ['web', 'mobile', 'api', 'payments', 'search', 'data', 'infra', 'ml', 'qa', 'docs', 'ops', 'security']
+QUARTER = np.datetime64('2025-07-01')
+
+
+def write_builds(path, rows, seed=0, chunk=1 << 20):
+    """Write a synthetic *rows*-row build log (.npz) over one quarter; team sizes and build times differ."""
+    rng = np.random.default_rng(seed)
+    weights = 1 / np.arange(1, len(TEAMS) + 1)
+    weights /= weights.sum()
+    team, day, seconds, failed = [], [], [], []
+    for start in range(0, rows, chunk):
+        n = min(chunk, rows - start)
+        t = rng.choice(len(TEAMS), n, p=weights).astype(np.int16)
+        team.append(t)
+        day.append(rng.integers(0, 92, n).astype(np.int32) + QUARTER.astype(np.int64))
+        seconds.append((rng.lognormal(5.5, 0.6, n) * (1 + 0.15 * t)).astype(np.float32))
+        failed.append(rng.random(n) < 0.03 + 0.01 * t)
+    np.savez(path, teams=np.array(TEAMS), team=np.concatenate(team), day=np.concatenate(day),
+             seconds=np.concatenate(seconds), failed=np.concatenate(failed))
+
+
+# ── Timing ──
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def build(slides, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(slides, theme), buf)
+    return buf.getvalue()
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--rows', type=int, default=10_000_000, help='rows of the timed build log (default 10M)')
+    ap.add_argument('-n', type=int, default=50, help='decks in the embedding batch (default 50)')
+    ap.add_argument('--python-pptx', action='store_true', help='render through python-pptx, not direct XML')
+    args = ap.parse_args()
+    theme = replace(THEMES['dark'], direct_xml=not args.python_pptx)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        charts.CACHE_DIR = os.path.join(tmp, 'cache')
+        path = os.path.join(tmp, 'builds.npz')
+        _, seconds = timed(write_builds, path, args.rows)
+        print(f'build log: {args.rows:,} rows, {os.path.getsize(path) / (1 << 20):.0f} MB .npz '
+              f'(written in {seconds:.1f} s)')
+        builds, seconds = timed(charts.load_builds, path)
+        print(f'{"load":34} {seconds * 1000:9.0f} ms  {args.rows / seconds / 1e6:6.1f} M rows/s')
+        print(f'\n{"dataset":34} {"aggregate":>9} {"rows/s":>9} {"disk hit":>9} {"chart":>9}')
+        for chart in charts.CHARTS:
+            for metric in charts.METRICS:
+                ds, cold = timed(charts.aggregate, builds, chart, metric)
+                charts.dataset(path, chart, metric)       # aggregates (again) and writes the disk cache
+                charts._datasets.clear()
+                _, warm = timed(charts.dataset, path, chart, metric)
+                _, built = timed(charts.chart_blobs, ds, chart, theme, metric)
+                print(f'{chart + "/" + metric:34} {cold * 1000:7.0f}ms {args.rows / cold / 1e6:7.1f}M '
+                      f'{warm * 1000:7.2f}ms {built * 1000:7.1f}ms')
+        del builds
+
+        charts.reset()
+        shutil.rmtree(charts.CACHE_DIR)
+        slides = deck_content.build({'build_data': path})
+        times = [timed(build, slides, theme)[1] for _ in range(args.n)]
+        stats = dict(charts.stats)
+        plain = statistics.median(timed(build, deck_content.build(None), theme)[1] for _ in range(max(args.n // 5, 3)))
+        print(f'\n{args.n} q3 decks with build_data (build = render + save): first {times[0] * 1000:.0f} ms, '
+              f'then median {statistics.median(times[1:] or times) * 1000:.1f} ms (without charts '
+              f'{plain * 1000:.1f} ms)')
+        print(f'logs loaded {stats["loaded"]}  aggregated {stats["aggregated"]}  disk hits {stats["disk_hits"]}  '
+              f'memory hits {stats["memory_hits"]}  charts built {stats["built"]}  parts embedded '
+              f'{stats["embedded"]}')
+
+
+if __name__ == '__main__':
+    main()
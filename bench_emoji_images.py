@@ -0,0 +1,110 @@
+"""
+Emoji pictures: image cache hit rates across a batch, deck size and build time.
+
+    python bench_emoji_images.py -n 200
+    python bench_emoji_images.py --font /usr/share/fonts/truetype/noto/NotoColorEmoji.ttf
+
+A batch of n decks is rendered with Theme.emoji_images twice against an
+empty PNG cache directory, the second time as a fresh process would
+(in-memory PNGs forgotten), to count how often emoji were rasterized, read
+from disk or served from memory. Then the .pptx size and full builds (render
+plus save) of the 11-slide deck are compared with and without pictures.
+Without an emoji font every emoji stays text. (How emoji are embedded is
+tested in tests/test_emoji_images.py.)
+"""
+
+import argparse
+import io
+import os
+import re
+import statistics
+import tempfile
+import time
+import zipfile
+from dataclasses import replace
+
+import deck_content
+import emoji_images
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+
+def build(deck, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(deck_content.build(None, deck), theme), buf)
+    return buf.getvalue()
+
+
+def picture_counts(data):
+    """(pictures on slides, image parts) of a .pptx."""
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        slides = [n for n in z.namelist() if re.match(r'ppt/slides/slide\d+\.xml$', n)]
+        return (sum(z.read(n).count(b'<p:pic>') for n in slides),
+                sum(n.startswith('ppt/media/') for n in z.namelist()))
+
+
+def run_batch(n):
+    """Render *n* q3 decks with emoji pictures; returns (seconds, a copy of emoji_images.stats)."""
+    theme = replace(THEMES['dark'], emoji_images=True)
+    slides = deck_content.build(None, 'q3')
+    start = time.perf_counter()
+    for _ in range(n):
+        render(slides, theme)
+    return time.perf_counter() - start, dict(emoji_images.stats)
+
+
+def time_builds(theme, n):
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        build('q3', theme)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=200, help='decks in the cache batch (default 200)')
+    ap.add_argument('--builds', type=int, default=20, help='timed builds per variant (default 20)')
+    ap.add_argument('--font', help='emoji font file (default: EMOJI_FONT, else the first of EMOJI_FONTS found)')
+    args = ap.parse_args()
+    if args.font:
+        os.environ['EMOJI_FONT'] = args.font
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        emoji_images.CACHE_DIR = cache_dir
+        emoji_images.reset()
+        font = emoji_images.find_emoji_font()
+        print(f'emoji font: {font or "none found, every emoji stays text"}')
+
+        print(f'\nbatch of {args.n} q3 decks (dark), empty PNG cache at first')
+        for label in ('first process', 'fresh process'):
+            seconds, stats = run_batch(args.n)
+            looked_up = stats['memory_hits'] + stats['disk_hits'] + stats['rasterized']
+            print(f'{label:14} {args.n / seconds:7.1f} decks/s  rasterized {stats["rasterized"]:4d}  '
+                  f'disk hits {stats["disk_hits"]:4d}  memory hits {stats["memory_hits"]:6d}  '
+                  f'kept as text {stats["skipped"]:3d}  hit rate '
+                  + (f'{(looked_up - stats["rasterized"]) / looked_up:.1%}' if looked_up else 'n/a'))
+            emoji_images.reset()
+        pngs = [os.path.join(root, f) for root, _, files in os.walk(emoji_images.CACHE_DIR) for f in files]
+        print(f'cache dir: {len(pngs)} PNGs, {sum(map(os.path.getsize, pngs)) / 1024:.1f} KB')
+
+        print(f'\nq3 deck, dark theme (build = render + save, median of {args.builds}, PNG cache warm)')
+        print(f'{"variant":24} {"pictures":>9} {"image parts":>12} {".pptx KB":>9} {"build ms":>9}')
+        rows = {}
+        for label, theme in (('emoji as text', THEMES['dark']),
+                             ('emoji pictures', replace(THEMES['dark'], emoji_images=True)),
+                             ('emoji as text, direct', replace(THEMES['dark'], direct_xml=True)),
+                             ('emoji pictures, direct', replace(THEMES['dark'], direct_xml=True, emoji_images=True))):
+            data = build('q3', theme)
+            pictures, media = picture_counts(data)
+            rows[label] = len(data), time_builds(theme, args.builds) * 1000
+            print(f'{label:24} {pictures:9d} {media:12d} {len(data) / 1024:9.1f} {rows[label][1]:9.1f}')
+        for backend in ('', ', direct'):
+            (z0, t0), (z1, t1) = rows['emoji as text' + backend], rows['emoji pictures' + backend]
+            print(f'emoji pictures{backend or ", python-pptx"}: .pptx {z1 / z0 - 1:+.0%}, build time {t1 / t0 - 1:+.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+LibreOffice export: PDF decks/min for pool sizes 1..N, and from the cache.
+
+    python bench_export.py -n 24 --max-workers 4
+    SOFFICE=/opt/libreoffice/program/soffice python bench_export.py --format png
+
+n decks are rendered and exported with pools of 1..--max-workers soffice
+processes, each pool started before the clock starts and given an empty
+cache, and decks/min is printed next to one `soffice --headless
+--convert-to` process per deck. Finally the batch is exported again through
+a fresh pool, served from the cache. Without LibreOffice (see
+export.find_soffice) the script says so and exits with status 1. (Cache
+keys, timeouts, crashes and failing decks are tested against a fake soffice
+in tests/test_export.py.)
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import deck_content
+import export
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+
+def save(spec, path):
+    zip_writer.save(render(deck_content.build(spec), THEMES['dark']), path)
+    return path
+
+
+def convert_each(soffice, paths, fmt, tmp):
+    """Seconds to convert *paths* with one `soffice --convert-to` process per deck."""
+    profile = 'file://' + os.path.join(tmp, 'profile')
+    start = time.perf_counter()
+    for path in paths:
+        subprocess.run([soffice, '--headless', '--convert-to', fmt, '--outdir', os.path.join(tmp, 'each'), path,
+                        f'-env:UserInstallation={profile}'], check=True, capture_output=True, timeout=300)
+    return time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=24, help='decks per run (default 24)')
+    ap.add_argument('--max-workers', type=int, default=min(os.cpu_count() or 1, 4),
+                    help='largest pool size (default: cores, at most 4)')
+    ap.add_argument('--format', choices=export.FORMATS, default='pdf')
+    ap.add_argument('--timeout', type=float, default=export.DEFAULT_TIMEOUT, help='seconds per deck')
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        soffice = export.find_soffice()
+        if soffice is None:
+            print('❌ LibreOffice not found (install it or set SOFFICE): decks/min not measured')
+            sys.exit(1)
+        print(f'soffice: {soffice}')
+        paths = [save({'name': f'Employee {i:03d}'}, os.path.join(tmp, f'deck{i:03d}.pptx')) for i in range(args.n)]
+        each = min(args.n, 4)
+        seconds = convert_each(soffice, paths[:each], args.format, tmp)
+        print(f'\n{"workers":>8} {"decks/min":>10} {"s/deck":>8} {"startup s":>10} {"timeouts":>9} {"restarts":>9}')
+        print(f'{"process":>8} {each / seconds * 60:10.1f} {seconds / each:8.2f}   (one soffice per deck, {each} decks)')
+
+        failed = False
+        for size in range(1, args.max_workers + 1):
+            cache = os.path.join(tmp, f'cache{size}')
+            with export.ExportPool(size, args.timeout, cache, soffice) as pool:
+                start = time.perf_counter()
+                pool.start()
+                startup = time.perf_counter() - start
+                start = time.perf_counter()
+                errors = [error for _, _, error, _ in pool.export_many(paths, os.path.join(tmp, 'out'),
+                                                                       (args.format,)) if error is not None]
+                wall = time.perf_counter() - start
+                stats = dict(pool.stats)
+            print(f'{size:8d} {args.n / wall * 60:10.1f} {wall / args.n * size:8.2f} {startup:10.2f} '
+                  f'{stats["timeouts"]:9d} {stats["restarts"]:9d}')
+            for error in errors:
+                print('❌', error)
+            failed = failed or bool(errors)
+
+        with export.ExportPool(args.max_workers, args.timeout, cache, soffice) as pool:
+            start = time.perf_counter()
+            for _ in pool.export_many(paths, os.path.join(tmp, 'out'), (args.format,)):
+                pass
+            wall = time.perf_counter() - start
+        print(f'{"cached":>8} {args.n / wall * 60:10.1f} {wall / args.n:8.3f}')
+        if failed:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""
+Time and peak memory of the streaming HTML-to-PPTX converter.
+
+    python bench_html_convert.py --slides 500
+
+Builds a synthetic HTML deck by repeating the <section class="slide"> blocks
+of q3_hr_ppt.html, then measures (1) parse + layout only and (2) the full
+conversion to .pptx, each with tracemalloc tracking peak Python allocations
+(lxml's C-level trees in the python-pptx Presentation are not counted).
+"""
+
+import argparse
+import os
+import re
+import tempfile
+import time
+import tracemalloc
+
+from html_convert import convert, iter_slides
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def synthetic_html(path, n_slides, source='q3_hr_ppt.html'):
+    with open(os.path.join(HERE, source), encoding='utf-8') as f:
+        html = f.read()
+    sections = re.findall(r'<section class="slide.*?</section>', html, re.S)
+    head = html[:html.index('<section')]
+    with open(path, 'w', encoding='utf-8') as out:
+        out.write(head)
+        for i in range(n_slides):
+            out.write(sections[i % len(sections)] + '\n')
+        out.write('</body>\n</html>\n')
+
+
+def measure(fn):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--slides', type=int, default=500)
+    ap.add_argument('--theme', default='dark')
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, 'synthetic.html')
+        synthetic_html(src, args.slides)
+        size = os.path.getsize(src)
+
+        def parse_only():
+            with open(src, encoding='utf-8') as f:
+                return sum(1 for _ in iter_slides(f))
+
+        n, t_parse, peak_parse = measure(parse_only)
+        _, t_full, peak_full = measure(lambda: convert(src, os.path.join(tmp, 'out.pptx'), args.theme))
+        out_size = os.path.getsize(os.path.join(tmp, 'out.pptx'))
+
+    mb = 1024 * 1024
+    print(f'input: {n} slides, {size / mb:.1f} MB HTML')
+    print(f'  parse + layout : {t_parse:6.2f}s  {n / t_parse:7.1f} slides/s  peak {peak_parse / mb:6.1f} MB')
+    print(f'  full convert   : {t_full:6.2f}s  {n / t_full:7.1f} slides/s  peak {peak_full / mb:6.1f} MB'
+          f'  -> {out_size / mb:.1f} MB pptx')
+
+
+if __name__ == '__main__':
+    main()
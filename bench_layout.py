@@ -0,0 +1,84 @@
+"""
+Layout-solver benchmark: batched NumPy grids vs. per-card Python loops.
+
+    python bench_layout.py -n 10000
+
+Lays out n variable-length card grids (1-12 cards, 3 columns, like the
+learnings slide) with the old `Inches(0.6) + col * Inches(4.1)` loop and with
+one layout.solve_grids() call, then checks every grid for overlapping cells
+with a pairwise Python loop and with layout.find_overlaps(). (That both give
+the same answers is tested in tests/test_layout.py.)
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+from pptx.util import Inches
+
+import layout
+
+CARD_W, CARD_H = Inches(3.8), Inches(2.1)
+
+
+def python_solve(counts):
+    cells = []
+    for n in counts:
+        for i in range(n):
+            row, col = i // 3, i % 3
+            cells.append((Inches(0.6) + col * Inches(4.1), Inches(1.8) + row * Inches(2.5)))
+    return cells
+
+
+def python_overlaps(cells, counts):
+    pairs, start = [], 0
+    for n in counts:
+        for a in range(start, start + n):
+            ax, ay = cells[a]
+            for b in range(a + 1, start + n):
+                bx, by = cells[b]
+                if ax < bx + CARD_W and bx < ax + CARD_W and ay < by + CARD_H and by < ay + CARD_H:
+                    pairs.append((a, b))
+        start += n
+    return pairs
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=10000, help='grids to lay out (default 10000)')
+    ap.add_argument('--pitch', type=float, default=4.1, help='column pitch in inches; < 3.8 forces overlaps')
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    counts = [rng.randint(1, 12) for _ in range(args.n)]
+    total = sum(counts)
+
+    start = time.perf_counter()
+    python_solve(counts)
+    t_py = time.perf_counter() - start
+
+    start = time.perf_counter()
+    xy, offsets = layout.solve_grids(counts, 3, Inches(0.6), Inches(1.8), Inches(args.pitch), Inches(2.5))
+    t_np = time.perf_counter() - start
+
+    boxes = np.empty((total, 4), dtype=np.int64)
+    boxes[:, :2] = xy
+    boxes[:, 2:] = CARD_W, CARD_H
+    groups = np.repeat(np.arange(args.n), counts)
+
+    start = time.perf_counter()
+    python_overlaps(xy.tolist(), counts)
+    t_py_ov = time.perf_counter() - start
+    start = time.perf_counter()
+    np_pairs = layout.find_overlaps(boxes, groups)
+    t_np_ov = time.perf_counter() - start
+
+    print(f'{args.n} grids, {total} cards')
+    print(f'  solve    python loop : {t_py * 1000:8.1f} ms   numpy batch : {t_np * 1000:7.1f} ms   {t_py / t_np:6.1f}x')
+    print(f'  overlaps python loop : {t_py_ov * 1000:8.1f} ms   numpy batch : {t_np_ov * 1000:7.1f} ms   '
+          f'{t_py_ov / t_np_ov:6.1f}x  ({len(np_pairs)} overlapping pairs)')
+
+
+if __name__ == '__main__':
+    main()
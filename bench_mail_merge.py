@@ -0,0 +1,95 @@
+"""
+Streaming mail merge: rows/sec and peak memory as the roster grows.
+
+    python bench_mail_merge.py --sizes 1000 3000 10000 -j 1
+
+For each size a synthetic CSV roster is written (every name different, the
+title-slide numbers varying per row, one row in --bad-every malformed) and
+merged in a fresh process, with the decks written to a temporary directory.
+Each run reports rows/sec and the merging process's peak RSS (and the
+workers' with -j > 1). Peak RSS must stay flat: the largest roster may not
+use more than --rss-slack MB above the smallest, or the run fails with exit
+status 1. (Row validation is tested in tests/test_mail_merge.py.)
+Caches and the allocator settle within the first thousand or so rows, so the
+smallest size should not be much below that.
+"""
+
+import argparse
+import csv
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def write_roster(path, n, bad_every):
+    """Write an *n*-row roster, every *bad_every*-th row with a cell too many."""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        w = csv.writer(f)
+        w.writerow(['name', 'stat_data.0.0', 'stat_data.1.0', 'stat_data.2.0', 'stat_data.2.1'])
+        for i in range(n):
+            row = [f'Employee {i:06d}', str(1 + i % 9), f'{2 + i % 5}+', f'{40 + i % 60}%', 'Time Saved']
+            if bad_every and i % bad_every == bad_every - 1:
+                row.append('stray cell')
+            w.writerow(row)
+
+
+def child(roster, out_dir, jobs, direct):
+    """Merge in this (fresh) process and print the stats plus peak RSS as JSON."""
+    from dataclasses import replace
+
+    import mail_merge
+    from theme import THEMES
+
+    theme = replace(THEMES['dark'], direct_xml=direct)
+    stats = mail_merge.merge(roster, out_dir, [theme], jobs)
+    stats['rss_mb'], stats['workers_rss_mb'] = mail_merge.peak_rss_mb() or (0, 0)
+    print(json.dumps(stats))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--sizes', type=int, nargs='+', default=[1000, 3000],
+                    help='roster rows per run (default 1000 3000)')
+    ap.add_argument('-j', '--jobs', type=int, default=1, help='worker processes (default 1)')
+    ap.add_argument('--bad-every', type=int, default=100, help='make every Nth row invalid (0 = none)')
+    ap.add_argument('--python-pptx', action='store_true', help='render through python-pptx, not direct XML')
+    ap.add_argument('--rss-slack', type=float, default=8, help='allowed peak RSS growth in MB (default 8)')
+    ap.add_argument('--child', nargs=2, metavar=('ROSTER', 'OUT'), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(*args.child, args.jobs, not args.python_pptx)
+
+    print(f'{"rows":>7} {"invalid":>8} {"rows/s":>8} {"peak RSS MB":>12} {"workers MB":>11}')
+    results = []
+    tmp = tempfile.mkdtemp()
+    try:
+        for n in sorted(args.sizes):
+            roster, out_dir = os.path.join(tmp, f'roster_{n}.csv'), os.path.join(tmp, 'out')
+            write_roster(roster, n, args.bad_every)
+            cmd = [sys.executable, os.path.abspath(__file__), '--child', roster, out_dir, '-j', str(args.jobs),
+                   '--bad-every', str(args.bad_every)] + (['--python-pptx'] if args.python_pptx else [])
+            stats = json.loads(subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=HERE).stdout)
+            shutil.rmtree(out_dir)
+            results.append((n, stats))
+            print(f'{n:7d} {stats["invalid"]:8d} {stats["rendered"] / stats["seconds"]:8.1f} '
+                  f'{stats["rss_mb"]:12.1f} {stats["workers_rss_mb"] if args.jobs > 1 else 0:11.1f}')
+    finally:
+        shutil.rmtree(tmp)
+
+    (n0, first), (n1, last) = results[0], results[-1]
+    growth = last['rss_mb'] - first['rss_mb']
+    if args.jobs > 1:
+        growth = max(growth, last['workers_rss_mb'] - first['workers_rss_mb'])
+    if growth > args.rss_slack:
+        print(f'❌ peak RSS grew {growth:.1f} MB from {n0} to {n1} rows (allowed {args.rss_slack:g} MB)')
+        sys.exit(1)
+    print(f'✅ peak RSS flat: {growth:+.1f} MB from {n0} to {n1} rows ({n1 / n0:.0f}x the rows)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""
+Deck merging: time, output size and peak memory for combining 11-slide decks into one.
+
+    python bench_merge.py --sizes 100 1000
+    python bench_merge.py --sizes 100 1000 --theme dark --theme white --slide-master
+
+n q3 decks (a different name on each, themes taken in turn) are rendered to
+a temporary directory once. For each size the first n are merged by
+deck_merge.merge_decks() in a fresh process, which reports the time, the
+merged file's size against the sources' total, the parts written against
+the parts in the sources, and its peak RSS. (Each merge gets its own process
+because Linux carries a parent's peak RSS over into the children it starts.)
+Peak RSS must stay flat: the largest merge may not use more than --rss-slack
+MB above the smallest, or the run fails with exit status 1. (That merged
+slides, masters and parts come through intact is tested in
+tests/test_deck_merge.py.)
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import replace
+
+import deck_merge
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def render_decks(out_dir, n, themes, slide_master=False):
+    """Write decks 0..n-1 to *out_dir*; returns their paths in merge order."""
+    import deck_content
+    import zip_writer
+    from renderer import render
+    from theme import THEMES
+
+    themes = [replace(THEMES[t], direct_xml=True, slide_master=slide_master) for t in themes]
+    paths = []
+    for i in range(n):
+        path = os.path.join(out_dir, f'deck{i:05d}.pptx')
+        zip_writer.save(render(deck_content.build({'name': f'Employee {i:05d}'}), themes[i % len(themes)]), path)
+        paths.append(path)
+    return paths
+
+
+def child(src_dir, n, out):
+    """Merge the first *n* decks of *src_dir* in this (fresh) process; print the stats plus peak RSS as JSON."""
+    import mail_merge
+    from deck_files import deck_paths
+
+    paths = list(deck_paths([src_dir]))[:n]
+    stats = deck_merge.merge_decks(paths, out)
+    stats['rss_mb'] = (mail_merge.peak_rss_mb() or (0, 0))[0]
+    stats['bytes_in'] = sum(os.path.getsize(path) for path in paths)
+    print(json.dumps(stats))
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--sizes', type=int, nargs='+', default=[100, 1000], help='decks per merge (default 100 1000)')
+    ap.add_argument('--theme', action='append', help='themes, taken in turn (default dark)')
+    ap.add_argument('--slide-master', action='store_true', help='generate each theme\'s slide master and layouts')
+    ap.add_argument('--rss-slack', type=float, default=16, help='allowed peak RSS growth in MB (default 16)')
+    ap.add_argument('--render', nargs=2, metavar=('DIR', 'N'), help=argparse.SUPPRESS)
+    ap.add_argument('--child', nargs=3, metavar=('SRC', 'N', 'OUT'), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    themes = args.theme or ['dark']
+    if args.render:
+        return render_decks(args.render[0], int(args.render[1]), themes, args.slide_master)
+    if args.child:
+        return child(args.child[0], int(args.child[1]), args.child[2])
+
+    sizes = sorted(args.sizes)
+    options = sum((['--theme', t] for t in themes), []) + (['--slide-master'] if args.slide_master else [])
+    tmp = tempfile.mkdtemp()
+    try:
+        src_dir = os.path.join(tmp, 'decks')
+        os.mkdir(src_dir)
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.abspath(__file__), '--render', src_dir, str(sizes[-1])] + options,
+                       check=True, cwd=HERE)
+        print(f'rendered {sizes[-1]} decks in {time.perf_counter() - start:.1f} s\n')
+        print(f'{"decks":>6} {"slides":>7} {"seconds":>8} {"decks/s":>8} {"in MB":>7} {"out MB":>7} '
+              f'{"parts in":>9} {"parts out":>10} {"shared":>7} {"peak RSS MB":>12}')
+        results = []
+        for n in sizes:
+            out = os.path.join(tmp, f'merged{n}.pptx')
+            cmd = [sys.executable, os.path.abspath(__file__), '--child', src_dir, str(n), out]
+            stats = json.loads(subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=HERE).stdout)
+            results.append((n, stats))
+            print(f'{n:6d} {stats["slides"]:7d} {stats["seconds"]:8.2f} {n / stats["seconds"]:8.0f} '
+                  f'{stats["bytes_in"] / (1 << 20):7.1f} {os.path.getsize(out) / (1 << 20):7.1f} '
+                  f'{stats["parts_in"]:9d} {stats["parts_out"]:10d} {stats["shared_parts"]:7d} '
+                  f'{stats["rss_mb"]:12.1f}')
+    finally:
+        shutil.rmtree(tmp)
+
+    (n0, first), (n1, last) = results[0], results[-1]
+    growth = last['rss_mb'] - first['rss_mb']
+    if growth > args.rss_slack:
+        print(f'❌ peak RSS grew {growth:.1f} MB from {n0} to {n1} decks (allowed {args.rss_slack:g} MB)')
+        sys.exit(1)
+    print(f'✅ peak RSS flat: {growth:+.1f} MB from {n0} to {n1} decks ({n1 / n0:.0f}x the decks)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+"""
+Direct OOXML writer: shapes/sec against the python-pptx path.
+
+    python bench_ooxml.py -n 200
+
+n slides of each primitive, and whole decks, are timed through python-pptx
+proxies and through ShapeWriter. (That both paths write byte-identical
+decks is tested in tests/test_ooxml.py.)
+"""
+
+import argparse
+import time
+from dataclasses import replace
+
+from pptx.util import Inches
+
+import deck_content
+from ooxml import ShapeWriter
+from renderer import add_multiline, add_rect, add_text, new_presentation, render
+from slide_cache import CACHE
+from theme import THEMES
+
+SHAPES_PER_SLIDE = 30
+
+
+def draw(kind, target, theme, i):
+    x, y = Inches(0.2) + (i % 6) * Inches(2.1), Inches(0.2) + (i // 6) * Inches(1.4)
+    if kind == 'rect':
+        add_rect(target, theme, x, y, Inches(2), Inches(1.3), 'card_bg', 'card_bd', 0.04)
+    elif kind == 'text':
+        add_text(target, theme, x, y, Inches(2), Inches(1.3), f'Shape {i} label', font_size=12, bold=True)
+    else:
+        add_multiline(target, theme, x, y, Inches(2), Inches(1.3), ['• one', '• two', '• three'], font_size=10)
+
+
+def time_shapes(kind, theme, n, direct):
+    prs = new_presentation()
+    slides = [prs.slides.add_slide(prs.slide_layouts[6]) for _ in range(n)]
+    start = time.perf_counter()
+    for s in slides:
+        target = ShapeWriter(s) if direct else s
+        for i in range(SHAPES_PER_SLIDE):
+            draw(kind, target, theme, i)
+        if direct:
+            target.flush()
+    return n * SHAPES_PER_SLIDE / (time.perf_counter() - start)
+
+
+def time_decks(theme, n):
+    slides = deck_content.build(None, 'q3')
+    start = time.perf_counter()
+    for _ in range(n):
+        render(slides, theme)
+    return (time.perf_counter() - start) / n
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=200, help='slides per primitive (default 200)')
+    ap.add_argument('--theme', choices=sorted(THEMES), default='dark')
+    args = ap.parse_args()
+    theme = THEMES[args.theme]
+
+    print(f'{"shapes/s":12} {"python-pptx":>12} {"direct xml":>12} {"speedup":>8}')
+    for kind in ('rect', 'text', 'multiline'):
+        slow, fast = time_shapes(kind, theme, args.n, False), time_shapes(kind, theme, args.n, True)
+        print(f'{kind:12} {slow:12.0f} {fast:12.0f} {fast / slow:7.2f}x')
+
+    n = max(args.n // 10, 5)
+    rows = [('uncached', replace(theme, direct_xml=False), False),
+            ('templates', replace(theme, direct_xml=False), True),
+            ('direct xml', replace(theme, direct_xml=True), True)]
+    print(f'\n{"full deck":12} {"ms/deck":>12}')
+    for name, t, cache in rows:
+        CACHE.enabled = cache
+        render(deck_content.build(None, 'q3'), t)  # warm up
+        print(f'{name:12} {time_decks(t, n) * 1000:12.2f}')
+    CACHE.enabled = True
+
+
+if __name__ == '__main__':
+    main()
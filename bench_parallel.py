@@ -0,0 +1,52 @@
+"""
+Wall-clock scaling of render_many() over a process pool, 1..all cores.
+
+    python bench_parallel.py -n 200 --theme dark
+
+Prints decks/sec, speedup and parallel efficiency per job count, followed by
+the per-worker breakdown (decks handled, busy seconds) of the widest run.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from deck_engine import THEMES, render_many, worker_report
+
+
+def job_counts(max_jobs):
+    counts, j = [], 1
+    while j < max_jobs:
+        counts.append(j)
+        j *= 2
+    return counts + [max_jobs]
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=200, help='decks per run (default 200)')
+    ap.add_argument('--theme', choices=sorted(THEMES), default='dark')
+    ap.add_argument('--max-jobs', type=int, default=os.cpu_count())
+    args = ap.parse_args()
+
+    specs = [{'name': f'Employee {i:04d}'} for i in range(args.n)]
+    base = None
+    print(f'{args.n} {args.theme} decks, {os.cpu_count()} cores')
+    print(f'{"jobs":>5} {"wall s":>8} {"decks/s":>8} {"speedup":>8} {"eff":>6}')
+    for jobs in job_counts(args.max_jobs):
+        timings = []
+        with tempfile.TemporaryDirectory() as out_dir:
+            start = time.perf_counter()
+            render_many(specs, out_dir, args.theme, jobs, timings)
+            wall = time.perf_counter() - start
+        base = base or wall
+        print(f'{jobs:5d} {wall:8.2f} {args.n / wall:8.1f} {base / wall:7.2f}x {base / wall / jobs:6.0%}')
+
+    print(f'\nper-worker, jobs={jobs}:')
+    for pid, (count, busy) in sorted(worker_report(timings).items()):
+        print(f'  {pid:>7}: {count:5d} decks  {busy:7.2f}s busy  {busy / count * 1000:6.1f} ms/deck')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+"""
+Load test for render_server.py: latency and throughput at increasing concurrency.
+
+    python bench_server.py -j 2 --concurrency 1 2 4 8 16 --duration 10
+    python bench_server.py --url http://127.0.0.1:8000    # an already running server
+
+Unless --url is given a server is started on a free port with the given
+--jobs/--queue. At each concurrency level that many clients, each on its own
+keep-alive connection, POST specs with distinct names back to back for
+--duration seconds (or cycle over --distinct specs, to measure a server
+running with --cache-dir). Reported per level: requests/s of successful renders,
+p50/p99 latency, and how many requests the server turned away (503).
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+
+async def post(reader, writer, host, path, body):
+    """One keep-alive POST; returns (status, response body length)."""
+    writer.write((f'POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n'
+                  f'Content-Length: {len(body)}\r\n\r\n').encode() + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        key, _, value = line.decode('latin-1').partition(':')
+        if key.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return status, length
+
+
+async def client(url, query, deadline, results, cid, distinct):
+    u = urlsplit(url)
+    reader, writer = await asyncio.open_connection(u.hostname, u.port)
+    i = 0
+    try:
+        while time.perf_counter() < deadline:
+            n = i * 1000 + cid
+            body = json.dumps({'name': f'Load {n % distinct if distinct else n}'}).encode()
+            start = time.perf_counter()
+            status, _ = await post(reader, writer, u.netloc, '/render' + query, body)
+            results.append((status, time.perf_counter() - start))
+            i += 1
+            if status == 503:
+                await asyncio.sleep(0.05)  # honour Retry-After loosely, without stalling the level
+    finally:
+        writer.close()
+
+
+async def run_level(url, query, concurrency, duration, distinct=0):
+    results = []
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(client(url, query, deadline, results, c, distinct) for c in range(concurrency)))
+    return results, time.perf_counter() - start
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(q * len(values)))] if values else float('nan')
+
+
+def start_server(jobs, queue, cache_dir=None):
+    cmd = [sys.executable, 'render_server.py', '--port', '0', '-j', str(jobs), '--queue', str(queue)]
+    if cache_dir:
+        cmd += ['--cache-dir', cache_dir]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    m = re.search(r'http://\S+', proc.stdout.readline())
+    if not m:
+        proc.kill()
+        sys.exit('render_server.py did not start')
+    return proc, m.group(0)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--url', help='server to test (default: start one)')
+    ap.add_argument('-j', '--jobs', type=int, default=1, help='workers of the started server (default 1)')
+    ap.add_argument('--queue', type=int, default=64, help='queue size of the started server (default 64)')
+    ap.add_argument('--concurrency', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    ap.add_argument('--duration', type=float, default=10, help='seconds per level (default 10)')
+    ap.add_argument('--cache-dir', help='give the started server a render cache in this directory')
+    ap.add_argument('--distinct', type=int, default=0,
+                    help='cycle over this many distinct specs (repeat requests hit the cache; default all unique)')
+    ap.add_argument('--query', default='', help="query string for /render, e.g. '?theme=white&level=1'")
+    args = ap.parse_args()
+
+    proc, url = (None, args.url) if args.url else start_server(args.jobs, args.queue, args.cache_dir)
+    try:
+        asyncio.run(run_level(url, args.query, 1, 1))  # warm the workers
+        print(f'{url}  ({args.duration:.0f}s per level)')
+        print(f'{"clients":>8} {"req/s":>8} {"p50 ms":>8} {"p99 ms":>8} {"ok":>7} {"503":>6} {"other":>6}')
+        for c in args.concurrency:
+            results, wall = asyncio.run(run_level(url, args.query, c, args.duration, args.distinct))
+            ok = [t for status, t in results if status == 200]
+            busy = sum(status == 503 for status, _ in results)
+            print(f'{c:8d} {len(ok) / wall:8.1f} {percentile(ok, 0.5) * 1000:8.1f} '
+                  f'{percentile(ok, 0.99) * 1000:8.1f} {len(ok):7d} {busy:6d} {len(results) - len(ok) - busy:6d}')
+    finally:
+        if proc is not None:
+            proc.terminate()
+            proc.wait()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""
+Per-slide build time with and without the component template cache.
+
+    python bench_slide_cache.py -n 200 --theme dark
+
+Each archetype slide (6-card grid, 5-step flow row, 4-item banner) is built
+n times on fresh slides, first through python-pptx shape by shape (cache
+disabled), then by cloning the cached XML. Whole-deck build time is reported
+the same way.
+"""
+
+import argparse
+import time
+
+from pptx.util import Inches
+
+from deck_content import defaults
+from deck_engine import build_deck
+from renderer import add_banner_item, add_card, add_flow_step, new_presentation
+from slide_cache import CACHE
+from theme import THEMES
+
+
+def card_grid(theme, s, spec):
+    for i, (em, t, d) in enumerate(spec['learnings']):
+        add_card(s, theme, Inches(0.6) + (i % 3) * Inches(4.1), Inches(1.8) + (i // 3) * Inches(2.5),
+                 Inches(3.8), Inches(2.1), em, t, d)
+
+
+def flow_row(theme, s, spec):
+    for i, (em, t, d) in enumerate(spec['flow2']):
+        add_flow_step(s, theme, Inches(0.6) + Inches(i * 2.3), Inches(2.0), em, t, d, show_arrow=(i < 4))
+
+
+def banner(theme, s, spec):
+    for i, (num, label) in enumerate(spec['metrics2']):
+        add_banner_item(s, theme, Inches(0.6) + i * Inches(3.15), Inches(2.3), Inches(2.9), num, label, 'banner_t')
+
+
+ARCHETYPES = {'card grid': card_grid, 'flow row': flow_row, 'banner': banner}
+
+
+def time_slides(theme, build, n):
+    prs = new_presentation()
+    blank = prs.slide_layouts[6]
+    slides = [prs.slides.add_slide(blank) for _ in range(n)]
+    start = time.perf_counter()
+    for s in slides:
+        build(theme, s, defaults())
+    return (time.perf_counter() - start) / n
+
+
+def time_decks(theme, n):
+    start = time.perf_counter()
+    for i in range(n):
+        build_deck({'name': f'Employee {i}'}, theme)
+    return (time.perf_counter() - start) / n
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=200, help='slides per archetype (default 200)')
+    ap.add_argument('--theme', choices=sorted(THEMES), default='dark')
+    args = ap.parse_args()
+    theme = THEMES[args.theme]
+
+    print(f'{"":12} {"uncached ms":>12} {"cached ms":>10} {"speedup":>8}')
+    rows = [(name, lambda n, b=build: time_slides(theme, b, n)) for name, build in ARCHETYPES.items()]
+    rows.append(('full deck', lambda n: time_decks(theme, max(n // 20, 3))))
+    for name, run in rows:
+        CACHE.enabled = False
+        cold = run(args.n)
+        CACHE.enabled = True
+        run(1)  # populate
+        warm = run(args.n)
+        print(f'{name:12} {cold * 1000:12.2f} {warm * 1000:10.2f} {cold / warm:7.2f}x')
+    print(f'\ncache: {CACHE.stats()}')
+
+
+if __name__ == '__main__':
+    main()
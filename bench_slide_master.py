@@ -0,0 +1,71 @@
+"""
+Generated slide master: deck size and build time against blank-layout slides.
+
+    python bench_slide_master.py -n 20
+
+The 11-slide deck is rendered with and without Theme.slide_master on both
+backends; slide XML, layout and master XML and the .pptx are measured and
+full builds (render plus save) are timed. (That every slide resolves to the
+same background, shapes and text formatting is tested in
+tests/test_slide_master.py.)
+"""
+
+import argparse
+import io
+import statistics
+import time
+import zipfile
+from dataclasses import replace
+
+import deck_content
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+
+def build(deck, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(deck_content.build(None, deck), theme), buf)
+    return buf.getvalue()
+
+
+def part_bytes(data, prefix):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        return sum(i.file_size for i in z.infolist() if i.filename.startswith(prefix))
+
+
+def time_builds(theme, n):
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        build('q3', theme)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=20, help='timed builds per variant (default 20)')
+    args = ap.parse_args()
+
+    print(f'q3 deck, dark theme (build = render + save, median of {args.n})')
+    print(f'{"variant":24} {"slide XML KB":>13} {"master+layouts KB":>18} {".pptx KB":>9} {"build ms":>9}')
+    rows = {}
+    for label, theme in (('blank layout', THEMES['dark']),
+                         ('slide master', replace(THEMES['dark'], slide_master=True)),
+                         ('blank layout, direct', replace(THEMES['dark'], direct_xml=True)),
+                         ('slide master, direct', replace(THEMES['dark'], direct_xml=True, slide_master=True))):
+        data = build('q3', theme)
+        build_ms = time_builds(theme, args.n) * 1000
+        rows[label] = (part_bytes(data, 'ppt/slides/slide'), part_bytes(data, 'ppt/slideLayouts/slideLayout')
+                       + part_bytes(data, 'ppt/slideMasters/slideMaster'), len(data), build_ms)
+        x, m, z, t = rows[label]
+        print(f'{label:24} {x / 1024:13.1f} {m / 1024:18.1f} {z / 1024:9.1f} {t:9.1f}')
+    for backend in ('', ', direct'):
+        (x0, m0, z0, t0), (x1, m1, z1, t1) = rows['blank layout' + backend], rows['slide master' + backend]
+        print(f'slide master{backend or ", python-pptx"}: slide XML {x1 / x0 - 1:+.0%}, '
+              f'master+layouts {m1 / m0 - 1:+.0%}, .pptx {z1 / z0 - 1:+.0%}, build time {t1 / t0 - 1:+.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+"""
+Streaming render: peak memory and time for one presentation as its slide count grows.
+
+    python bench_streaming.py --sizes 500 2000 5000
+    python bench_streaming.py --sizes 1000 10000 --budget 48 --no-compare
+
+Each size is a deck of n slides (the q3 deck's slides over and over, direct
+XML) written by streaming.write_streaming() in fresh processes: one is timed
+and reports its peak RSS, and one runs under tracemalloc and reports the
+traced peak. Unless --no-compare, render() plus zip_writer.save() writes the
+same deck in another fresh process for comparison. (Each run gets its own
+process because Linux carries a parent's peak RSS over into the children it
+starts.)
+
+The traced peak must stay under --budget MB at every size, and peak RSS may
+grow by no more than --rss-slack MB from the smallest size to the largest.
+tracemalloc does not see the memory libxml2 allocates for the XML trees, so
+the RSS check is the one that catches slides being kept; the traced peak
+covers the Python objects, including the manifest of part names and
+relationships write_streaming() keeps, which costs about 3 KB per slide, so
+the default budget holds to roughly 8000 slides. Otherwise the run fails
+with exit status 1. (That the streamed parts match render() + save() is
+tested in tests/test_streaming.py.)
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def child(mode, n, out, trace):
+    """Write an *n*-slide deck to *out* in this (fresh) process; print seconds and peak memory as JSON."""
+    import tracemalloc
+    from dataclasses import replace
+
+    import deck_content
+    import mail_merge
+    import zip_writer
+    from renderer import render
+    from streaming import write_streaming
+    from theme import THEMES
+
+    theme = replace(THEMES['dark'], direct_xml=True)
+    slides = itertools.islice(itertools.cycle(deck_content.build(None)), n)
+    if trace:
+        tracemalloc.start()
+    start = time.perf_counter()
+    if mode == 'stream':
+        write_streaming(slides, theme, out)
+    else:
+        zip_writer.save(render(slides, theme), out)
+    stats = {'seconds': time.perf_counter() - start, 'rss_mb': (mail_merge.peak_rss_mb() or (0, 0))[0]}
+    if trace:
+        stats['traced_mb'] = tracemalloc.get_traced_memory()[1] / (1 << 20)
+    print(json.dumps(stats))
+
+
+def run(mode, n, out, trace=False):
+    cmd = [sys.executable, os.path.abspath(__file__), '--child', mode, str(n), out] + (['--trace'] if trace else [])
+    return json.loads(subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=HERE).stdout)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('--sizes', type=int, nargs='+', default=[500, 2000, 5000], help='slides per deck')
+    ap.add_argument('--budget', type=float, default=24, help='allowed tracemalloc peak in MB (default 24)')
+    ap.add_argument('--rss-slack', type=float, default=48, help='allowed peak RSS growth in MB (default 48)')
+    ap.add_argument('--no-compare', action='store_true', help='skip timing render() + save()')
+    ap.add_argument('--child', nargs=3, metavar=('MODE', 'N', 'OUT'), help=argparse.SUPPRESS)
+    ap.add_argument('--trace', action='store_true', help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(args.child[0], int(args.child[1]), args.child[2], args.trace)
+
+    sizes = sorted(args.sizes)
+    tmp = tempfile.mkdtemp()
+    failed = False
+    try:
+        print(f'{"slides":>7} {"stream s":>9} {"RSS MB":>7} {"traced MB":>10} {"save s":>7} {"RSS MB":>7}')
+        results = []
+        for n in sizes:
+            stats = run('stream', n, os.path.join(tmp, f'stream{n}.pptx'))
+            stats['traced_mb'] = run('stream', n, os.devnull, trace=True)['traced_mb']
+            plain = None if args.no_compare else run('save', n, os.path.join(tmp, f'save{n}.pptx'))
+            results.append((n, stats))
+            print(f'{n:7d} {stats["seconds"]:9.2f} {stats["rss_mb"]:7.1f} {stats["traced_mb"]:10.1f}'
+                  + ('' if plain is None else f' {plain["seconds"]:7.2f} {plain["rss_mb"]:7.1f}'))
+    finally:
+        shutil.rmtree(tmp)
+
+    for n, stats in results:
+        if stats['traced_mb'] > args.budget:
+            print(f'❌ {n} slides: traced peak {stats["traced_mb"]:.1f} MB over the {args.budget:g} MB budget')
+            failed = True
+    (n0, first), (n1, last) = results[0], results[-1]
+    growth = last['rss_mb'] - first['rss_mb']
+    if growth > args.rss_slack:
+        print(f'❌ peak RSS grew {growth:.1f} MB from {n0} to {n1} slides (allowed {args.rss_slack:g} MB)')
+        failed = True
+    else:
+        print(f'✅ peak RSS flat: {growth:+.1f} MB from {n0} to {n1} slides ({n1 / n0:.0f}x the slides)')
+    if not failed:
+        print(f'✅ traced peak under {args.budget:g} MB at every size')
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,280 @@
+"""
+Benchmark suite for deck generation, with stored results and regression checks.
+
+    python bench_suite.py run -o base.json             # all but the slow benchmarks
+    python bench_suite.py run -o new.json --slow -k deck -k batch
+    python bench_suite.py compare base.json new.json --threshold 0.10
+    python bench_suite.py list
+
+Benchmarks (asv style: an untimed setup returns the function to time):
+
+    helper.<kind>[.direct]   one slide holding every op of that kind in the q3
+                             deck, through python-pptx or the direct XML writer,
+                             with the component template cache emptied first
+    helper.<kind>.cached     card, flow_step and banner_item again, with their
+                             templates already cached (cloned, not built)
+    deck.q3.dark             full 11-slide deck: plan, render and save to memory
+    deck.q3_compact.white    full 8-slide deck, likewise
+    batch.100, batch.1000    render_many() of that many decks to a temp directory
+                             (batch.1000 only with --slow)
+    save.zip_writer          saving a rendered deck, streaming zip writer
+    save.prs_save            saving a rendered deck, Presentation.save()
+
+Content is synthetic and offline: each spec rotates the list variables of the
+bundled deck data by its index, so every deck differs but stays valid. Plans
+are compiled without the disk cache. Each benchmark runs once untimed (warm
+imports and caches), then --repeat times, each after a fresh untimed setup;
+results keep min, median, mean and stdev in seconds plus the machine and
+package versions. compare flags benchmarks whose median grew by more than
+--threshold and exits 1 if any did.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import re
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import replace
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# name -> (setup, items per run, repeats or None for --repeat, slow)
+BENCHMARKS = {}
+
+
+def benchmark(name, items=1, repeat=None, slow=False):
+    def register(setup):
+        BENCHMARKS[name] = (setup, items, repeat, slow)
+        return setup
+    return register
+
+
+# ── Synthetic content ──
+
+def synthetic_spec(i, deck='q3'):
+    """Per-person spec number *i*: the deck's list variables rotated by i, and a distinct name."""
+    import deck_content
+
+    spec = {'name': f'Employee {i:05d}'}
+    for key, value in deck_content.defaults(deck).items():
+        if isinstance(value, list) and value:
+            r = i % len(value)
+            spec[key] = value[r:] + value[:r]
+    return spec
+
+
+def _build(i, deck):
+    import deck_content
+
+    return deck_content.build(synthetic_spec(i, deck), deck, cache_dir=None)
+
+
+class _Counter:
+    n = 0
+
+    @classmethod
+    def next(cls):
+        cls.n += 1
+        return cls.n
+
+
+# ── Benchmarks ──
+
+def _helper_setup(kind, direct, cached=False):
+    def setup():
+        from renderer import SlideModel, new_presentation, render_slide
+        from slide_cache import CACHE
+        from theme import DARK
+
+        model = SlideModel()
+        model.ops = [op for slide in _build(0, 'q3') for op in slide.ops if op[0] == kind]
+        theme = replace(DARK, direct_xml=direct)
+        prs = new_presentation()
+        prs.slide_layouts[6]
+        if cached:
+            render_slide(new_presentation(), model, theme)
+        else:
+            CACHE.clear()
+        return lambda: render_slide(prs, model, theme)
+    return setup
+
+
+for _kind in ('rect', 'text', 'multiline', 'card', 'flow_step', 'banner_item'):
+    benchmark(f'helper.{_kind}')(_helper_setup(_kind, False))
+    benchmark(f'helper.{_kind}.direct')(_helper_setup(_kind, True))
+for _kind in ('card', 'flow_step', 'banner_item'):
+    benchmark(f'helper.{_kind}.cached')(_helper_setup(_kind, False, cached=True))
+
+
+def _deck_setup(deck, theme_name):
+    def setup():
+        from renderer import render
+        from theme import get_theme
+        from zip_writer import save
+
+        theme = get_theme(theme_name)
+        i = _Counter.next()
+        return lambda: save(render(_build(i, deck), theme), io.BytesIO())
+    return setup
+
+
+benchmark('deck.q3.dark')(_deck_setup('q3', 'dark'))
+benchmark('deck.q3_compact.white')(_deck_setup('q3_compact', 'white'))
+
+
+def _batch_setup(n):
+    def setup():
+        from deck_engine import render_many
+
+        specs = [synthetic_spec(i) for i in range(n)]
+        out_dir = tempfile.mkdtemp(prefix='bench_suite_')
+
+        def run():
+            try:
+                render_many(specs, out_dir, 'dark')
+            finally:
+                shutil.rmtree(out_dir, ignore_errors=True)
+        return run
+    return setup
+
+
+benchmark('batch.100', items=100, repeat=1)(_batch_setup(100))
+benchmark('batch.1000', items=1000, repeat=1, slow=True)(_batch_setup(1000))
+
+
+def _save_setup(use_prs_save):
+    def setup():
+        from renderer import render
+        from theme import DARK
+        from zip_writer import save
+
+        prs = render(_build(_Counter.next(), 'q3'), DARK)
+        if use_prs_save:
+            return lambda: prs.save(io.BytesIO())
+        return lambda: save(prs, io.BytesIO())
+    return setup
+
+
+benchmark('save.zip_writer')(_save_setup(False))
+benchmark('save.prs_save')(_save_setup(True))
+
+
+# ── Running ──
+
+def _selected(patterns, slow):
+    return [name for name, (_, _, _, is_slow) in BENCHMARKS.items()
+            if (slow or not is_slow) and (not patterns or any(re.search(p, name) for p in patterns))]
+
+
+def time_benchmark(name, repeat):
+    setup, items, fixed, _ = BENCHMARKS[name]
+    repeat = fixed or repeat
+    if not fixed:
+        setup()()  # warm-up
+    times = []
+    for _ in range(repeat):
+        run = setup()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    return {'min': min(times), 'median': statistics.median(times), 'mean': statistics.fmean(times),
+            'stdev': statistics.stdev(times) if len(times) > 1 else 0.0, 'repeat': repeat, 'items': items}
+
+
+def _machine():
+    import lxml.etree
+    import pptx
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'commit': commit, 'date': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+            'platform': platform.platform(), 'cpus': os.cpu_count(), 'python-pptx': pptx.__version__,
+            'lxml': '.'.join(map(str, lxml.etree.LXML_VERSION))}
+
+
+def run(patterns, slow, repeat, output):
+    names = _selected(patterns, slow)
+    if not names:
+        sys.exit('no benchmark matches')
+    results = {}
+    print(f'{"benchmark":26} {"median ms":>10} {"min ms":>9} {"stdev":>7} {"per item ms":>12}')
+    for name in names:
+        r = results[name] = time_benchmark(name, repeat)
+        print(f'{name:26} {r["median"] * 1000:10.2f} {r["min"] * 1000:9.2f} {r["stdev"] * 1000:7.2f} '
+              f'{r["median"] / r["items"] * 1000:12.2f}', flush=True)
+    data = {'machine': _machine(), 'results': results}
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+        print(f'✅ {len(results)} results -> {output}')
+    return data
+
+
+def compare(old, new, threshold, metric='median'):
+    """Print old vs new per benchmark; returns the names that regressed by more than *threshold*."""
+    a, b = old['results'], new['results']
+    regressions = []
+    print(f'{"benchmark":26} {"old ms":>10} {"new ms":>10} {"ratio":>7}')
+    for name in sorted(set(a) | set(b)):
+        if name not in a or name not in b:
+            print(f'{name:26} {"only in " + ("new" if name in b else "old"):>29}')
+            continue
+        before, after = a[name][metric], b[name][metric]
+        ratio = after / before
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '  ❌ slower'
+            regressions.append(name)
+        elif ratio < 1 / (1 + threshold):
+            flag = '  ✅ faster'
+        print(f'{name:26} {before * 1000:10.2f} {after * 1000:10.2f} {ratio:7.2f}{flag}')
+    return regressions
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = ap.add_subparsers(dest='command', required=True)
+    r = sub.add_parser('run', help='run benchmarks and store the results')
+    r.add_argument('-o', '--output', help='write results here as JSON')
+    r.add_argument('-k', dest='patterns', action='append', help='only benchmarks matching this regex (repeatable)')
+    r.add_argument('--repeat', type=int, default=5, help='timed runs per benchmark (default 5; batches run once)')
+    r.add_argument('--slow', action='store_true', help='include slow benchmarks (batch.1000)')
+    c = sub.add_parser('compare', help='flag regressions between two result files')
+    c.add_argument('old')
+    c.add_argument('new')
+    c.add_argument('--threshold', type=float, default=0.10, help='allowed slowdown as a fraction (default 0.10)')
+    c.add_argument('--metric', choices=('median', 'min', 'mean'), default='median')
+    sub.add_parser('list', help='list benchmarks')
+    args = ap.parse_args(argv)
+
+    sys.path.insert(0, HERE)
+    if args.command == 'list':
+        for name, (_, items, _, slow) in BENCHMARKS.items():
+            print(f'{name:26} {items:5d} item(s){"  (slow)" if slow else ""}')
+    elif args.command == 'run':
+        run(args.patterns, args.slow, args.repeat, args.output)
+    else:
+        with open(args.old, encoding='utf-8') as f:
+            old = json.load(f)
+        with open(args.new, encoding='utf-8') as f:
+            new = json.load(f)
+        regressions = compare(old, new, args.threshold, args.metric)
+        if regressions:
+            print(f'❌ {len(regressions)} regression(s) above {args.threshold:.0%}: {", ".join(regressions)}')
+            return 1
+        print(f'✅ no regressions above {args.threshold:.0%}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Text-fit benchmark: fit every text box of a large batch of decks.
+
+    python bench_text_fit.py -n 2000 --theme dark
+
+Each synthetic deck gets its own name and card descriptions, so the memo
+tables see a realistic mix of repeated and unique strings. The fitting time
+is compared with rendering the same decks, and with python-pptx's own
+TextFrame.fit_text() (which rasterizes through Pillow) on a sample of boxes.
+"""
+
+import argparse
+import time
+from dataclasses import replace
+
+import deck_content
+import text_fit
+from renderer import fit_op, new_presentation, render
+from theme import THEMES
+
+DECK = {'dark': 'q3', 'white': 'q3_compact'}
+
+
+def synthetic_specs(n, deck):
+    learnings = deck_content.defaults(deck)['learnings']
+    return [{'name': f'Employee {i:04d} ' + 'X' * (i % 40),
+             'learnings': [[em, t, d + ' ' + 'extra words ' * (i % 7)] for em, t, d in learnings]}
+            for i in range(n)]
+
+
+def fit_batch(models, theme):
+    boxes = 0
+    for slides in models:
+        for model in slides:
+            for kind, args, kwargs in model.ops:
+                fit_op(kind, args, kwargs, theme)
+                boxes += 1
+    return boxes
+
+
+def bench_pptx_fit_text(sample, theme):
+    """python-pptx fit_text() on the first *sample* plain text ops of one deck."""
+    font_file = text_fit.find_font(theme.font)
+    prs = new_presentation()
+    slide = prs.slides.add_slide(prs.slide_layouts[6])
+    ops = [op for model in deck_content.build(None, DECK[theme.name])
+           for op in model.ops if op[0] == 'text'][:sample]
+    start = time.perf_counter()
+    for _, (left, top, w, h, text), kwargs in ops:
+        box = slide.shapes.add_textbox(left, top, w, h)
+        box.text_frame.text = text
+        try:
+            box.text_frame.fit_text(font_file=font_file, max_size=kwargs.get('font_size', 18))
+        except Exception:
+            pass  # fit_text raises when nothing fits; it still did the work
+    return len(ops), time.perf_counter() - start
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=2000, help='decks in the batch (default 2000)')
+    ap.add_argument('--theme', choices=sorted(DECK), default='dark')
+    ap.add_argument('--render', type=int, default=10, help='decks rendered to estimate render cost (default 10)')
+    args = ap.parse_args()
+    theme = replace(THEMES[args.theme], fit_text=True)
+    deck = DECK[args.theme]
+
+    start = time.perf_counter()
+    text_fit.glyph_widths(theme.font, False)
+    text_fit.glyph_widths(theme.font, True)
+    t_load = time.perf_counter() - start
+    print(f'font tables   : {t_load * 1000:7.1f} ms  ({text_fit.find_font(theme.font) or "average widths"})')
+
+    models = [deck_content.build(spec, deck, cache_dir=None) for spec in synthetic_specs(args.n, deck)]
+
+    start = time.perf_counter()
+    boxes = fit_batch(models, theme)
+    t_cold = time.perf_counter() - start
+    start = time.perf_counter()
+    fit_batch(models, theme)
+    t_warm = time.perf_counter() - start
+    print(f'fit {boxes} boxes ({args.n} decks)')
+    print(f'  first pass  : {t_cold:7.3f}s  {boxes / t_cold:10.0f} boxes/s  {t_cold / args.n * 1000:6.2f} ms/deck')
+    print(f'  memoized    : {t_warm:7.3f}s  {boxes / t_warm:10.0f} boxes/s  {t_warm / args.n * 1000:6.2f} ms/deck')
+    for name, info in text_fit.cache_info().items():
+        print(f'  {name:11s} : {info.hits:8d} hits {info.misses:8d} misses')
+
+    start = time.perf_counter()
+    for slides in models[:args.render]:
+        render(slides, THEMES[args.theme])
+    t_render = (time.perf_counter() - start) / args.render
+    print(f'render        : {t_render * 1000:7.1f} ms/deck  (fitting = {t_cold / args.n / t_render:.1%} of it)')
+
+    n, t_pptx = bench_pptx_fit_text(20, theme)
+    if n:
+        print(f'python-pptx fit_text(): {t_pptx / n * 1000:7.2f} ms/box vs {t_cold / boxes * 1000:.4f} ms/box')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+"""
+Shared text styles: slide XML size and build time against per-paragraph formatting.
+
+    python bench_text_styles.py -n 20
+
+The 11-slide deck is rendered with and without Theme.text_styles on both
+backends; the slide XML and the .pptx are measured and full builds (render
+plus save) are timed. (That every paragraph keeps its effective formatting
+is tested in tests/test_text_styles.py.)
+"""
+
+import argparse
+import io
+import statistics
+import time
+import zipfile
+from dataclasses import replace
+
+import deck_content
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+
+def build(deck, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(deck_content.build(None, deck), theme), buf)
+    return buf.getvalue()
+
+
+def slide_xml_bytes(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        return sum(i.file_size for i in z.infolist() if i.filename.startswith('ppt/slides/slide'))
+
+
+def time_builds(theme, n):
+    times = []
+    for _ in range(n):
+        start = time.perf_counter()
+        build('q3', theme)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=20, help='timed builds per variant (default 20)')
+    args = ap.parse_args()
+
+    print(f'q3 deck, dark theme (build = render + save, median of {args.n})')
+    print(f'{"variant":26} {"slide XML KB":>13} {".pptx KB":>9} {"build ms":>9}')
+    rows = {}
+    for label, theme in (('per-paragraph', THEMES['dark']),
+                         ('shared styles', replace(THEMES['dark'], text_styles=True)),
+                         ('per-paragraph, direct', replace(THEMES['dark'], direct_xml=True)),
+                         ('shared styles, direct', replace(THEMES['dark'], direct_xml=True, text_styles=True))):
+        data = build('q3', theme)
+        build_ms = time_builds(theme, args.n) * 1000
+        rows[label] = slide_xml_bytes(data), len(data), build_ms
+        print(f'{label:26} {rows[label][0] / 1024:13.1f} {len(data) / 1024:9.1f} {build_ms:9.1f}')
+    for backend in ('', ', direct'):
+        (x0, z0, t0), (x1, z1, t1) = rows['per-paragraph' + backend], rows['shared styles' + backend]
+        print(f'shared styles{backend or ", python-pptx"}: slide XML {x1 / x0 - 1:+.0%}, '
+              f'.pptx {z1 / z0 - 1:+.0%}, build time {t1 / t0 - 1:+.0%}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,84 @@
+"""
+Save benchmark: python-pptx's Presentation.save() vs. the streaming zip writer.
+
+    python bench_zip.py -n 2000
+
+Each mode runs in its own subprocess so peak RSS is per mode: n decks with
+distinct names are rendered (direct XML, untimed) and saved one by one into a
+temporary directory, and only the save is timed. Reported per mode: decks/s,
+MB/s of package content saved (uncompressed part bytes), MB written, and the
+process's peak RSS.
+"""
+
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from dataclasses import replace
+
+import deck_content
+import zip_writer
+from renderer import render
+from theme import DARK
+
+MODES = {'prs.save': None, 'level 6': 6, 'level 1': 1, 'store': 0}
+
+
+def run_mode(mode, n):
+    theme = replace(DARK, direct_xml=True)
+    level = MODES[mode]
+    out_dir = tempfile.mkdtemp(prefix='bench_zip_')
+    try:
+        spent = 0.0
+        for i in range(n):
+            prs = render(deck_content.build({'name': f'Employee {i:05d}'}, 'q3'), theme)
+            path = os.path.join(out_dir, f'{i:05d}.pptx')
+            start = time.perf_counter()
+            if level is None:
+                prs.save(path)
+            else:
+                zip_writer.save(prs, path, level)
+            spent += time.perf_counter() - start
+        written = content = 0
+        for name in os.listdir(out_dir):
+            path = os.path.join(out_dir, name)
+            written += os.path.getsize(path)
+            with zipfile.ZipFile(path) as z:
+                content += sum(info.file_size for info in z.infolist())
+    finally:
+        shutil.rmtree(out_dir)
+    return {'mode': mode, 'seconds': spent, 'written': written, 'content': content,
+            'rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            'cache': zip_writer.CACHE.stats()}
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    ap.add_argument('-n', type=int, default=2000, help='decks per mode (default 2000)')
+    ap.add_argument('--mode', choices=sorted(MODES), action='append', help='modes to run (default all)')
+    ap.add_argument('--child', choices=sorted(MODES), help=argparse.SUPPRESS)
+    args = ap.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.child, args.n)))
+        return
+
+    print(f'{args.n} decks per mode')
+    print(f'{"mode":10} {"save s":>8} {"decks/s":>9} {"MB/s":>8} {"written MB":>11} {"peak RSS MB":>12}')
+    for mode in args.mode or MODES:
+        out = subprocess.run([sys.executable, __file__, '--child', mode, '-n', str(args.n)],
+                             check=True, capture_output=True, text=True).stdout
+        r = json.loads(out.splitlines()[-1])
+        print(f'{mode:10} {r["seconds"]:8.2f} {args.n / r["seconds"]:9.0f} '
+              f'{r["content"] / r["seconds"] / 1e6:8.1f} {r["written"] / 1e6:11.1f} {r["rss_mb"]:12.1f}')
+    print(f'\nboilerplate cache (last mode): {r["cache"]}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+"""
+Native PowerPoint charts fed from raw build logs.
+
+The results slide can show real (editable) charts instead of static banner
+numbers. A chart component names a build log and what to plot from it:
+
+    {"type": "chart", "at": [0.6, 2.3, 5.9, 1.5], "chart": "bar", "source": "$build_data",
+     "metric": "p50_minutes", "title": "Median build time (min)"}
+
+A build log has one row per build with the columns team, day, seconds and
+failed, and may run to millions of rows. It is read from .npz (one array per
+column; team may be integer codes into a 'teams' array of names), .npy (a
+structured array) or .csv (a header row, ISO dates). dataset() aggregates it
+with vectorized group-bys (np.bincount over team and day-bucket codes, one
+sort for all percentiles) and downsamples it to what a slide can show: at
+most MAX_BARS bars, the smaller teams merged into "Other", and MAX_POINTS
+points per line, consecutive days merged into equal buckets. Aggregates are
+kept in memory and in CACHE_DIR under the file's identity (path, size and
+mtime), so a batch reads each file once.
+
+    ds = charts.dataset('builds.npz', 'bar', 'p50_minutes')
+    rId = charts.relate(slide.part, ds, 'bar', theme, 'Median build time (min)')
+
+A dataset's chart XML and backing workbook are built once per process for
+each (dataset hash, chart, theme), and each is embedded once per deck: every
+chart of a deck that shows the same data refers to the same chart part.
+python-pptx writes the workbook with XlsxWriter (pip install xlsxwriter).
+"""
+
+import datetime
+import hashlib
+import json
+import os
+from collections import OrderedDict, namedtuple
+
+CACHE_DIR = '.chart_cache'
+DATA_VERSION = 1
+
+CHARTS = ('bar', 'line')
+COLUMNS = ('team', 'day', 'seconds', 'failed')
+# metric -> (series name, number format)
+METRICS = {
+    'builds': ('Builds', '#,##0'),
+    'failure_rate': ('Failure rate (%)', '0.0'),
+    'mean_minutes': ('Mean build time (min)', '0.0'),
+    'p50_minutes': ('Median build time (min)', '0.0'),
+    'p90_minutes': ('p90 build time (min)', '0.0'),
+}
+MAX_BARS = 8      # bars per bar chart, the last one "Other" when there are more teams
+MAX_POINTS = 24   # points per line (about one per four days of a quarter)
+MAX_SERIES = 4    # lines per line chart, the last one "Other" when there are more teams
+SERIES_COLORS = ('purple', 'teal', 'gold', 'pink', 'blue', 'green')
+CSV_CHUNK = 1 << 20
+MEMORY_ENTRIES = 64
+
+# The categories, then one (name, values) per series; a value is None where a group had no builds
+Dataset = namedtuple('Dataset', 'categories series number_format')
+
+# in-process counters; bench_charts.py reports them
+stats = {'loaded': 0, 'aggregated': 0, 'memory_hits': 0, 'disk_hits': 0, 'built': 0, 'embedded': 0, 'shared': 0}
+_raw = {}                  # file identity -> columns of the last build log read
+_datasets = OrderedDict()  # aggregate key -> Dataset
+_blobs = OrderedDict()     # chart key -> (chart XML, workbook)
+
+
+class ChartError(ValueError):
+    """A build log cannot be read, or a chart asks for an unknown chart type or metric."""
+
+
+# ── Loading ──
+
+def _read_csv(path):
+    """Columns of a CSV build log, read CSV_CHUNK rows at a time with team names coded as they appear."""
+    import itertools
+
+    import numpy as np
+
+    names, chunks = {}, []
+    with open(path, encoding='utf-8-sig') as f:
+        header = [h.strip() for h in f.readline().split(',')]
+        try:
+            usecols = [header.index(c) for c in COLUMNS]
+        except ValueError:
+            raise ChartError(f'{path}: the header row must name the columns {", ".join(COLUMNS)}') from None
+        dtype = [('team', 'U64'), ('day', 'M8[D]'), ('seconds', 'f8'), ('failed', 'f8')]
+        while True:
+            lines = list(itertools.islice(f, CSV_CHUNK))
+            if not lines:
+                break
+            try:
+                rows = np.loadtxt(lines, delimiter=',', usecols=usecols, dtype=dtype, ndmin=1)
+            except ValueError as e:
+                raise ChartError(f'{path}: {e}') from None
+            teams, codes = np.unique(rows['team'], return_inverse=True)
+            lut = np.array([names.setdefault(t, len(names)) for t in teams.tolist()], dtype=np.int64)
+            chunks.append((lut[codes.ravel()], rows['day'], rows['seconds'], rows['failed']))
+    if not chunks:
+        return {'teams': np.array([], dtype=str), 'team': np.zeros(0, np.int64), 'day': np.zeros(0, 'M8[D]'),
+                'seconds': np.zeros(0), 'failed': np.zeros(0)}
+    columns = {c: np.concatenate(arrays) for c, arrays in zip(COLUMNS, zip(*chunks))}
+    columns['teams'] = np.array(list(names))
+    return columns
+
+
+def load_builds(path):
+    """Columns of the build log at *path*: 'team' codes into 'teams' names, 'day' (days since
+    1970-01-01), 'seconds' and 'failed', one entry per build."""
+    import numpy as np
+
+    ext = os.path.splitext(path)[1].lower()
+    try:
+        if ext == '.npz':
+            with np.load(path, allow_pickle=False) as z:
+                columns = {name: z[name] for name in z.files}
+        elif ext == '.npy':
+            rows = np.load(path, allow_pickle=False)
+            columns = {name: rows[name] for name in rows.dtype.names or ()}
+        elif ext == '.csv':
+            columns = _read_csv(path)
+        else:
+            raise ChartError(f'{path}: unsupported build log format {ext!r}, expected .npz, .npy or .csv')
+    except OSError as e:
+        raise ChartError(f'{path}: cannot read build log ({e.strerror or e})') from None
+    missing = [c for c in COLUMNS if c not in columns]
+    if missing:
+        raise ChartError(f'{path}: missing column(s) {", ".join(missing)}')
+    if len({len(columns[c]) for c in COLUMNS}) != 1:
+        raise ChartError(f'{path}: columns {", ".join(COLUMNS)} differ in length')
+
+    team = columns['team']
+    if 'teams' in columns:
+        names = [str(t) for t in columns['teams'].tolist()]
+        team = team.astype(np.int64, copy=False)
+        if len(team) and (team.min() < 0 or team.max() >= len(names)):
+            raise ChartError(f'{path}: team codes out of range for {len(names)} team names')
+    else:
+        teams, team = np.unique(team, return_inverse=True)
+        names = [str(t) for t in teams.tolist()]
+    day = columns['day']
+    if day.dtype.kind == 'M':
+        day = day.astype('M8[D]')
+    return {'teams': names, 'team': team.ravel(), 'day': day.astype(np.int64),
+            'seconds': columns['seconds'].astype(float), 'failed': columns['failed'].astype(bool)}
+
+
+def _identity(path):
+    try:
+        st = os.stat(path)
+    except OSError as e:
+        raise ChartError(f'{path}: cannot read build log ({e.strerror})') from None
+    return f'{os.path.abspath(path)}:{st.st_size}:{st.st_mtime_ns}'
+
+
+def _builds(path, identity):
+    """load_builds(), remembering the last file read (a deck's charts usually share one)."""
+    if identity not in _raw:
+        _raw.clear()
+        _raw[identity] = load_builds(path)
+        stats['loaded'] += 1
+    return _raw[identity]
+
+
+# ── Aggregating ──
+
+def group_stat(group, n, seconds, failed, metric):
+    """*metric* for each group id 0..n-1 of the rows (NaN for a group without rows), from one bincount,
+    or for percentiles one sort of the rows by (group, seconds)."""
+    import numpy as np
+
+    count = np.bincount(group, minlength=n)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        if metric == 'builds':
+            return count.astype(float)
+        if metric == 'failure_rate':
+            return np.bincount(group, failed, n) * 100 / count
+        if metric == 'mean_minutes':
+            return np.bincount(group, seconds, n) / count / 60
+    q = {'p50_minutes': 0.5, 'p90_minutes': 0.9}[metric]
+    out = np.full(n, np.nan)
+    if not len(seconds):
+        return out
+    low = seconds.min()
+    span = seconds.max() - low + 1
+    ordered = np.sort(group * span + (seconds - low))  # by group, then by seconds within it
+    has = count > 0
+    rank = (np.cumsum(count) - count + np.floor(q * (count - 1)).astype(np.int64))[has]
+    out[has] = (ordered[rank] - np.flatnonzero(has) * span + low) / 60
+    return out
+
+
+def _top_teams(builds, limit):
+    """(group id per build, group names): the teams by build count, the smallest merged into one
+    "Other" group when there are more than *limit*."""
+    import numpy as np
+
+    count = np.bincount(builds['team'], minlength=len(builds['teams']))
+    order = np.argsort(-count, kind='stable')
+    order = order[count[order] > 0]
+    kept = order if len(order) <= limit else order[:limit - 1]
+    lut = np.full(len(count), len(kept), dtype=np.int64)
+    lut[kept] = np.arange(len(kept))
+    names = [builds['teams'][i] for i in kept.tolist()] + (['Other'] if len(kept) < len(order) else [])
+    return lut[builds['team']], names
+
+
+def _values(array):
+    return tuple(None if v != v else round(v, 2) for v in array.tolist())
+
+
+def _day_label(day):
+    d = datetime.date(1970, 1, 1) + datetime.timedelta(days=day)
+    return f'{d:%b} {d.day}'
+
+
+def aggregate(builds, chart='bar', metric='builds'):
+    """Dataset of *metric* from build log columns: per team for 'bar', per team over time for 'line'."""
+    import numpy as np
+
+    name, number_format = METRICS[metric]
+    seconds, failed = builds['seconds'], builds['failed']
+    if chart == 'bar':
+        group, teams = _top_teams(builds, MAX_BARS)
+        values = group_stat(group, len(teams), seconds, failed, metric)
+        return Dataset(tuple(teams), ((name, _values(values)),), number_format)
+    group, teams = _top_teams(builds, MAX_SERIES)
+    day = builds['day']
+    if not len(day):
+        return Dataset((), tuple((team, ()) for team in teams), number_format)
+    first = int(day.min())
+    days = int(day.max()) - first + 1
+    width = -(-days // MAX_POINTS)
+    buckets = -(-days // width)
+    values = group_stat(group * buckets + (day - first) // width, len(teams) * buckets, seconds, failed, metric)
+    values = values.reshape(len(teams), buckets)
+    categories = tuple(_day_label(first + i * width) for i in range(buckets))
+    return Dataset(categories, tuple((team, _values(row)) for team, row in zip(teams, values)), number_format)
+
+
+def _remember(cache, key, value):
+    cache[key] = value
+    if len(cache) > MEMORY_ENTRIES:
+        cache.popitem(last=False)
+    return value
+
+
+def dataset(source, chart='bar', metric='builds'):
+    """Dataset of *metric* for a *chart* ('bar' or 'line') of the build log at *source*.
+
+    Looked up in memory, then in CACHE_DIR by a hash of the file's identity
+    and the chart, and aggregated from the file only when both miss.
+    """
+    if chart not in CHARTS:
+        raise ChartError(f'unknown chart {chart!r}, expected one of {CHARTS}')
+    if metric not in METRICS:
+        raise ChartError(f'unknown metric {metric!r}, expected one of {tuple(METRICS)}')
+    identity = _identity(source)
+    key = hashlib.sha256(f'{DATA_VERSION}\0{identity}\0{chart}\0{metric}\0{MAX_BARS}\0{MAX_POINTS}\0'
+                         f'{MAX_SERIES}'.encode('utf-8')).hexdigest()
+    ds = _datasets.get(key)
+    if ds is not None:
+        stats['memory_hits'] += 1
+        _datasets.move_to_end(key)
+        return ds
+    path = os.path.join(CACHE_DIR, key[:2], key + '.json')
+    try:
+        with open(path, encoding='utf-8') as f:
+            categories, series, number_format = json.load(f)
+        ds = Dataset(tuple(categories), tuple((name, tuple(values)) for name, values in series), number_format)
+        stats['disk_hits'] += 1
+    except (OSError, ValueError):
+        ds = aggregate(_builds(source, identity), chart, metric)
+        stats['aggregated'] += 1
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(ds, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp, path)
+    return _remember(_datasets, key, ds)
+
+
+def dataset_hash(ds):
+    """Hash of a Dataset's contents: two build logs that aggregate alike share one chart."""
+    blob = json.dumps(ds, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def reset():
+    """Forget the build logs, datasets and chart parts held in memory (after changing CACHE_DIR)."""
+    _raw.clear()
+    _datasets.clear()
+    _blobs.clear()
+    for key in stats:
+        stats[key] = 0
+
+
+# ── Chart parts ──
+
+def _style(chart, kind, theme, title, number_format):
+    """Theme colors and fonts for a python-pptx Chart: transparent background, palette series, quiet axes."""
+    from pptx.enum.chart import XL_LEGEND_POSITION, XL_MARKER_STYLE, XL_TICK_MARK
+    from pptx.oxml import parse_xml
+    from pptx.oxml.ns import nsdecls
+    from pptx.util import Pt
+
+    chart._chartSpace.chart.addnext(parse_xml(
+        '<c:spPr %s><a:noFill/><a:ln><a:noFill/></a:ln></c:spPr>' % nsdecls('c', 'a')))
+    chart.font.size = Pt(9)
+    chart.font.name = theme.font
+    chart.font.color.rgb = theme.color('text2')
+    chart.has_title = bool(title)
+    if title:
+        tf = chart.chart_title.text_frame
+        tf.text = title
+        font = tf.paragraphs[0].font
+        font.size = Pt(11)
+        font.bold = True
+        font.color.rgb = theme.color('text1')
+    plot = chart.plots[0]
+    plot.vary_by_categories = False
+    chart.has_legend = len(plot.series) > 1
+    if chart.has_legend:
+        chart.legend.position = XL_LEGEND_POSITION.BOTTOM
+        chart.legend.include_in_layout = False
+    if kind == 'bar':
+        plot.gap_width = 60
+    for i, series in enumerate(plot.series):
+        color = theme.color(SERIES_COLORS[i % len(SERIES_COLORS)])
+        if kind == 'bar':
+            series.format.fill.solid()
+            series.format.fill.fore_color.rgb = color
+        else:
+            series.format.line.color.rgb = color
+            series.format.line.width = Pt(2)
+            series.smooth = False
+            series.marker.style = XL_MARKER_STYLE.NONE
+    value_axis, category_axis = chart.value_axis, chart.category_axis
+    value_axis.has_major_gridlines = True
+    value_axis.major_gridlines.format.line.color.rgb = theme.color('card_bd')
+    value_axis.format.line.fill.background()
+    value_axis.major_tick_mark = XL_TICK_MARK.NONE
+    value_axis.tick_labels.number_format = number_format
+    value_axis.tick_labels.number_format_is_linked = False
+    category_axis.format.line.color.rgb = theme.color('card_bd')
+    category_axis.major_tick_mark = XL_TICK_MARK.NONE
+
+
+def chart_blobs(ds, kind, theme, title=None):
+    """(chart part XML, workbook bytes) of Dataset *ds* as a *kind* chart in *theme*, built once per
+    process for each (dataset hash, kind, theme, title)."""
+    key = (dataset_hash(ds), kind, theme.name, tuple(sorted(theme.palette.items())), theme.font, title)
+    blobs = _blobs.get(key)
+    if blobs is not None:
+        _blobs.move_to_end(key)
+        return blobs
+    try:
+        from pptx.chart.data import CategoryChartData
+    except ImportError:
+        raise ChartError('XlsxWriter is required for native charts (pip install xlsxwriter)') from None
+    from pptx.chart.chart import Chart
+    from pptx.enum.chart import XL_CHART_TYPE
+    from pptx.opc.oxml import serialize_part_xml
+    from pptx.oxml import parse_xml
+
+    data = CategoryChartData(number_format=ds.number_format)
+    data.categories = ds.categories
+    for name, values in ds.series:
+        data.add_series(name, values)
+    chart_type = XL_CHART_TYPE.COLUMN_CLUSTERED if kind == 'bar' else XL_CHART_TYPE.LINE
+    chartSpace = parse_xml(data.xml_bytes(chart_type))
+    _style(Chart(chartSpace, None), kind, theme, title, ds.number_format)
+    stats['built'] += 1
+    return _remember(_blobs, key, (serialize_part_xml(chartSpace), data.xlsx_blob))
+
+
+def relate(slide_part, ds, kind, theme, title=None):
+    """rId of the deck's chart part for Dataset *ds*, related to *slide_part* (the chart part and its
+    workbook are added to the package on first use)."""
+    from pptx.opc.constants import CONTENT_TYPE as CT
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.parts.chart import ChartPart
+
+    xml, xlsx = chart_blobs(ds, kind, theme, title)
+    package = slide_part.package
+    parts = package.__dict__.setdefault('_chart_parts', {})
+    key = hashlib.sha1(xml).hexdigest()
+    part = parts.get(key)
+    if part is None:
+        part = parts[key] = ChartPart.load(package.next_partname(ChartPart.partname_template), CT.DML_CHART,
+                                           package, xml)
+        part.chart_workbook.update_from_xlsx_blob(xlsx)
+        stats['embedded'] += 1
+    else:
+        stats['shared'] += 1
+    return slide_part.relate_to(part, RT.CHART)
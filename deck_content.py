@@ -0,0 +1,58 @@
+"""
+Bundled Q3 review decks, independent of theme.
+
+Each deck is a declarative spec under decks/ (see deck_spec): 'q3' is the full
+11-slide review (from q3_hr_ppt.html), 'q3_compact' the 8-slide version (from
+q3_hr_presentation.html). A per-person spec is a dict of overrides for the
+deck's "vars" (name, stat_data, learnings, ...). Either deck can be rendered
+in any Theme.
+"""
+
+import os
+
+import deck_spec
+
+DECK_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'decks')
+
+# Deck name -> spec file
+DECKS = {
+    'q3': os.path.join(DECK_DIR, 'q3.json'),
+    'q3_compact': os.path.join(DECK_DIR, 'q3_compact.json'),
+}
+
+_loaded = {}  # deck -> (spec, spec_hash)
+
+
+def _load(deck):
+    if deck not in _loaded:
+        try:
+            path = DECKS[deck]
+        except KeyError:
+            raise ValueError(f'unknown deck {deck!r}, expected one of {sorted(DECKS)}') from None
+        spec = deck_spec.load_spec(path)
+        _loaded[deck] = spec, deck_spec.spec_hash(spec)
+    return _loaded[deck]
+
+
+def load(deck='q3'):
+    """The parsed spec of a bundled deck (read once per process)."""
+    return _load(deck)[0]
+
+
+def defaults(deck='q3'):
+    """Default per-person values of a deck."""
+    return load(deck)['vars']
+
+
+def build(spec=None, deck='q3', cache_dir=deck_spec.CACHE_DIR):
+    """Theme-independent content model (list of SlideModel) for *spec*."""
+    base, base_hash = _load(deck)
+    plan = deck_spec.compile_cached(base, spec, cache_dir, base_hash)
+    return deck_spec.plan_to_slides(plan)
+
+
+def validate(spec=None, deck='q3'):
+    """Problems with per-person *spec* for *deck*, as a list of messages (empty when it renders)."""
+    if spec is not None and not isinstance(spec, dict):
+        return [f'a per-person spec must be an object of "vars" overrides, got {type(spec).__name__}']
+    return deck_spec.validate_spec(load(deck), spec)
@@ -0,0 +1,368 @@
+"""
+Batch deck-generation engine.
+
+Keeps python-pptx and the default template warm in one process so that many
+personalized review decks can be built and saved in a single pass, instead of
+one interpreter (and one full pptx import) per deck.
+
+    from deck_engine import render_bytes, render_many
+    render_many([{'name': 'A. Person'}, {'name': 'B. Person'}], 'out', ['dark', 'white'])
+    data = render_bytes({'name': 'A. Person'}, 'white')   # or write_deck(file_obj, spec, ...)
+
+From the command line, with one deck per entry of a JSON list of specs:
+
+    python deck_engine.py people.json -o out --theme dark --theme white --jobs 8
+    python deck_engine.py people.json -o out --profile profile.json --trace trace.json   # see profiler.py
+    python deck_engine.py roster.csv -o out --jobs 8 --progress 1000    # one deck per row, see mail_merge.py
+    python deck_engine.py people.json -o out --export pdf --export png --export-workers 4   # see export.py
+    python deck_engine.py people.json -o out --merge-into out/all.pptx   # one combined deck, see deck_merge.py
+    python deck_engine.py long_decks.json -o out --stream   # one slide's XML in memory at a time, see streaming.py
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+
+import deck_content
+from incremental import write_incremental
+from profiler import Profiler
+from renderer import new_presentation, render
+from streaming import write_streaming
+from theme import THEMES, get_theme
+from zip_writer import DEFAULT_LEVEL, save
+
+
+def build_deck(spec=None, theme='dark', deck='q3'):
+    """Build one deck for *spec* (a dict, see deck_content) in the given theme."""
+    return render(deck_content.build(spec, deck), get_theme(theme))
+
+
+def build_decks(spec=None, themes=('dark', 'white'), deck='q3'):
+    """Build the same deck in several themes, sharing the content model. Returns {name: Presentation}."""
+    slides = deck_content.build(spec, deck)
+    return {t.name: render(slides, t) for t in map(get_theme, themes)}
+
+
+def write_deck(file, spec=None, theme='dark', deck='q3', level=DEFAULT_LEVEL, stream=False):
+    """Build one deck and write the .pptx to a path or any writable binary file object.
+
+    With *stream*, each slide is written as soon as it is rendered and only one
+    slide's XML is held at a time (see streaming.py); the bytes are the same.
+    """
+    if stream:
+        write_streaming(deck_content.build(spec, deck), get_theme(theme), file, level)
+    else:
+        save(build_deck(spec, theme, deck), file, level)
+
+
+def render_bytes(spec=None, theme='dark', deck='q3', level=DEFAULT_LEVEL):
+    """Build one deck and return the .pptx as bytes."""
+    buf = io.BytesIO()
+    write_deck(buf, spec, theme, deck, level)
+    return buf.getvalue()
+
+
+def output_name(spec, theme='dark', deck='q3'):
+    """File name for a deck: Q3_Review_<Name>[_<Deck>][_<Theme>_Theme].pptx."""
+    name = (spec or {}).get('name', deck_content.defaults()['name'])
+    stem = 'Q3_Review_' + re.sub(r'[^\w-]+', '_', name).strip('_')
+    if deck != 'q3':
+        stem += '_' + deck.removeprefix('q3_').title()
+    if theme != 'dark':
+        stem += f'_{theme.title()}_Theme'
+    return stem + '.pptx'
+
+
+def render_one(spec, out_dir, themes=('dark',), deck='q3', incremental=False, level=DEFAULT_LEVEL, stream=False):
+    """Build and save one spec in each theme. Returns ([paths], seconds).
+
+    With *incremental*, existing outputs are updated in place and only slides
+    whose inputs changed are re-rendered (see incremental.py). With *stream*,
+    slides are written out one at a time as they are rendered (see
+    streaming.py). *level* is the zip compression level (0 = store only, see
+    zip_writer.py).
+    """
+    start = time.perf_counter()
+    paths = []
+    if incremental or stream:
+        write = write_incremental if incremental else write_streaming
+        slides = deck_content.build(spec, deck)
+        for theme in map(get_theme, themes):
+            path = os.path.join(out_dir, output_name(spec, theme.name, deck))
+            write(slides, theme, path, level)
+            paths.append(path)
+    else:
+        for name, prs in build_decks(spec, themes, deck).items():
+            path = os.path.join(out_dir, output_name(spec, name, deck))
+            save(prs, path, level)
+            paths.append(path)
+    return paths, time.perf_counter() - start
+
+
+# ── Process pool ──
+
+def _init_worker():
+    """Pool initializer: import pptx, warm the cached template and its blank layout."""
+    new_presentation().slide_layouts[6]
+
+
+def _render_task(task, profile=None):
+    """render_one(*task), profiled when *profile* is (trace, rate); returns (paths, pid, seconds, snapshot)."""
+    if profile is None:
+        paths, seconds = render_one(*task)
+        return paths, os.getpid(), seconds, None
+    prof = Profiler(*profile)
+    with prof:
+        paths, seconds = render_one(*task)
+    return paths, os.getpid(), seconds, prof.snapshot()
+
+
+def render_iter(specs, out_dir, themes='dark', jobs=1, deck='q3', incremental=False, level=DEFAULT_LEVEL,
+                profile=None, window=None, stream=False):
+    """Like render_many(), but yields (paths, pid, seconds) for each spec, in order, as it is done.
+
+    *specs* may be a generator of any length: with jobs > 1 at most *window*
+    specs (default 2 * jobs) are submitted to the pool and not yet yielded, so
+    memory stays bounded however many specs there are.
+    """
+    themes = (themes,) if isinstance(themes, str) else tuple(themes)
+    os.makedirs(out_dir, exist_ok=True)
+    config = (profile.trace, profile.rate) if profile is not None else None
+    tasks = ((spec, out_dir, themes, deck, incremental, level, stream) for spec in specs)
+    if jobs > 1:
+        window = window or 2 * jobs
+        with ProcessPoolExecutor(jobs, initializer=_init_worker) as pool:
+            pending = deque()
+            for task in tasks:
+                pending.append(pool.submit(_render_task, task, config))
+                if len(pending) >= window:
+                    yield _finish(pending.popleft().result(), profile)
+            while pending:
+                yield _finish(pending.popleft().result(), profile)
+    else:
+        for task in tasks:
+            yield _finish(_render_task(task, config), profile)
+
+
+def _finish(result, profile):
+    if profile is not None:
+        profile.merge(result[3])
+    return result[:3]
+
+
+def render_many(specs, out_dir, themes='dark', jobs=1, timings=None, deck='q3', incremental=False,
+                level=DEFAULT_LEVEL, profile=None, stream=False):
+    """Build and save one deck per spec and theme into *out_dir*. Returns the written paths.
+
+    *themes* is a theme name or a list of names; all themes of a spec are
+    rendered from one content model. With jobs > 1 specs are fanned out over a
+    ProcessPoolExecutor, one spec per task. If *timings* is a list, a
+    (paths, pid, seconds) tuple is appended to it for every spec. If *profile*
+    is a Profiler, each spec is profiled (at the profiler's sampling rate, in
+    whichever process renders it) and the stage timings are merged into it.
+    """
+    results = list(render_iter(specs, out_dir, themes, jobs, deck, incremental, level, profile, stream=stream))
+    if timings is not None:
+        timings.extend(results)
+    return [path for paths, *_ in results for path in paths]
+
+
+def worker_report(timings):
+    """Summarize render_many timings per worker: {pid: (specs, busy_seconds)}."""
+    report = defaultdict(lambda: [0, 0.0])
+    for _, pid, seconds in timings:
+        report[pid][0] += 1
+        report[pid][1] += seconds
+    return {pid: tuple(v) for pid, v in report.items()}
+
+
+def load_specs(path):
+    """Read a JSON list of deck specs (one dict per person)."""
+    with open(path, encoding='utf-8') as f:
+        specs = json.load(f)
+    if not isinstance(specs, list):
+        raise ValueError(f'{path}: expected a JSON list of deck specs')
+    return specs
+
+
+def merge_roster(args, themes, jobs, profile):
+    """The command line's roster mode: stream args.specs through mail_merge.merge(). Returns the exit status."""
+    import mail_merge  # imports this module
+
+    shown = 0
+
+    def on_error(line_num, problems):
+        nonlocal shown
+        shown += 1
+        if shown <= args.max_errors:
+            for problem in problems:
+                print(f'❌ {args.specs}:{line_num}: {problem}')
+
+    def progress(stats):
+        if args.progress and stats['rendered'] % args.progress == 0:
+            rss = mail_merge.peak_rss_mb()
+            print(f'   {stats["rendered"]:8d} rows  {stats["rendered"] / stats["seconds"]:7.1f} rows/s'
+                  + (f'  peak RSS {rss[0]:.0f} MB' if rss else ''))
+
+    try:
+        stats = mail_merge.merge(args.specs, args.out_dir, themes, jobs, args.deck, args.incremental,
+                                 args.compress_level, args.window, profile, on_error, progress, args.stream)
+    except (OSError, mail_merge.RosterError) as e:
+        print(f'❌ {e}')
+        return 1
+    rss = mail_merge.peak_rss_mb()
+    print(f'✅ {stats["rendered"]} rows -> {stats["decks"]} decks in {args.out_dir}  ({stats["seconds"]:.2f}s, '
+          f'{stats["rendered"] / stats["seconds"] if stats["seconds"] else 0:.1f} rows/s, jobs={jobs}'
+          + (f', peak RSS {rss[0]:.0f} MB' + (f', workers {rss[1]:.0f} MB' if jobs > 1 else '') if rss else '')
+          + ')')
+    if stats['invalid']:
+        print(f'❌ {stats["invalid"]} of {stats["rows"]} rows skipped as invalid')
+        return 1
+    return 0
+
+
+def export_decks(paths, args):
+    """The command line's --export: convert the rendered decks with export.ExportPool. Returns the exit status."""
+    import export
+
+    out_dir = args.export_dir or args.out_dir
+    formats = tuple(args.export)
+    failed = 0
+    start = time.perf_counter()
+    try:
+        with export.ExportPool(args.export_workers, args.export_timeout) as pool:
+            for path, _, error, _ in pool.export_many(paths, out_dir, formats):
+                if error is not None:
+                    failed += 1
+                    print(f'❌ {path}: {error}')
+            stats = pool.stats
+    except export.ExportError as e:
+        print(f'❌ {e}')
+        return 1
+    wall = time.perf_counter() - start
+    done = len(paths) - failed
+    print(f'✅ {done} decks -> {out_dir} as {"+".join(formats)}  ({wall:.2f}s, {done / wall * 60:.1f} decks/min, '
+          f'workers={args.export_workers}; converted {stats["converted"]}, cached {stats["cache_hits"]})')
+    return 1 if failed else 0
+
+
+def merge_into(paths, args):
+    """The command line's --merge-into: combine the rendered decks with deck_merge. Returns the exit status."""
+    import deck_merge
+
+    try:
+        stats = deck_merge.merge_decks(paths, args.merge_into, args.compress_level)
+    except (OSError, deck_merge.MergeError) as e:
+        print(f'❌ {e}')
+        return 1
+    print(f'✅ {stats["decks"]} decks, {stats["slides"]} slides -> {args.merge_into}  ({stats["seconds"]:.2f}s, '
+          f'{os.path.getsize(args.merge_into) / (1 << 20):.1f} MB, {stats["shared_parts"]} shared parts)')
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Render one Q3 review deck per spec.')
+    ap.add_argument('specs', help='JSON file holding a list of deck specs, or a .csv/.jsonl roster (see mail_merge.py)')
+    ap.add_argument('-o', '--out-dir', default='decks_out')
+    ap.add_argument('--deck', choices=sorted(deck_content.DECKS), default='q3')
+    ap.add_argument('--theme', choices=sorted(THEMES), action='append',
+                    help='theme to render; repeat for several variants per spec (default dark)')
+    ap.add_argument('-j', '--jobs', type=int, default=1,
+                    help='worker processes (0 = all cores, default 1)')
+    ap.add_argument('--incremental', action='store_true',
+                    help='update existing decks in place, re-rendering only changed slides')
+    ap.add_argument('--compress-level', type=int, choices=range(10), default=DEFAULT_LEVEL, metavar='0-9',
+                    help=f'zip deflate level, 0 = store only (default {DEFAULT_LEVEL})')
+    ap.add_argument('--stream', action='store_true',
+                    help='write each slide as soon as it is rendered, for very long decks (see streaming.py)')
+    ap.add_argument('--fit', action='store_true', help='shrink text that would overflow its box')
+    ap.add_argument('--direct-xml', action='store_true',
+                    help='write shapes as XML directly, bypassing the python-pptx object model')
+    ap.add_argument('--text-styles', action='store_true',
+                    help='register named text styles once per deck instead of formatting every paragraph')
+    ap.add_argument('--slide-master', action='store_true',
+                    help='generate the slide master and layouts, with header text in their placeholders')
+    ap.add_argument('--emoji-images', action='store_true',
+                    help='draw emoji as PNG pictures rasterized from a local emoji font (EMOJI_FONT overrides)')
+    ap.add_argument('--window', type=int, metavar='N',
+                    help='roster rows in flight at most (default 2 per worker)')
+    ap.add_argument('--progress', type=int, default=0, metavar='N',
+                    help='with a roster, print rows/sec and peak memory every N rows')
+    ap.add_argument('--max-errors', type=int, default=20, metavar='N',
+                    help='with a roster, print the problems of at most N invalid rows (default 20)')
+    ap.add_argument('--export', choices=('pdf', 'png'), action='append', metavar='FORMAT',
+                    help='also export each deck as pdf or png slide thumbnails with LibreOffice; repeat for both')
+    ap.add_argument('--export-dir', metavar='DIR', help='where exports go (default: the output directory)')
+    ap.add_argument('--export-workers', type=int, default=1, metavar='N',
+                    help='LibreOffice processes converting at once (default 1)')
+    ap.add_argument('--export-timeout', type=float, default=120, metavar='S',
+                    help='seconds per deck before its LibreOffice process is restarted (default 120)')
+    ap.add_argument('--merge-into', metavar='FILE',
+                    help='also merge every rendered deck, in order, into one FILE (see deck_merge.py)')
+    ap.add_argument('--profile', metavar='REPORT.json', help='write per-stage counts and timings as JSON')
+    ap.add_argument('--trace', metavar='TRACE.json', help='write a Chrome trace of the profiled stages')
+    ap.add_argument('--profile-sample', type=float, default=1.0, metavar='RATE',
+                    help='fraction of specs to profile (default 1)')
+    args = ap.parse_args(argv)
+    is_roster = args.specs.lower().endswith(('.csv', '.jsonl', '.ndjson'))  # mail_merge.ROSTER_FORMATS
+    if args.stream and args.incremental:
+        ap.error('--stream writes every slide afresh; it cannot be combined with --incremental')
+    if args.export and is_roster:
+        ap.error('--export needs a JSON list of specs; export a roster\'s decks afterwards with export.py')
+    if args.merge_into and is_roster:
+        ap.error('--merge-into needs a JSON list of specs; merge a roster\'s decks afterwards with deck_merge.py')
+
+    jobs = args.jobs or os.cpu_count()
+    themes = [get_theme(t) for t in args.theme or ['dark']]
+    if args.fit:
+        themes = [replace(t, fit_text=True) for t in themes]
+    if args.direct_xml:
+        themes = [replace(t, direct_xml=True) for t in themes]
+    if args.text_styles:
+        themes = [replace(t, text_styles=True) for t in themes]
+    if args.slide_master:
+        themes = [replace(t, slide_master=True) for t in themes]
+    if args.emoji_images:
+        themes = [replace(t, emoji_images=True) for t in themes]
+    profile = Profiler(bool(args.trace), args.profile_sample) if args.profile or args.trace else None
+    if is_roster:
+        status = merge_roster(args, themes, jobs, profile)
+    else:
+        status = 0
+        specs = load_specs(args.specs)
+        timings = []
+        start = time.perf_counter()
+        paths = render_many(specs, args.out_dir, themes, jobs, timings, args.deck, args.incremental,
+                            args.compress_level, profile, args.stream)
+        wall = time.perf_counter() - start
+
+        print(f'✅ {len(paths)} decks -> {args.out_dir}  ({wall:.2f}s, {len(paths) / wall:.1f} decks/s, jobs={jobs})')
+        for pid, (count, busy) in sorted(worker_report(timings).items()):
+            print(f'   worker {pid}: {count:5d} specs  {busy:7.2f}s busy  {busy / count * 1000:6.1f} ms/spec')
+        if args.export:
+            status = export_decks(paths, args)
+        if args.merge_into:
+            status = merge_into(paths, args) or status
+    if profile is not None:
+        report = profile.report()
+        print(f'   profiled {report["sampled"]}/{report["runs"]} specs; slowest stages (self time):')
+        for stage, st in list(report["stages"].items())[:8]:
+            print(f'   {stage:18} {st["count"]:8d} calls  {st["self_ms"]:10.1f} ms self  {st["total_ms"]:10.1f} ms total')
+        if args.profile:
+            profile.write_report(args.profile)
+            print(f'✅ profile -> {args.profile}')
+        if args.trace:
+            profile.write_trace(args.trace)
+            print(f'✅ trace -> {args.trace}')
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,22 @@
+"""
+The .pptx files a command line names: files as given, directories scanned.
+
+    from deck_files import deck_paths
+    for path in deck_paths(['decks_out', 'extra.pptx']):
+        ...
+
+Standard library only, so merging, exporting and other commands that take
+decks on the command line can share it without importing one another.
+"""
+
+import os
+
+
+def deck_paths(targets):
+    """The .pptx files named by *targets*: files as given, directories scanned (not recursively)."""
+    for target in targets:
+        if os.path.isdir(target):
+            yield from (os.path.join(target, name) for name in sorted(os.listdir(target))
+                        if name.lower().endswith('.pptx'))
+        else:
+            yield target
@@ -0,0 +1,435 @@
+"""
+Merge many finished decks into one, storing shared masters, layouts, themes and media once.
+
+python-pptx cannot copy a slide between presentations, and copying one part
+by part brings along its layout, slide master, theme and pictures, once per
+source deck. merge_decks() works on the zip packages instead. Sources are
+opened one at a time and their slides appended in order, the slide XML and
+media copied as compressed zip entries (never parsed, never deflated again).
+Every other part a slide reaches through its relationships is keyed by a hash
+of its bytes and of the keys of what it points to, so a master with its
+layouts, a theme or a picture that a thousand decks share is written once,
+and every slide that used any copy of it points at that one. Only the
+relationship parts, the masters (renumbered), presentation.xml and the
+content types are written fresh.
+
+    from deck_merge import merge_decks
+    stats = merge_decks(['a.pptx', 'b.pptx'], 'all.pptx')
+
+    python deck_merge.py all.pptx decks_out            # every .pptx in the directory, by name
+    python deck_engine.py people.json -o out --merge-into all.pptx
+
+Memory stays nearly flat however many decks there are: one source is open
+at a time, parts are streamed, and what is kept is the zip directory record
+of each entry written (about 100 bytes) plus a name per shared part; the
+slide list, relationships and content types are generated when the merge is
+closed. The first source decides the slide size and the presentation
+properties; a source with another slide size raises MergeError. Notes slides
+go with their slides. docProps/app.xml and the thumbnail are left out, as
+they describe the first deck only.
+"""
+
+import argparse
+import hashlib
+import itertools
+import os
+import posixpath
+import re
+import sys
+import time
+import zipfile
+from xml.sax.saxutils import quoteattr
+
+from lxml import etree
+from pptx.opc.constants import CONTENT_TYPE as CT
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+from deck_files import deck_paths
+from zip_writer import DEFAULT_LEVEL, ZipStream
+
+FIRST_SLIDE_ID = 256
+FIRST_MASTER_ID = 2147483648      # sldMasterId and sldLayoutId values share one range, from 2**31
+# Presentation-level parts taken from the first source; its other relationships (fonts, tags, ...) are dropped
+PRESENTATION_PARTS = (RT.PRES_PROPS, RT.VIEW_PROPS, RT.TABLE_STYLES, RT.THEME, RT.PRINTER_SETTINGS)
+
+_PKG = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_TYPES = 'http://schemas.openxmlformats.org/package/2006/content-types'
+_P = '{http://schemas.openxmlformats.org/presentationml/2006/main}'
+_R = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}'
+_XML_HEAD = "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+_NUMBERED = re.compile(r'(.*?)\d*(\.[^.]*)?$')
+_LAYOUT_ID = re.compile(rb'(<(?:\w+:)?sldLayoutId\b[^>]*?\sid=")\d+')
+
+
+class MergeError(ValueError):
+    """A source deck that cannot be merged: unreadable, another slide size, a broken relationship."""
+
+
+def _rels_name(name):
+    head, base = posixpath.split(name)
+    return posixpath.join(head, '_rels', base + '.rels')
+
+
+def _rels_xml(rels):
+    """A relationships part for [(rId, type, target, external)]."""
+    items = ''.join(f'<Relationship Id={quoteattr(rid)} Type={quoteattr(rt)} Target={quoteattr(target)}'
+                    + (' TargetMode="External"/>' if external else '/>') for rid, rt, target, external in rels)
+    return f'{_XML_HEAD}<Relationships xmlns="{_PKG}">{items}</Relationships>'.encode('utf-8')
+
+
+# ── Sources ──
+
+class Source:
+    """One source deck, open for reading; parts are read on demand and keyed by content."""
+
+    def __init__(self, path):
+        self.path = path
+        try:
+            self.zip = zipfile.ZipFile(path)
+            self.infos = {info.filename: info for info in self.zip.infolist()}
+            types = etree.fromstring(self.zip.read('[Content_Types].xml'))
+        except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+            raise MergeError(f'{path}: not a readable .pptx ({e})') from None
+        self.defaults = {el.get('Extension').lower(): el.get('ContentType')
+                         for el in types.iter(f'{{{_TYPES}}}Default')}
+        self.overrides = {el.get('PartName'): el.get('ContentType') for el in types.iter(f'{{{_TYPES}}}Override')}
+        self._rels = {}
+        self._keys = {}
+        self._hashing = set()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.zip.close()
+
+    def read(self, name):
+        try:
+            return self.zip.read(self.infos[name])
+        except KeyError:
+            raise MergeError(f'{self.path}: a relationship names {name}, which is missing') from None
+
+    def content_type(self, name):
+        ct = self.overrides.get('/' + name) or self.defaults.get(posixpath.splitext(name)[1][1:].lower())
+        if ct is None:
+            raise MergeError(f'{self.path}: no content type for {name}')
+        return ct
+
+    def rels(self, name):
+        """[(rId, type, target, external)] of part *name*; internal targets as zip member names."""
+        rels = self._rels.get(name)
+        if rels is None:
+            rels = self._rels[name] = []
+            member = _rels_name(name)
+            if member in self.infos:
+                head = posixpath.dirname(name)
+                for el in etree.fromstring(self.zip.read(member)).iter(f'{{{_PKG}}}Relationship'):
+                    target, external = el.get('Target'), el.get('TargetMode') == 'External'
+                    if not external:
+                        target = target[1:] if target.startswith('/') else posixpath.normpath(
+                            posixpath.join(head, target))
+                    rels.append((el.get('Id'), el.get('Type'), target, external))
+        return rels
+
+    def key(self, name):
+        """Hash of part *name*, its content type and (recursively) everything it points to.
+
+        A layout and its master point at each other, so a master is keyed with
+        its layouts' bytes and their other relationships, and a layout by its
+        master's key and its place in the master.
+        """
+        key = self._keys.get(name)
+        if key is not None:
+            return key
+        ct = self.content_type(name)
+        if ct == CT.PML_SLIDE_LAYOUT:
+            master = next((t for _, rt, t, ext in self.rels(name) if rt == RT.SLIDE_MASTER and not ext), None)
+            rid = next((r for r, _, t, ext in self.rels(master) if t == name and not ext), None) if master else None
+            if rid is None:
+                raise MergeError(f'{self.path}: layout {name} is not listed by its slide master')
+            key = self._keys[name] = hashlib.sha1(f'{self.key(master)} {rid}'.encode()).hexdigest()
+            return key
+        if name in self._hashing:
+            raise MergeError(f'{self.path}: {name} is part of a relationship cycle')
+        self._hashing.add(name)
+        blob = self.read(name)
+        if ct == CT.PML_SLIDE_MASTER:   # the ids are renumbered on the way out (a merged deck merges again)
+            blob = _LAYOUT_ID.sub(rb'\1', blob)
+        h = hashlib.sha1(ct.encode())
+        h.update(hashlib.sha1(blob).digest())
+        for rid, rt, target, external in self.rels(name):
+            if external:
+                h.update(f' {rid} {rt} external {target}'.encode())
+            elif ct == CT.PML_SLIDE_MASTER and rt == RT.SLIDE_LAYOUT:
+                h.update(f' {rid} {rt} '.encode() + hashlib.sha1(self.read(target)).digest())
+                for lrid, lrt, ltarget, lexternal in self.rels(target):
+                    if lrt != RT.SLIDE_MASTER:
+                        h.update(f' {lrid} {lrt} {ltarget if lexternal else self.key(ltarget)}'.encode())
+            else:
+                h.update(f' {rid} {rt} {self.key(target)}'.encode())
+        self._hashing.discard(name)
+        key = self._keys[name] = h.hexdigest()
+        return key
+
+
+# ── Merging ──
+
+class DeckMerger:
+    """Appends the slides of source decks to one package streamed to *fp*; close() finishes it."""
+
+    def __init__(self, fp, level=DEFAULT_LEVEL):
+        self.zip = ZipStream(fp, level)
+        self.shared = {}            # content key -> part name in the output
+        self.types = {}             # part name in the output -> content type, for all but the slides
+        self.counters = {}          # (directory, stem, extension) -> last number used
+        self.slide_count = 0        # slides are ppt/slides/slide1.xml .. slide<slide_count>.xml, in order
+        self.masters = []           # (part name, sldMasterId) of each distinct master
+        self.notes_master = None
+        self.next_id = FIRST_MASTER_ID
+        self.first = None           # (path, presentation.xml element, slide size, [(rel type, part name)])
+        self.stats = {'decks': 0, 'slides': 0, 'parts_in': 0, 'parts_out': 0, 'shared_parts': 0, 'reused': 0}
+
+    def _new_name(self, name):
+        """*name* if no part has it yet, otherwise the next free number in its series (slideLayout7.xml)."""
+        if name not in self.types:
+            return name
+        head, base = posixpath.split(name)
+        stem, ext = _NUMBERED.match(base).groups()
+        series = (head, stem, ext or '')
+        n = self.counters.get(series, 1)
+        while True:
+            n += 1
+            candidate = posixpath.join(head, f'{stem}{n}{ext or ""}')
+            if candidate not in self.types:
+                self.counters[series] = n
+                return candidate
+
+    def _write(self, src, name, out, rels, data=None):
+        """Write part *name* of *src* as *out* (raw unless *data*), with *rels* [(rId, type, target, external)]."""
+        ct = src.content_type(name)
+        if ct != CT.PML_SLIDE:
+            self.types[out] = ct
+        if data is None:
+            self.zip.copy(src.zip, src.infos[name], out)
+        else:
+            self.zip.write(out, data)
+        if rels:
+            head = posixpath.dirname(out)
+            self.zip.write(_rels_name(out), _rels_xml(
+                [(rid, rt, target if external else posixpath.relpath(target, head), external)
+                 for rid, rt, target, external in rels]))
+        self.stats['parts_out'] += 1
+
+    def _renumber(self, blob):
+        """A master's XML with fresh ids for it and its layouts; returns (master id, XML)."""
+        root = etree.fromstring(blob)
+        master_id = self.next_id
+        for el in root.iter(f'{_P}sldLayoutId'):
+            self.next_id += 1
+            el.set('id', str(self.next_id))
+        self.next_id += 1
+        return master_id, etree.tostring(root, xml_declaration=True, encoding='UTF-8', standalone=True)
+
+    def _shared(self, src, name):
+        """The output name of shared part *name*, writing it (and what it points to) the first time it is seen."""
+        key = src.key(name)
+        out = self.shared.get(key)
+        if out is not None:
+            self.stats['reused'] += 1
+            return out
+        out = self.shared[key] = self._new_name(name)
+        self.types[out] = src.content_type(name)    # claims the name while what it points to is placed
+        data = None
+        if self.types[out] == CT.PML_SLIDE_MASTER:
+            master_id, data = self._renumber(src.read(name))
+            self.masters.append((out, master_id))
+        elif self.types[out] == CT.PML_NOTES_MASTER and self.notes_master is None:
+            self.notes_master = out
+        rels = [(rid, rt, target if external else self._shared(src, target), external)
+                for rid, rt, target, external in src.rels(name)]
+        self._write(src, name, out, rels, data)
+        self.stats['shared_parts'] += 1
+        return out
+
+    def _slide(self, src, name, out, slide_names):
+        rels = []
+        for rid, rt, target, external in src.rels(name):
+            if external:
+                pass
+            elif rt == RT.SLIDE:
+                if target not in slide_names:
+                    raise MergeError(f'{src.path}: {name} links to {target}, which is not in the slide list')
+                target = slide_names[target]
+            elif rt == RT.NOTES_SLIDE:   # belongs to this slide alone; points back at it
+                notes = self._new_name(f'ppt/notesSlides/notesSlide{self.slide_count}.xml')
+                notes_rels = []
+                for nrid, nrt, ntarget, nexternal in src.rels(target):
+                    if not nexternal:
+                        ntarget = out if nrt == RT.SLIDE else self._shared(src, ntarget)
+                    notes_rels.append((nrid, nrt, ntarget, nexternal))
+                self._write(src, target, notes, notes_rels)
+                target = notes
+            else:
+                target = self._shared(src, target)
+            rels.append((rid, rt, target, external))
+        self._write(src, name, out, rels)
+
+    def add(self, path):
+        """Append every slide of the deck at *path*, in its order."""
+        with Source(path) as src:
+            main = next((t for _, rt, t, ext in src.rels('') if rt == RT.OFFICE_DOCUMENT and not ext), None)
+            if main is None:
+                raise MergeError(f'{path}: no presentation part')
+            pres = etree.fromstring(src.read(main))
+            rels = {rid: target for rid, _, target, _ in src.rels(main)}
+            size = pres.find(f'{_P}sldSz')
+            size = None if size is None else (size.get('cx'), size.get('cy'))
+            if self.first is None:
+                parts = [(rt, self._shared(src, t)) for _, rt, t, ext in src.rels(main)
+                         if rt in PRESENTATION_PARTS and not ext]
+                core = next((t for _, rt, t, ext in src.rels('') if rt == RT.CORE_PROPERTIES and not ext), None)
+                if core is not None:
+                    self._write(src, core, core, [])
+                    parts.append((RT.CORE_PROPERTIES, core))
+                self.first = (path, pres, size, parts)
+            elif size != self.first[2]:
+                raise MergeError(f'{path}: slide size {size} differs from {self.first[2]} of {self.first[0]}')
+
+            slides = []
+            for el in pres.iterfind(f'{_P}sldIdLst/{_P}sldId'):
+                target = rels.get(el.get(f'{_R}id'))
+                if target is None:
+                    raise MergeError(f'{path}: slide list names a missing relationship')
+                slides.append(target)
+            names = {name: f'ppt/slides/slide{self.slide_count + i}.xml' for i, name in enumerate(slides, 1)}
+            for name in slides:
+                self.slide_count += 1
+                self._slide(src, name, names[name], names)
+            self.stats['parts_in'] += sum(not name.endswith('.rels') for name in src.infos)
+        self.stats['decks'] += 1
+        self.stats['slides'] = self.slide_count
+
+    def _presentation(self):
+        """presentation.xml and its relationships, [(rId, type, target)] then one per slide (rId<base + n>).
+
+        The first source's presentation.xml, listing every master and slide; the
+        slide list is spliced in as text rather than built as thousands of elements.
+        """
+        _, pres, _, parts = self.first
+        rels = []
+
+        def relate(rt, target):
+            rels.append((f'rId{len(rels) + 1}', rt, target))
+            return rels[-1][0]
+
+        for tag in ('sldMasterIdLst', 'notesMasterIdLst', 'handoutMasterIdLst', 'sldIdLst'):
+            el = pres.find(_P + tag)
+            if el is not None:
+                pres.remove(el)
+        for el in list(pres):   # what is left that points at parts of the first source (fonts, custom shows)
+            if any(_R + 'id' in e.attrib for e in el.iter()):
+                pres.remove(el)
+        lists = [etree.Element(_P + 'sldMasterIdLst')]
+        for out, master_id in self.masters:
+            etree.SubElement(lists[0], _P + 'sldMasterId', {'id': str(master_id),
+                                                             _R + 'id': relate(RT.SLIDE_MASTER, out)})
+        if self.notes_master is not None:
+            lists.append(etree.Element(_P + 'notesMasterIdLst'))
+            etree.SubElement(lists[-1], _P + 'notesMasterId', {_R + 'id': relate(RT.NOTES_MASTER, self.notes_master)})
+        if self.slide_count:
+            lists.append(etree.Element(_P + 'sldIdLst'))
+        for i, el in enumerate(lists):
+            pres.insert(i, el)
+        for rt, out in parts:
+            if rt != RT.CORE_PROPERTIES:
+                relate(rt, out)
+        xml = etree.tostring(pres, xml_declaration=True, encoding='UTF-8', standalone=True)
+        if self.slide_count:
+            p, r = pres.prefix, {ns: prefix for prefix, ns in pres.nsmap.items()}[_R[1:-1]]
+            ids = ''.join(f'<{p}:sldId id="{FIRST_SLIDE_ID + i}" {r}:id="rId{len(rels) + 1 + i}"/>'
+                          for i in range(self.slide_count))
+            xml = xml.replace(f'<{p}:sldIdLst/>'.encode(), f'<{p}:sldIdLst>{ids}</{p}:sldIdLst>'.encode(), 1)
+        return xml, rels
+
+    def _content_types(self):
+        defaults = {'rels': 'application/vnd.openxmlformats-package.relationships+xml', 'xml': 'application/xml'}
+        overrides = []
+        for name, ct in self.types.items():
+            ext = posixpath.splitext(name)[1][1:].lower()
+            if ext != 'xml' and defaults.setdefault(ext, ct) == ct:
+                continue
+            overrides.append((name, ct))
+        items = ''.join(f'<Default Extension={quoteattr(ext)} ContentType={quoteattr(ct)}/>'
+                        for ext, ct in defaults.items())
+        items += ''.join(f'<Override PartName={quoteattr("/" + name)} ContentType={quoteattr(ct)}/>'
+                         for name, ct in overrides)
+        items += ''.join(f'<Override PartName="/ppt/slides/slide{i}.xml" ContentType="{CT.PML_SLIDE}"/>'
+                         for i in range(1, self.slide_count + 1))
+        return f'{_XML_HEAD}<Types xmlns="{_TYPES}">{items}</Types>'.encode('utf-8')
+
+    def close(self):
+        """Write presentation.xml, the package relationships and content types, and the zip directory."""
+        if self.first is None:
+            raise MergeError('no decks to merge')
+        pres, rels = self._presentation()
+        self.types['ppt/presentation.xml'] = CT.PML_PRESENTATION_MAIN
+        self.zip.write('ppt/presentation.xml', pres)
+        base = len(rels)
+        self.zip.write('ppt/_rels/presentation.xml.rels', _rels_xml(itertools.chain(
+            ((rid, rt, posixpath.relpath(target, 'ppt'), False) for rid, rt, target in rels),
+            ((f'rId{base + i}', RT.SLIDE, f'slides/slide{i}.xml', False) for i in range(1, self.slide_count + 1)))))
+        package = [('rId1', RT.OFFICE_DOCUMENT, 'ppt/presentation.xml', False)]
+        package += [(f'rId{len(package) + 1}', rt, out, False) for rt, out in self.first[3] if rt == RT.CORE_PROPERTIES]
+        self.zip.write('_rels/.rels', _rels_xml(package))
+        self.zip.write('[Content_Types].xml', self._content_types())
+        self.zip.close()
+        self.stats['parts_out'] += 2
+
+
+def merge_decks(sources, out, level=DEFAULT_LEVEL):
+    """Merge the decks at the paths in *sources* (any iterable, read one at a time) into the file *out*.
+
+    Returns stats: decks, slides, parts_in and parts_out (zip entries other
+    than relationships, in all the sources and in the output), shared_parts
+    (masters, layouts, themes, media and the like written), reused (references
+    to one of those already written) and seconds. The output is written next
+    to *out* and moved into place only once it is complete.
+    """
+    start = time.perf_counter()
+    tmp = f'{out}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as fp:
+            merger = DeckMerger(fp, level)
+            for path in sources:
+                merger.add(path)
+            merger.close()
+        os.replace(tmp, out)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+    return dict(merger.stats, seconds=time.perf_counter() - start)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Merge decks into one, storing shared masters, layouts and media once.')
+    ap.add_argument('out', help='the merged .pptx')
+    ap.add_argument('decks', nargs='+', help='.pptx files, or directories of them (taken in name order)')
+    ap.add_argument('--compress-level', type=int, choices=range(10), default=DEFAULT_LEVEL, metavar='0-9',
+                    help=f'deflate level for the parts written fresh (default {DEFAULT_LEVEL})')
+    args = ap.parse_args(argv)
+
+    out = os.path.abspath(args.out)
+    sources = (path for path in deck_paths(args.decks) if os.path.abspath(path) != out)
+    try:
+        stats = merge_decks(sources, args.out, args.compress_level)
+    except (OSError, MergeError) as e:
+        print(f'❌ {e}')
+        return 1
+    print(f'✅ {stats["decks"]} decks, {stats["slides"]} slides -> {args.out}  ({stats["seconds"]:.2f}s, '
+          f'{os.path.getsize(args.out) / (1 << 20):.1f} MB; {stats["parts_out"]} parts written for '
+          f'{stats["parts_in"]} in the sources, {stats["shared_parts"]} of them shared)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
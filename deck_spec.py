@@ -0,0 +1,524 @@
+"""
+Declarative deck specs and their compiled layout plans.
+
+A spec (JSON, YAML or TOML) lists slides as components measured in inches:
+
+    {"vars": {"name": "A. Person", "learnings": [["🏗️", "Title", "Desc"]]},
+     "slides": [{"components": [
+         {"type": "text", "at": [0.6, 0.4, 4, 0.3], "text": "GROWTH", "size": 11, "color": "purple"},
+         {"type": "card_grid", "at": [0.6, 1.8], "size": [3.8, 2.1], "pitch": [4.1, 2.5],
+          "cols": 3, "items": "$learnings"}]}]}
+
+"$var" replaces a whole value and "{var}" is substituted inside strings, so
+per-person overrides only touch "vars". A component with "when": "var" is
+only drawn when that variable is set (non-empty), one with "unless": "var"
+only when it is not, so a person's data can swap one component for another.
+compile_spec() expands every component into renderer ops with absolute EMU
+coordinates, placing the cells of all grid components (card grids, flow
+rows, banners, ...) in one batched layout.solve_grids() call.
+
+The resulting plan is plain JSON. A spec's plan without overrides is cached
+on disk under the hash of the spec and the compiler's own source, so an
+unchanged deck is never laid out twice and a code change never reads back an
+old layout. Plans with per-person overrides are compiled afresh each time:
+one compiles about as fast as it reads back from disk, and caching them
+would leave a file per person of every mail merge.
+
+    python deck_spec.py decks/q3.json --plan q3_plan.json --check
+
+Importing this module is cheap: numpy (layout) and python-pptx (renderer) are
+imported by the functions that lay out or render a plan, so loading, hashing,
+validating and reading cached plans never pay for them.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+
+PLAN_VERSION = 1
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, '.plan_cache')
+# The code that turns a spec into a plan; its digest is part of every plan's cache key
+PLAN_SOURCES = ('deck_spec.py', 'layout.py')
+
+EMU_PER_INCH = 914400
+EMU_PER_PT = 12700
+
+
+class SpecError(ValueError):
+    """A deck spec is malformed or references an unknown component/variable."""
+
+
+# ── Loading ──
+
+def load_spec(path):
+    """Read a spec file; the format follows the extension (.json, .yaml/.yml, .toml)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.json':
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    if ext in ('.yaml', '.yml'):
+        try:
+            import yaml
+        except ImportError:
+            raise SpecError(f'{path}: PyYAML is required for YAML specs (pip install pyyaml)') from None
+        with open(path, encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    if ext == '.toml':
+        import tomllib
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    raise SpecError(f'{path}: unsupported spec format {ext!r}')
+
+
+def _digest(obj):
+    blob = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+_compiler = None
+
+
+def compiler_version():
+    """Digest of PLAN_SOURCES (computed once per process)."""
+    global _compiler
+    if _compiler is None:
+        h = hashlib.sha256()
+        for name in PLAN_SOURCES:
+            with open(os.path.join(HERE, name), 'rb') as f:
+                h.update(name.encode() + b'\0' + f.read())
+        _compiler = h.hexdigest()[:16]
+    return _compiler
+
+
+def spec_hash(spec, overrides=None, base=None):
+    """Stable hash of a spec plus per-person overrides (and the plan version and compiler_version()).
+
+    *base* may be a precomputed spec_hash(spec), so that hashing many people
+    against one deck only re-serializes their overrides.
+    """
+    return _digest([base or _digest([PLAN_VERSION, compiler_version(), spec]), overrides or {}])
+
+
+# ── Variables ──
+
+_FIELD = re.compile(r'\{(\w+)\}')
+
+
+def _resolve(value, env):
+    if isinstance(value, str):
+        if value.startswith('$') and value[1:] in env:
+            return env[value[1:]]
+        if '{' in value:
+            return _FIELD.sub(lambda m: str(env[m.group(1)]) if m.group(1) in env else m.group(0), value)
+        return value
+    if isinstance(value, list):
+        return [_resolve(v, env) for v in value]
+    if isinstance(value, dict):
+        return {k: _resolve(v, env) for k, v in value.items()}
+    return value
+
+
+# ── Components ──
+# Each takes the resolved component dict and returns renderer ops
+# [kind, args, kwargs] with lengths in EMU.
+
+def _emu(x):
+    return int(x * EMU_PER_INCH)  # == int(pptx.util.Inches(x))
+
+
+def _text(l, t, w, h, text, size, color='text1', bold=False, align='left'):
+    kwargs = {'font_size': size, 'color': color}
+    if bold:
+        kwargs['bold'] = True
+    if align != 'left':
+        kwargs['align'] = align
+    return ['text', [_emu(l), _emu(t), _emu(w), _emu(h), text], kwargs]
+
+
+def _rect(l, t, w, h, fill, border=None, radius=None):
+    return ['rect', [_emu(l), _emu(t), _emu(w), _emu(h), fill, border, radius], {}]
+
+
+def c_text(c):
+    return [_text(*c['at'], c['text'], c.get('size', 18), c.get('color', 'text1'),
+                  c.get('bold', False), c.get('align', 'left'))]
+
+
+def c_rect(c):
+    return [_rect(*c['at'], c['fill'], c.get('border'), c.get('radius'))]
+
+
+def c_multiline(c):
+    l, t, w, h = c['at']
+    return [['multiline', [_emu(l), _emu(t), _emu(w), _emu(h), list(c['lines'])],
+             {'font_size': c.get('size', 14), 'color': c.get('color', 'text2'),
+              'spacing': int(c.get('spacing', 6) * EMU_PER_PT)}]]
+
+
+def c_chart(c):
+    """Native chart of a build log (see charts.py); the data is read and aggregated when rendered."""
+    import charts
+
+    l, t, w, h = c['at']
+    chart, metric, source = c.get('chart', 'bar'), c.get('metric', 'builds'), c['source']
+    if chart not in charts.CHARTS or metric not in charts.METRICS:
+        raise ValueError(f'chart must be one of {charts.CHARTS} and metric one of {tuple(charts.METRICS)}')
+    if not isinstance(source, str) or not source:
+        raise ValueError('source must name a build log')
+    kwargs = {'chart': chart, 'metric': metric}
+    if c.get('title'):
+        kwargs['title'] = c['title']
+    return [['chart', [_emu(l), _emu(t), _emu(w), _emu(h), source], kwargs]]
+
+
+def c_card(c):
+    l, t, w, h = c['at']
+    return [['card', [_emu(l), _emu(t), _emu(w), _emu(h), *c['item']], {'border_color': c.get('border', 'card_bd')}]]
+
+
+# Grid components get their cells from layout.solve_grids(), solved for every
+# grid of a deck (or a batch of decks) at once. A grid gives either a 'pitch'
+# ([dx, dy] or dx for one row) or a 'gutter' plus 'cols', in which case the
+# cell width is solved to fill the slide between the margins.
+
+class Grid:
+    """Solved cells of one grid component: lefts/tops plus the common cell size (EMU)."""
+
+    __slots__ = ('xy', 'w', 'h')
+
+    def __init__(self, xy, w, h):
+        self.xy, self.w, self.h = xy, w, h
+
+
+def c_card_grid(c, grid):
+    border = c.get('border', 'card_bd')
+    return [['card', [x, y, grid.w, grid.h, *item], {'border_color': border}]
+            for (x, y), item in zip(grid.xy, c['items'])]
+
+
+def c_flow_row(c, grid):
+    steps = c['steps']
+    return [['flow_step', [x, y, *step], {'show_arrow': i < len(steps) - 1}]
+            for i, ((x, y), step) in enumerate(zip(grid.xy, steps))]
+
+
+def c_banner_row(c, grid):
+    return [['banner_item', [x, y, grid.w, num, label, c.get('color', 'banner_p')], {}]
+            for (x, y), (num, label) in zip(grid.xy, c['items'])]
+
+
+def c_stat_row(c, grid):
+    ops = []
+    for (x, y), (num, label) in zip(grid.xy, c['items']):
+        ops.append(['rect', [x, y, grid.w, grid.h, 'card_bg', 'card_bd', 0.06], {}])
+        ops.append(['text', [x, y + _emu(0.15), grid.w, _emu(0.6), num],
+                    {'font_size': 36, 'color': 'purple', 'bold': True, 'align': 'center'}])
+        ops.append(['text', [x, y + _emu(0.75), grid.w, _emu(0.4), label],
+                    {'font_size': 10, 'color': 'text3', 'align': 'center'}])
+    return ops
+
+
+def c_panel_row(c, grid):
+    """Left-aligned icon panels: rect plus emoji/title/desc rows at fixed offsets."""
+    pad = _emu(c.get('pad', 0.2))
+    text_w = _emu(c['text_w']) if 'text_w' in c else grid.w - _emu(0.4)
+    em, ti, de = c['emoji'], c['title'], c['desc']
+    ops = []
+    for (x, y), (emoji, title, desc) in zip(grid.xy, c['items']):
+        ops.append(['rect', [x, y, grid.w, grid.h, 'card_bg', 'card_bd', c.get('radius', 0.04)], {}])
+        tx = x + pad
+        ops.append(['text', [tx, y + _emu(em['dy']), _emu(em['w']) if 'w' in em else text_w, _emu(em['h']), emoji],
+                    {'font_size': em['size'], 'color': 'text1'}])
+        ops.append(['text', [tx, y + _emu(ti['dy']), text_w, _emu(ti['h']), title],
+                    {'font_size': ti['size'], 'color': 'text1', 'bold': True}])
+        ops.append(['text', [tx, y + _emu(de['dy']), text_w, _emu(de['h']), desc],
+                    {'font_size': de['size'], 'color': 'text2'}])
+    return ops
+
+
+def c_section_header(c):
+    x, y = c.get('at', [0.6, 0.4])
+    return [
+        _rect(x, y, 0.7, 0.7, c.get('color', 'purple'), radius=0.1),
+        _text(x, y + 0.05, 0.7, 0.65, c['num'], 22, 'white', True, 'center'),
+        _text(x + 0.9, y, 8, 0.4, c['title'], 22, 'text1', True),
+        _text(x + 0.9, y + 0.45, 8, 0.3, c['subtitle'], 12, 'text2'),
+    ]
+
+
+def c_before_after(c):
+    top, h = c['top'], c['height']
+    ops = []
+    for side, x, fill, accent in (('before', 0.6, 'red_soft', 'pink'), ('after', 6.9, 'grn_soft', 'teal')):
+        panel = c[side]
+        ops.append(_rect(x, top, 5.8, h, fill, accent, 0.03))
+        ops.append(_text(x + 0.4, top + 0.15, 5, 0.4, panel['title'], c.get('heading_size', 17), accent, True))
+        ops.extend(c_multiline({'at': [x + 0.4, top + c.get('list_dy', 0.8), 5.0, c['list_h']],
+                                'lines': panel['items'], 'size': 12, 'spacing': c.get('spacing', 10)}))
+        if side == 'before':
+            ops.append(_text(6.4, top + c['vs_dy'], 0.6, 0.5, 'VS', 14, 'text3', True, 'center'))
+    return ops
+
+
+def c_qa_rows(c, grid):
+    """Full-width rows of (role, question, answer) examples."""
+    ops = []
+    qw, qh = c.get('q', [3.5, 0.45])
+    ax, aw, ah = c.get('a', [4.5, 8, 0.7])
+    for (x, y), (role, q, a) in zip(grid.xy, c['items']):
+        ops.append(['rect', [x, y, grid.w, grid.h, 'card_bg', 'card_bd', 0.02], {}])
+        ops.append(['text', [x + _emu(0.2), y + _emu(0.05), _emu(1.5), _emu(0.3), role],
+                    {'font_size': 10, 'color': 'teal', 'bold': True}])
+        ops.append(['text', [x + _emu(0.2), y + _emu(0.3), _emu(qw), _emu(qh), q],
+                    {'font_size': 10, 'color': 'gold'}])
+        ops.append(['text', [_emu(ax), y + _emu(0.08), _emu(aw), _emu(ah), a],
+                    {'font_size': 9, 'color': 'text2'}])
+    return ops
+
+
+COMPONENTS = {
+    'text': c_text,
+    'rect': c_rect,
+    'multiline': c_multiline,
+    'card': c_card,
+    'chart': c_chart,
+    'section_header': c_section_header,
+    'before_after': c_before_after,
+}
+
+# Grid component -> (builder, items key, default cell size in inches)
+GRIDS = {
+    'card_grid': (c_card_grid, 'items', None),
+    'flow_row': (c_flow_row, 'steps', (1.6, 1.5)),
+    'banner_row': (c_banner_row, 'items', None),
+    'stat_row': (c_stat_row, 'items', (2.1, 1.4)),
+    'panel_row': (c_panel_row, 'items', None),
+    'qa_rows': (c_qa_rows, 'items', None),
+}
+
+
+def _grid_request(kind, c):
+    """(n, cols, x0, y0, dx, dy, w, h) in EMU for one grid component."""
+    _, items, default = GRIDS[kind]
+    n = len(c[items])
+    if kind == 'banner_row':
+        w, h = c['item_w'], 1.1
+    elif kind == 'qa_rows':
+        w, h = 12.1, c.get('row_h', 0.85)
+    else:
+        w, h = c.get('size', default)
+    x0, y0 = c['at']
+    w, h = _emu(w), _emu(h)
+    if 'pitch' in c:
+        dx, dy = c['pitch'] if isinstance(c['pitch'], list) else (c['pitch'], 0)
+        dx, dy = _emu(dx), _emu(dy)
+        cols = c.get('cols') or (n if dx else 1)
+    else:
+        import layout
+
+        cols = c.get('cols') or n
+        gutter = _emu(c['gutter'])
+        w, dx = (int(v) for v in layout.cell_pitch(cols, gutter, _emu(c.get('margin', x0))))
+        dy = h + _emu(c.get('row_gutter', c['gutter']))
+    return n, cols, _emu(x0), _emu(y0), dx, dy, w, h
+
+
+def _drawn(comp, env):
+    """False for a component switched off by its "when"/"unless" variable."""
+    if 'when' in comp and not env.get(comp['when']):
+        return False
+    return not ('unless' in comp and env.get(comp['unless']))
+
+
+# ── Compile ──
+
+def _solve(jobs):
+    """Resolve and lay out a batch of (spec, overrides) pairs.
+
+    Returns one list per job of (slide number, kind, resolved component, Grid
+    or None), with the cells of every grid of every job solved in a single
+    layout.solve_grids() call.
+    """
+    resolved, requests = [], []
+    for spec, overrides in jobs:
+        env = dict(spec.get('vars', {}), **(overrides or {}))
+        comps = []
+        for n, slide in enumerate(spec.get('slides', []), 1):
+            for comp in slide.get('components', []):
+                kind = comp.get('type')
+                if kind not in COMPONENTS and kind not in GRIDS:
+                    raise SpecError(f'slide {n}: unknown component type {kind!r}')
+                if not _drawn(comp, env):
+                    continue
+                c = _resolve(comp, env)
+                if kind in GRIDS:
+                    try:
+                        requests.append(_grid_request(kind, c))
+                    except (KeyError, TypeError, ValueError) as e:
+                        raise SpecError(f'slide {n}: bad {kind} component: {e!r}') from None
+                comps.append([n, kind, c, None])
+        resolved.append(comps)
+
+    if requests:
+        import layout
+
+        n, cols, x0, y0, dx, dy, w, h = zip(*requests)
+        xy, offsets = layout.solve_grids(n, cols, x0, y0, dx, dy)
+        xy = xy.tolist()
+        grids = iter(Grid(xy[a:b], gw, gh) for a, b, gw, gh in zip(offsets[:-1], offsets[1:], w, h))
+        for comps in resolved:
+            for entry in comps:
+                if entry[1] in GRIDS:
+                    entry[3] = next(grids)
+    return resolved
+
+
+def _plan(spec, comps):
+    slides = [{'bg': slide.get('bg', 'bg'), 'ops': []} for slide in spec.get('slides', [])]
+    for n, kind, c, grid in comps:
+        try:
+            ops = GRIDS[kind][0](c, grid) if grid is not None else COMPONENTS[kind](c)
+        except (KeyError, TypeError, ValueError) as e:
+            raise SpecError(f'slide {n}: bad {kind} component: {e!r}') from None
+        slides[n - 1]['ops'].extend(ops)
+    return {'version': PLAN_VERSION, 'slides': slides}
+
+
+def compile_spec(spec, overrides=None):
+    """Expand a spec into a layout plan: {'version', 'slides': [{'bg', 'ops'}]}."""
+    return _plan(spec, _solve([(spec, overrides)])[0])
+
+
+def check_layout(spec, overrides=None):
+    """Overlapping or off-slide grid cells of a spec, as a list of messages."""
+    cells = [(n, kind, i, x, y, grid.w, grid.h)
+             for n, kind, _, grid in _solve([(spec, overrides)])[0] if grid is not None
+             for i, (x, y) in enumerate(grid.xy)]
+    if not cells:
+        return []
+    import layout
+
+    boxes = [cell[3:] for cell in cells]
+    problems = []
+    for a, b in layout.find_overlaps(boxes, [cell[0] for cell in cells]).tolist():
+        problems.append(f'slide {cells[a][0]}: {cells[a][1]}[{cells[a][2]}] overlaps {cells[b][1]}[{cells[b][2]}]')
+    for i in layout.out_of_bounds(boxes).nonzero()[0].tolist():
+        problems.append(f'slide {cells[i][0]}: {cells[i][1]}[{cells[i][2]}] leaves the slide')
+    return problems
+
+
+def validate_spec(spec, overrides=None):
+    """Problems that would stop *spec* plus *overrides* from compiling, as a list of messages.
+
+    Overrides must name variables of the spec with the same shape (list or
+    scalar); every component is resolved and built on placeholder grid cells.
+    Nothing is laid out, so this needs neither numpy nor python-pptx.
+    """
+    if not isinstance(spec, dict) or not isinstance(spec.get('slides'), list):
+        return ['spec must be an object with a "slides" list']
+    defaults = spec.get('vars', {})
+    problems = []
+    for key, value in (overrides or {}).items():
+        if key not in defaults:
+            problems.append(f'unknown variable {key!r}, expected one of {sorted(defaults)}')
+        elif isinstance(value, list) != isinstance(defaults[key], list):
+            problems.append(f'variable {key!r} should be a {type(defaults[key]).__name__}, '
+                            f'got {type(value).__name__}')
+    env = dict(defaults, **(overrides or {}))
+    for n, slide in enumerate(spec['slides'], 1):
+        for comp in slide.get('components', []):
+            kind = comp.get('type')
+            if kind not in COMPONENTS and kind not in GRIDS:
+                problems.append(f'slide {n}: unknown component type {kind!r}')
+                continue
+            if not _drawn(comp, env):
+                continue
+            c = _resolve(comp, env)
+            try:
+                if kind in GRIDS:
+                    count, *_, w, h = _grid_request(kind, c)
+                    GRIDS[kind][0](c, Grid([(0, 0)] * count, w, h))
+                else:
+                    COMPONENTS[kind](c)
+            except (KeyError, TypeError, ValueError) as e:
+                problems.append(f'slide {n}: bad {kind} component: {e!r}')
+    return problems
+
+
+def compile_cached(spec, overrides=None, cache_dir=CACHE_DIR, base=None):
+    """compile_spec() with the plan stored on disk as <cache_dir>/<spec_hash>.json.
+
+    Only plans without *overrides* are stored, so the cache holds one file per
+    deck spec (and compiler version) however many people are rendered.
+    """
+    if cache_dir is None or overrides:
+        return compile_spec(spec, overrides)
+    path = os.path.join(cache_dir, spec_hash(spec, overrides, base) + '.json')
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+    plan = compile_spec(spec, overrides)
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp, path)
+    return plan
+
+
+def plan_to_slides(plan):
+    """Turn a plan back into renderer SlideModels."""
+    from pptx.enum.text import PP_ALIGN
+    from pptx.util import Emu
+
+    from renderer import SlideModel
+
+    align = {'left': PP_ALIGN.LEFT, 'center': PP_ALIGN.CENTER, 'right': PP_ALIGN.RIGHT}
+    slides = []
+    for entry in plan['slides']:
+        s = SlideModel(entry['bg'])
+        for kind, args, kwargs in entry['ops']:
+            if 'align' in kwargs or 'spacing' in kwargs:
+                kwargs = dict(kwargs)
+                if 'align' in kwargs:
+                    kwargs['align'] = align[kwargs['align']]
+                if 'spacing' in kwargs:
+                    kwargs['spacing'] = Emu(kwargs['spacing'])
+            s.ops.append((kind, tuple(args), kwargs))
+        slides.append(s)
+    return slides
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Compile a deck spec into a layout plan.')
+    ap.add_argument('spec', help='deck spec (.json, .yaml, .toml)')
+    ap.add_argument('--plan', help='write the compiled plan here as JSON')
+    ap.add_argument('--check', action='store_true', help='report overlapping or off-slide grid cells')
+    args = ap.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    start = time.perf_counter()
+    plan = compile_spec(spec)
+    ms = (time.perf_counter() - start) * 1000
+    slides = plan['slides']
+    ops = sum(len(s['ops']) for s in slides)
+    print(f'✅ {args.spec}: {len(slides)} slides, {ops} ops  ({ms:.2f} ms, hash {spec_hash(spec)[:12]})')
+    if args.plan:
+        with open(args.plan, 'w', encoding='utf-8') as f:
+            json.dump(plan, f, ensure_ascii=False, separators=(',', ':'))
+    if args.check:
+        problems = check_layout(spec)
+        for problem in problems:
+            print(f'   ⚠️  {problem}')
+        if problems:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,215 @@
+"""
+Emoji pre-rasterized to PNG pictures.
+
+Cards, flow steps and icon panels put an emoji in a text box of its own.
+Viewers draw it from whatever fallback font they have, so it looks different
+(or turns into a box) from one machine to the next. With Theme.emoji_images,
+such a text box becomes a picture of the emoji instead: png() rasterizes it
+once from a local color emoji font at the size the box uses and keeps the PNG
+in an on-disk cache (CACHE_DIR, .emoji_cache next to this module) shared by
+every process and batch, whatever their working directory, and the picture's
+image part is shared by every slide of the deck that shows the same PNG
+(python-pptx dedupes image parts by the SHA1 of their bytes).
+
+    data = emoji_images.png('🚀', 28)     # None: not an emoji, no emoji font, or not drawable
+    rId = emoji_images.relate(slide.part, data)
+
+Text that cannot be drawn faithfully stays text: no emoji font, a codepoint
+the font lacks, or a ZWJ sequence (👨‍💻) without a Pillow built with raqm to
+shape it.
+"""
+
+import functools
+import hashlib
+import io
+import os
+
+import text_fit
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(HERE, '.emoji_cache')
+PX_PER_PT = 2          # 144 dpi, sharp at 2x zoom
+BITMAP_STRIKE = 109    # the only size a bitmap color font (Noto Color Emoji) loads at
+
+# Candidate files, best first; EMOJI_FONT names another one
+EMOJI_FONTS = ['notocoloremoji.ttf', 'seguiemj.ttf', 'apple color emoji.ttc', 'twemoji.ttf']
+
+_RANGES = ((0x1F000, 0x1FAFF), (0x2600, 0x27BF), (0x2300, 0x23FF), (0x2B00, 0x2BFF), (0x3030, 0x303D),
+           (0x3297, 0x3299))
+_JOINERS = frozenset('\u200d\ufe0f\u20e3')  # ZWJ, VS16, keycap
+_ZWJ = '\u200d'
+
+# in-process counters; bench_emoji_images.py reports them
+stats = {'memory_hits': 0, 'disk_hits': 0, 'rasterized': 0, 'skipped': 0}
+_memory = {}  # (text, px) -> PNG bytes, or None when the text stays text
+_font = None
+
+
+def is_emoji(text):
+    """True if *text* is only emoji: pictographs plus joiners, variation selectors and modifiers."""
+    if not text:
+        return False
+    for ch in text:
+        if ch in _JOINERS:
+            continue
+        cp = ord(ch)
+        if not any(lo <= cp <= hi for lo, hi in _RANGES):
+            return False
+    return True
+
+
+# ── Font ──
+
+def find_emoji_font():
+    """Path of the color emoji font to rasterize with, or None."""
+    path = os.environ.get('EMOJI_FONT')
+    if path:
+        return path if os.path.exists(path) else None
+    index = text_fit._font_index()
+    for name in EMOJI_FONTS:
+        if name in index:
+            return index[name]
+    return None
+
+
+def _load_font():
+    """(path, identity for cache keys, covered codepoints), or None without an emoji font."""
+    global _font
+    if _font is None:
+        path = find_emoji_font()
+        if path is None:
+            _font = False
+        else:
+            st = os.stat(path)
+            try:
+                covered = frozenset(text_fit.read_widths(path))
+            except (OSError, KeyError, ValueError):
+                covered = frozenset()
+            _font = path, f'{os.path.basename(path)}:{st.st_size}:{st.st_mtime_ns}', covered
+    return _font or None
+
+
+def drawable(text):
+    """True if png() draws *text* at any size: an emoji whose every codepoint the emoji font has."""
+    if not is_emoji(text):
+        return False
+    font = _load_font()
+    if font is None:
+        return False
+    if _ZWJ in text and not _shapes_sequences():
+        return False
+    return all(ord(ch) in font[2] for ch in text if ch not in _JOINERS)
+
+
+@functools.lru_cache(maxsize=None)
+def _shapes_sequences():
+    """Whether Pillow has raqm, without which ZWJ sequences come out as their separate emoji."""
+    from PIL import features
+    return bool(features.check('raqm'))
+
+
+# ── Rasterizing ──
+
+def rasterize(text, px, path):
+    """RGBA PNG of *text* drawn from the font at *path*, its ink centered on a *px* square."""
+    from PIL import Image, ImageDraw, ImageFont
+
+    try:
+        font = ImageFont.truetype(path, px * 2)
+    except OSError:
+        font = ImageFont.truetype(path, BITMAP_STRIKE)
+    text = text.replace('\ufe0f', '')
+    left, top, right, bottom = font.getbbox(text, mode='RGBA')
+    side = max(right - left, bottom - top, 1)
+    im = Image.new('RGBA', (side, side), (0, 0, 0, 0))
+    ImageDraw.Draw(im).text(((side - (right - left)) / 2 - left, (side - (bottom - top)) / 2 - top), text,
+                            font=font, embedded_color=True)
+    if side != px:
+        im = im.resize((px, px), Image.LANCZOS)
+    buf = io.BytesIO()
+    im.save(buf, 'PNG', optimize=True)
+    return buf.getvalue()
+
+
+def _cache_path(key):
+    return os.path.join(CACHE_DIR, key[:2], key + '.png')
+
+
+def png(text, size):
+    """PNG bytes of emoji *text* at *size* pt, or None when it should stay text.
+
+    Looked up in memory, then in CACHE_DIR by a hash of the font file's identity,
+    the text and the pixel size, and rasterized only when both miss.
+    """
+    if not is_emoji(text):
+        return None
+    px = max(int(round(size * PX_PER_PT)), 1)
+    try:
+        data = _memory[text, px]
+    except KeyError:
+        pass
+    else:
+        stats['memory_hits' if data is not None else 'skipped'] += 1
+        return data
+    if not drawable(text):
+        stats['skipped'] += 1
+        _memory[text, px] = None
+        return None
+    font = _load_font()
+    path = _cache_path(hashlib.sha256(f'{font[1]}\0{text}\0{px}'.encode('utf-8')).hexdigest())
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+        stats['disk_hits'] += 1
+    except OSError:
+        data = rasterize(text, px, font[0])
+        stats['rasterized'] += 1
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    _memory[text, px] = data
+    return data
+
+
+def reset():
+    """Forget the font and the in-memory PNGs (after changing EMOJI_FONT or CACHE_DIR)."""
+    global _font
+    _font = None
+    _memory.clear()
+    for key in stats:
+        stats[key] = 0
+
+
+# ── Embedding ──
+
+def place(left, top, w, size, align):
+    """(x, y, side) in EMU of a *size* pt emoji as a text box at (left, top) *w* wide would draw it."""
+    side = int(size * 12700)
+    if align.xml_value == 'ctr':
+        x = left + (w - side) // 2
+    elif align.xml_value == 'r':
+        x = left + w - 91440 - side
+    else:
+        x = left + 91440
+    # below the 0.05in top inset, centered in the first line
+    y = top + 45720 + int(side * (text_fit.LINE_SPACING - 1) / 2)
+    return int(x), int(y), side
+
+
+def relate(slide_part, data):
+    """rId of the deck's image part for PNG *data*, related to *slide_part* (both made on first use).
+
+    The package remembers its emoji image parts by SHA1, so repeats skip
+    python-pptx's image parsing and its scan of every part for a duplicate.
+    """
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+    package = slide_part.package
+    parts = package.__dict__.setdefault('_emoji_image_parts', {})
+    sha1 = hashlib.sha1(data).hexdigest()
+    part = parts.get(sha1)
+    if part is None:
+        part = parts[sha1] = package.get_or_add_image_part(io.BytesIO(data))
+    return slide_part.relate_to(part, RT.IMAGE)
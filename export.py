@@ -0,0 +1,415 @@
+"""
+PDF and PNG slide thumbnails of finished decks, from a pool of LibreOffice processes.
+
+`soffice --headless --convert-to pdf deck.pptx` starts a whole office suite
+per file, seconds of startup before any work. ExportPool instead keeps *size*
+headless soffice processes running, each listening on its own local UNO
+socket with its own user profile, and hands each deck to whichever is free.
+Every conversion has a timeout: a worker that hangs is killed and started
+again, one that crashes is restarted and the deck retried, and a deck that
+still fails is reported with ExportError rather than stalling the batch.
+
+Outputs are cached under CACHE_DIR by a hash of the deck's contents (its zip
+parts, not the zip bytes, which carry timestamps), the format and the
+LibreOffice install, so exporting an unchanged deck again only copies the
+cached files, and a batch that is fully cached never starts soffice.
+
+    with ExportPool(size=4) as pool:
+        for path, outputs, error, seconds in pool.export_many(paths, 'exports', ('pdf', 'png')):
+            ...   # outputs: {'pdf': 'exports/deck.pdf', 'png': ['exports/deck_01.png', ...]}
+
+    python export.py decks_out -o exports --format pdf --format png -j 4
+    python deck_engine.py people.json -o out --export pdf --export-workers 4
+
+Needs LibreOffice (SOFFICE names the soffice binary when it is not on PATH)
+and its Python bridge, uno: run under LibreOffice's bundled Python or install
+python3-uno. Thumbnails are one PNG per slide, THUMB_WIDTH pixels wide.
+"""
+
+import argparse
+import hashlib
+import os
+import queue
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import zipfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from deck_files import deck_paths
+
+CACHE_DIR = '.export_cache'
+EXPORT_VERSION = 1
+FORMATS = ('pdf', 'png')
+THUMB_WIDTH = 640
+DEFAULT_TIMEOUT = 120   # seconds per deck
+STARTUP_TIMEOUT = 60    # seconds for a new soffice to accept connections
+
+SOFFICE_NAMES = ('soffice', 'libreoffice')
+SOFFICE_PATHS = ('/Applications/LibreOffice.app/Contents/MacOS/soffice',
+                 r'C:\Program Files\LibreOffice\program\soffice.exe')
+
+_SLIDE_SIZE = re.compile(rb'<p:sldSz\b[^>]*?\bcx="(\d+)"[^>]*?\bcy="(\d+)"')
+
+
+class ExportError(RuntimeError):
+    """A deck could not be exported: no LibreOffice, or it failed to convert the deck."""
+
+
+class ExportTimeout(ExportError):
+    """A conversion took longer than the pool's timeout; its worker was killed."""
+
+
+# ── LibreOffice ──
+
+def find_soffice():
+    """Path of the soffice binary (SOFFICE, then PATH, then the usual install locations), or None."""
+    path = os.environ.get('SOFFICE')
+    if path:
+        return path if os.path.exists(path) else None
+    for name in SOFFICE_NAMES:
+        found = shutil.which(name)
+        if found:
+            return found
+    for path in SOFFICE_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def _uno():
+    try:
+        import uno
+    except ImportError:
+        raise ExportError("LibreOffice's Python bridge (uno) is required for exports: install python3-uno, "
+                          "or run under the Python bundled with LibreOffice") from None
+    return uno
+
+
+def _props(**values):
+    """Tuple of com.sun.star.beans.PropertyValue for UNO calls."""
+    uno = _uno()
+    props = []
+    for name, value in values.items():
+        prop = uno.createUnoStruct('com.sun.star.beans.PropertyValue')
+        prop.Name, prop.Value = name, value
+        props.append(prop)
+    return tuple(props)
+
+
+class Worker:
+    """One headless soffice process listening on a local UNO socket, with a user profile of its own."""
+
+    def __init__(self, soffice, startup_timeout=STARTUP_TIMEOUT):
+        self.soffice = soffice
+        self.startup_timeout = startup_timeout
+        self.proc = self.profile = self.ctx = self.desktop = None
+        self.killed = False
+
+    def alive(self):
+        return self.proc is not None and self.proc.poll() is None
+
+    def start(self):
+        """(Re)start soffice and connect to it; raises ExportError if it does not listen in time."""
+        uno = _uno()
+        from com.sun.star.connection import NoConnectException
+
+        self.stop()
+        with socket.socket() as s:
+            s.bind(('127.0.0.1', 0))
+            port = s.getsockname()[1]
+        accept = f'socket,host=127.0.0.1,port={port};urp;StarOffice.ComponentContext'
+        self.profile = tempfile.mkdtemp(prefix='soffice_profile_')
+        self.proc = subprocess.Popen(
+            [self.soffice, '--headless', '--invisible', '--nologo', '--nodefault', '--norestore', '--nolockcheck',
+             f'--accept={accept}', '-env:UserInstallation=' + uno.systemPathToFileUrl(self.profile)],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext('com.sun.star.bridge.UnoUrlResolver', local)
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            try:
+                self.ctx = resolver.resolve(f'uno:{accept}')
+                break
+            except NoConnectException:
+                if self.proc.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise ExportError(f'{self.soffice} did not accept connections within '
+                                      f'{self.startup_timeout:g}s') from None
+                time.sleep(0.1)
+        self.desktop = self.ctx.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', self.ctx)
+        self.killed = False
+
+    def kill(self):
+        """Kill soffice now (from the timeout timer); the conversion in progress fails."""
+        self.killed = True
+        if self.alive():
+            self.proc.kill()
+
+    def stop(self):
+        """Ask soffice to quit (killing it if it will not) and remove its profile."""
+        if self.proc is not None:
+            if self.alive():
+                try:
+                    self.desktop.terminate()
+                except Exception:  # already gone, or hung
+                    pass
+                try:
+                    self.proc.wait(5)
+                except subprocess.TimeoutExpired:
+                    self.proc.kill()
+                    self.proc.wait()
+            self.proc = self.ctx = self.desktop = None
+        if self.profile is not None:
+            shutil.rmtree(self.profile, ignore_errors=True)
+            self.profile = None
+
+    def convert(self, src, outputs, timeout, width=THUMB_WIDTH):
+        """Write *outputs* ([(format, path)]: a PDF file, or a directory of slide PNGs) for the deck at *src*,
+        killing soffice if that takes more than *timeout* seconds."""
+        timer = threading.Timer(timeout, self.kill)
+        timer.daemon = True
+        timer.start()
+        try:
+            self._convert(src, outputs, width)
+        except Exception as e:  # UNO errors, including the one a killed soffice leaves behind
+            if self.killed:
+                raise ExportTimeout(f'{src}: no result within {timeout:g}s') from None
+            if isinstance(e, ExportError):
+                raise
+            raise ExportError(f'{src}: {type(e).__name__}: {e}') from None
+        finally:
+            timer.cancel()
+
+    def _convert(self, src, outputs, width):
+        uno = _uno()
+        doc = self.desktop.loadComponentFromURL(uno.systemPathToFileUrl(os.path.abspath(src)), '_blank', 0,
+                                                _props(Hidden=True, ReadOnly=True))
+        if doc is None:
+            raise ExportError(f'{src}: LibreOffice cannot open it')
+        try:
+            for fmt, path in outputs:
+                if fmt == 'pdf':
+                    doc.storeToURL(uno.systemPathToFileUrl(path), _props(FilterName='impress_pdf_Export'))
+                    continue
+                os.makedirs(path, exist_ok=True)
+                cx, cy = slide_size(src)
+                size = uno.Any('[]com.sun.star.beans.PropertyValue',
+                               _props(PixelWidth=width, PixelHeight=round(width * cy / cx)))
+                graphic = self.ctx.ServiceManager.createInstanceWithContext(
+                    'com.sun.star.drawing.GraphicExportFilter', self.ctx)
+                pages = doc.getDrawPages()
+                for i in range(pages.getCount()):
+                    graphic.setSourceDocument(pages.getByIndex(i))
+                    args = _props(URL=uno.systemPathToFileUrl(os.path.join(path, f'slide{i + 1:03d}.png')),
+                                  MediaType='image/png')
+                    args += (uno.createUnoStruct('com.sun.star.beans.PropertyValue', 'FilterData', 0, size, 0),)
+                    uno.invoke(graphic, 'filter', (args,))  # invoke() passes the Any-typed FilterData through
+        finally:
+            doc.close(True)
+
+
+# ── Cache ──
+
+def content_hash(path):
+    """Hash of a .pptx's parts (names and uncompressed bytes): two saves of the same deck hash alike."""
+    h = hashlib.sha256()
+    with zipfile.ZipFile(path) as z:
+        for name in sorted(z.namelist()):
+            data = z.read(name)
+            h.update(b'%s\0%d\0' % (name.encode('utf-8'), len(data)))
+            h.update(data)
+    return h.hexdigest()
+
+
+def slide_size(path):
+    """(cx, cy) slide size in EMU from a deck's presentation.xml."""
+    with zipfile.ZipFile(path) as z:
+        m = _SLIDE_SIZE.search(z.read('ppt/presentation.xml'))
+    return (int(m.group(1)), int(m.group(2))) if m else (12192000, 6858000)
+
+
+def _copy_out(entry, fmt, out_dir, stem):
+    if fmt == 'pdf':
+        dst = os.path.join(out_dir, stem + '.pdf')
+        shutil.copyfile(entry, dst)
+        return dst
+    outputs = []
+    for n, name in enumerate(sorted(os.listdir(entry)), 1):
+        outputs.append(os.path.join(out_dir, f'{stem}_{n:02d}.png'))
+        shutil.copyfile(os.path.join(entry, name), outputs[-1])
+    return outputs
+
+
+# ── Pool ──
+
+class ExportPool:
+    """*size* LibreOffice workers, started on first use, sharing one output cache.
+
+    Use it as a context manager, or call close(), to stop the workers.
+    worker_class makes the workers (a subclass can swap in a Worker that is
+    not backed by LibreOffice).
+    """
+
+    worker_class = Worker
+
+    def __init__(self, size=1, timeout=DEFAULT_TIMEOUT, cache_dir=CACHE_DIR, soffice=None, width=THUMB_WIDTH,
+                 retries=1):
+        self.soffice = soffice or find_soffice()
+        if self.soffice is None:
+            raise ExportError('LibreOffice not found: install it, or set SOFFICE to the soffice binary')
+        st = os.stat(self.soffice)
+        self.install = f'{os.path.realpath(self.soffice)}:{st.st_size}:{st.st_mtime_ns}'
+        self.timeout, self.cache_dir, self.width, self.retries = timeout, cache_dir, width, retries
+        self.workers = [self.worker_class(self.soffice) for _ in range(size)]
+        self._idle = queue.Queue()
+        for worker in self.workers:
+            self._idle.put(worker)
+        self._lock = threading.Lock()
+        self.stats = {'converted': 0, 'cache_hits': 0, 'timeouts': 0, 'restarts': 0, 'failures': 0}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _count(self, key):
+        with self._lock:
+            self.stats[key] += 1
+
+    def start(self):
+        """Start every worker now rather than on first use (to keep startup out of timings)."""
+        for worker in self.workers:
+            if not worker.alive():
+                worker.start()
+
+    def close(self):
+        for worker in self.workers:
+            worker.stop()
+
+    def entry(self, content, fmt):
+        """Cache path of *fmt* output for a deck with content_hash *content*: a .pdf file, or a directory of PNGs."""
+        key = hashlib.sha256(f'{EXPORT_VERSION}\0{content}\0{fmt}\0{self.width if fmt == "png" else ""}\0'
+                             f'{self.install}'.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, key[:2], key + ('.pdf' if fmt == 'pdf' else ''))
+
+    def _convert(self, path, todo):
+        """Convert the deck at *path* into the cache entries *todo* ([(format, entry)]) on a free worker."""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp = tempfile.mkdtemp(dir=self.cache_dir)
+        try:
+            outputs = [(fmt, os.path.join(tmp, 'deck.pdf' if fmt == 'pdf' else 'png')) for fmt, _ in todo]
+            worker = self._idle.get()
+            try:
+                for attempt in range(self.retries + 1):
+                    if not worker.alive():
+                        if worker.proc is not None:
+                            self._count('restarts')
+                        worker.start()
+                    try:
+                        worker.convert(path, outputs, self.timeout, self.width)
+                        break
+                    except ExportTimeout:
+                        self._count('timeouts')  # the killed worker is restarted for the next deck
+                        raise
+                    except ExportError:
+                        if worker.alive() or attempt == self.retries:  # the deck, not a crash
+                            raise
+            finally:
+                self._idle.put(worker)
+            self._count('converted')
+            for (_, out), (_, entry) in zip(outputs, todo):
+                os.makedirs(os.path.dirname(entry), exist_ok=True)
+                try:
+                    os.replace(out, entry)
+                except OSError:  # another process cached it first
+                    pass
+        finally:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def export(self, path, out_dir, formats=('pdf',)):
+        """{format: output} for the deck at *path*, written into *out_dir* from the cache, converting on a miss.
+
+        The 'pdf' output is a path, 'png' a list of paths (<stem>_01.png, ...).
+        """
+        unknown = set(formats) - set(FORMATS)
+        if unknown:
+            raise ExportError(f'unknown export format(s) {sorted(unknown)}, expected {FORMATS}')
+        content = content_hash(path)
+        entries = [(fmt, self.entry(content, fmt)) for fmt in formats]
+        todo = [(fmt, entry) for fmt, entry in entries if not os.path.exists(entry)]
+        if todo:
+            self._convert(path, todo)
+        if len(todo) < len(entries):
+            self._count('cache_hits')
+        os.makedirs(out_dir, exist_ok=True)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        return {fmt: _copy_out(entry, fmt, out_dir, stem) for fmt, entry in entries}
+
+    def _timed(self, path, out_dir, formats):
+        start = time.perf_counter()
+        try:
+            outputs, error = self.export(path, out_dir, formats), None
+        except (OSError, zipfile.BadZipFile, ExportError) as e:
+            outputs, error = None, e
+            if not isinstance(e, ExportTimeout):
+                self._count('failures')
+        return path, outputs, error, time.perf_counter() - start
+
+    def export_many(self, paths, out_dir, formats=('pdf',), window=None):
+        """Yield (path, outputs, error, seconds) for each deck of *paths* in order, converting on every
+        worker at once; *error* is the ExportError (or OSError) of a deck that failed, *outputs* then None.
+        At most *window* decks (default two per worker) are in flight, so *paths* may be a generator."""
+        window = window or 2 * len(self.workers)
+        with ThreadPoolExecutor(len(self.workers)) as ex:
+            pending = deque()
+            for path in paths:
+                pending.append(ex.submit(self._timed, path, out_dir, formats))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Export decks to PDF and PNG slide thumbnails with LibreOffice.')
+    ap.add_argument('decks', nargs='+', help='.pptx files, or directories of them')
+    ap.add_argument('-o', '--out-dir', default='exports')
+    ap.add_argument('--format', choices=FORMATS, action='append', help='repeat for several (default pdf)')
+    ap.add_argument('-j', '--workers', type=int, default=1, help='soffice processes (default 1)')
+    ap.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                    help=f'seconds per deck before its worker is restarted (default {DEFAULT_TIMEOUT})')
+    ap.add_argument('--width', type=int, default=THUMB_WIDTH, help=f'thumbnail width in pixels (default {THUMB_WIDTH})')
+    args = ap.parse_args(argv)
+
+    formats = tuple(args.format or ['pdf'])
+    start = time.perf_counter()
+    done = failed = 0
+    try:
+        with ExportPool(args.workers, args.timeout, width=args.width) as pool:
+            for path, _, error, _ in pool.export_many(deck_paths(args.decks), args.out_dir, formats):
+                if error is None:
+                    done += 1
+                else:
+                    failed += 1
+                    print(f'❌ {path}: {error}')
+            stats = pool.stats
+    except ExportError as e:
+        print(f'❌ {e}')
+        return 1
+    wall = time.perf_counter() - start
+    print(f'✅ {done} decks -> {args.out_dir} as {"+".join(formats)}  ({wall:.2f}s, {done / wall * 60:.1f} decks/min, '
+          f'workers={args.workers}; converted {stats["converted"]}, cached {stats["cache_hits"]}, '
+          f'timeouts {stats["timeouts"]}, restarts {stats["restarts"]})')
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
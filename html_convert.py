@@ -0,0 +1,371 @@
+"""
+Convert the HTML review decks (q3_hr_ppt.html, q3_hr_presentation.html) to PPTX.
+
+The HTML is read in chunks through html.parser; only the <section class="slide">
+currently open is kept as a small element tree. When a section closes it is
+laid out top to bottom with the renderer's components (cards, flow steps,
+banners, before/after panels) and released, and each slide is written to the
+.pptx as soon as it is rendered (streaming.write_streaming), so neither the
+document nor the deck is ever held whole. A section too tall for one slide carries on onto the next, and text is fitted
+to its boxes (Theme.fit_text), so the converted decks lint without errors.
+
+    python html_convert.py q3_hr_ppt.html -o Q3_Review_from_html.pptx --theme dark
+"""
+
+import argparse
+import re
+from dataclasses import replace
+from html.parser import HTMLParser
+
+from pptx.util import Inches, Pt
+from pptx.enum.text import PP_ALIGN
+
+from layout import SLIDE_H
+from renderer import SlideModel
+from streaming import write_streaming
+from text_fit import text_height
+from theme import THEMES, get_theme
+
+CHUNK = 64 * 1024
+VOID = {'br', 'img', 'hr', 'meta', 'link', 'input', 'source', 'wbr'}
+
+# Both HTML decks use their own class names for the same parts.
+ROLES = {
+    'hero-badge': 'eyebrow', 'badge': 'eyebrow', 'tag': 'eyebrow',
+    'stitle': 'title',
+    'story': 'body', 'sdesc': 'body',
+    'hero-name': 'name',
+    'human-quote': 'quote',
+    'ty-title': 'thanks', 'ty': 'thanks',
+    'stats-row': 'stats', 'stats': 'stats',
+    'stat-num': 'num', 'st-n': 'num', 'banner-num': 'num', 'b-n': 'num',
+    'stat-label': 'label', 'st-l': 'label', 'banner-label': 'label', 'b-l': 'label',
+    'poc-head': 'header', 'poc': 'header',
+    'poc-num': 'badge_num', 'poc-n': 'badge_num',
+    'grid': 'grid',
+    'card': 'card', 'value-card': 'card',
+    'card-emoji': 'emoji', 'flow-icon': 'emoji', 'fi': 'emoji',
+    'card-title': 'title_small', 'card-t': 'title_small', 'flow-title': 'title_small', 'ft': 'title_small',
+    'card-text': 'desc', 'card-d': 'desc', 'flow-desc': 'desc', 'fd': 'desc', 'sub-points': 'desc',
+    'flow': 'flow', 'flow-step': 'step', 'fs': 'step',
+    'banner': 'banner',
+    'vs-grid': 'vs', 'vs': 'vs',
+    'vs-before': 'before', 'vs-old': 'before', 'vs-after': 'after', 'vs-new': 'after',
+    'vs-mid': 'skip', 'vs-m': 'skip',
+    'diagram-label': 'subhead', 'db-l': 'subhead',
+}
+
+MARGIN = 0.6
+CONTENT_W = 12.1
+TOP = 0.4
+# The HTML designs run their last block (often a banner) into the bottom margin; only one that would
+# leave the slide starts a new one.
+BOTTOM = SLIDE_H / 914400 - 0.2
+
+
+class Node:
+    """Minimal element: tag, classes, role from ROLES, and text/Node children."""
+
+    __slots__ = ('tag', 'classes', 'role', 'children')
+
+    def __init__(self, tag, classes):
+        self.tag = tag
+        self.classes = classes
+        self.role = next((ROLES[c] for c in classes if c in ROLES), None)
+        self.children = []
+
+    def text(self):
+        parts = []
+        for c in self.children:
+            parts.append(c if isinstance(c, str) else c.text())
+        return ''.join(parts)
+
+    def clean_text(self):
+        lines = (re.sub(r'\s+', ' ', line).strip() for line in self.text().split('\n'))
+        return '\n'.join(line for line in lines if line)
+
+    def find(self, role):
+        for c in self.children:
+            if isinstance(c, Node):
+                if c.role == role:
+                    return c
+                hit = c.find(role)
+                if hit is not None:
+                    return hit
+        return None
+
+    def find_all(self, role):
+        out = []
+        for c in self.children:
+            if isinstance(c, Node):
+                if c.role == role:
+                    out.append(c)
+                else:
+                    out.extend(c.find_all(role))
+        return out
+
+    def field(self, role):
+        node = self.find(role)
+        return node.clean_text() if node is not None else ''
+
+
+class _SectionParser(HTMLParser):
+    """Collects one <section class="slide"> at a time into a Node tree."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.stack = []
+        self.done = []
+
+    def handle_starttag(self, tag, attrs):
+        classes = (dict(attrs).get('class') or '').split()
+        if not self.stack:
+            if tag == 'section' and 'slide' in classes:
+                node = Node(tag, classes)
+                node.role = 'hero' if 'hero' in classes else 'slide'
+                self.stack.append(node)
+            return
+        if tag in ('br', 'li'):
+            self.stack[-1].children.append('\n')
+        if tag in VOID:
+            return
+        node = Node(tag, classes)
+        self.stack[-1].children.append(node)
+        self.stack.append(node)
+
+    def handle_endtag(self, tag):
+        if not self.stack or tag in VOID:
+            return
+        # Pop to the matching open tag; tolerates unclosed <li>/<p>.
+        for i in range(len(self.stack) - 1, -1, -1):
+            if self.stack[i].tag == tag:
+                del self.stack[i + 1:]
+                node = self.stack.pop()
+                if not self.stack:
+                    self.done.append(node)
+                return
+
+    def handle_data(self, data):
+        if self.stack:
+            self.stack[-1].children.append(data)
+
+
+def iter_sections(f, chunk_size=CHUNK):
+    """Yield each slide section of the HTML file object *f* as a Node tree."""
+    parser = _SectionParser()
+    while True:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        parser.feed(chunk)
+        while parser.done:
+            yield parser.done.pop(0)
+    parser.close()
+    yield from parser.done
+
+
+# ── Layout ──
+
+def _text_h(text, width_in, font_size, bold=False):
+    """Height in inches of *text* wrapped into a box *width_in* wide (real font metrics)."""
+    return text_height(text, font_size, Inches(width_in), bold=bold) / 914400
+
+
+class _Layout:
+    """Stacks the blocks of one section top to bottom onto SlideModels, starting another when one is full."""
+
+    def __init__(self, hero=False, centered=False):
+        self.slides = [SlideModel()]
+        self.y = 1.6 if hero else TOP
+        self.hero = hero
+        self.centered = hero or centered
+
+    @property
+    def s(self):
+        return self.slides[-1]
+
+    def room(self, h):
+        """Move on to a new slide if a block *h* inches tall would run past the bottom margin."""
+        if self.y + h > BOTTOM and self.s.ops:
+            self.slides.append(SlideModel())
+            self.y = TOP
+
+    def text(self, text, size, color='text1', bold=False, center=False, width=CONTENT_W, gap=0.15):
+        if not text:
+            return
+        h = _text_h(text, width, size, bold)
+        self.room(h)
+        left = MARGIN + (CONTENT_W - width) / 2 if center else MARGIN
+        self.s.text(Inches(left), Inches(self.y), Inches(width), Inches(h), text, font_size=size,
+                    color=color, bold=bold, align=PP_ALIGN.CENTER if center else PP_ALIGN.LEFT)
+        self.y += h + gap
+
+    def header(self, node):
+        num = node.field('badge_num')
+        title = node.find('title') or next((c for c in _nodes(node) if c.tag in ('h2', 'h3')), None)
+        sub = next((c for c in _nodes(node) if c.tag == 'p'), None)
+        self.room(0.75)
+        self.s.rect(Inches(MARGIN), Inches(self.y), Inches(0.7), Inches(0.7), 'purple', radius=0.1)
+        self.s.text(Inches(MARGIN), Inches(self.y + 0.05), Inches(0.7), Inches(0.65),
+                    num, font_size=22, bold=True, color='white', align=PP_ALIGN.CENTER)
+        if title is not None:
+            self.s.text(Inches(1.5), Inches(self.y), Inches(8), Inches(0.4),
+                        title.clean_text(), font_size=22, bold=True, color='text1')
+        if sub is not None:
+            self.s.text(Inches(1.5), Inches(self.y + 0.45), Inches(8), Inches(0.3),
+                        sub.clean_text(), font_size=12, color='text2')
+        self.y += 0.95
+
+    def stats(self, node):
+        items = node.find_all('num')
+        labels = node.find_all('label')
+        left = MARGIN + (CONTENT_W - (2.1 * len(items) + 0.3 * (len(items) - 1))) / 2
+        self.room(1.4)
+        for i, (num, label) in enumerate(zip(items, labels)):
+            x = left + i * 2.4
+            self.s.rect(Inches(x), Inches(self.y), Inches(2.1), Inches(1.4), 'card_bg', 'card_bd', 0.06)
+            self.s.text(Inches(x), Inches(self.y + 0.15), Inches(2.1), Inches(0.6), num.clean_text(),
+                        font_size=36, bold=True, color='purple', align=PP_ALIGN.CENTER)
+            self.s.text(Inches(x), Inches(self.y + 0.75), Inches(2.1), Inches(0.4), label.clean_text(),
+                        font_size=10, color='text3', align=PP_ALIGN.CENTER)
+        self.y += 1.6
+
+    def grid(self, node, cols):
+        cards = node.find_all('card')
+        if not cards:
+            return
+        w = (CONTENT_W - 0.3 * (cols - 1)) / cols
+        descs = [c.field('desc') for c in cards]
+        h = max(1.3 + _text_h(d, w - 0.3, 10) for d in descs)
+        for i, (card, desc) in enumerate(zip(cards, descs)):
+            if i % cols == 0:   # a new row, which may go on the next slide
+                if i:
+                    self.y += h + 0.2
+                self.room(h)
+            x = MARGIN + (i % cols) * (w + 0.3)
+            self.s.card(Inches(x), Inches(self.y), Inches(w), Inches(h),
+                        card.field('emoji'), card.field('title_small'), desc)
+        self.y += h + 0.2
+
+    def flow(self, node):
+        steps = node.find_all('step')
+        pitch = min(2.3, CONTENT_W / max(len(steps), 1))
+        self.room(1.5)
+        for i, step in enumerate(steps):
+            self.s.flow_step(Inches(MARGIN + i * pitch), Inches(self.y), step.field('emoji'),
+                             step.field('title_small'), step.field('desc'), show_arrow=(i < len(steps) - 1))
+        self.y += 1.7
+
+    def banner(self, node):
+        nums, labels = node.find_all('num'), node.find_all('label')
+        n = max(len(nums), 1)
+        w = (CONTENT_W - 0.25 * (n - 1)) / n
+        self.room(1.1)
+        for i, (num, label) in enumerate(zip(nums, labels)):
+            self.s.banner_item(Inches(MARGIN + i * (w + 0.25)), Inches(self.y), Inches(w),
+                               num.clean_text(), label.clean_text(), 'banner_p')
+        self.y += 1.3
+
+    def vs(self, node):
+        panels = [(node.find('before'), 'red_soft', 'pink', MARGIN),
+                  (node.find('after'), 'grn_soft', 'teal', MARGIN + 6.3)]
+        heights = []
+        for panel, _, _, _ in panels:
+            items = [li.clean_text() for li in _nodes(panel) if li.tag == 'li'] if panel else []
+            heights.append(0.9 + 0.4 * len(items))
+        h = max(heights)
+        self.room(h)
+        for panel, fill, accent, x in panels:
+            if panel is None:
+                continue
+            head = next((c for c in _nodes(panel) if c.tag in ('h3', 'h4')), None)
+            items = [li.clean_text() for li in _nodes(panel) if li.tag == 'li']
+            self.s.rect(Inches(x), Inches(self.y), Inches(5.8), Inches(h), fill, accent, 0.03)
+            if head is not None:
+                self.s.text(Inches(x + 0.4), Inches(self.y + 0.15), Inches(5), Inches(0.4),
+                            head.clean_text(), font_size=17, bold=True, color=accent)
+            self.s.multiline(Inches(x + 0.4), Inches(self.y + 0.7), Inches(5.0), Inches(h - 0.8),
+                             items, font_size=12, color='text2', spacing=Pt(8))
+        self.s.text(Inches(MARGIN + 5.8), Inches(self.y + h / 2 - 0.25), Inches(0.5), Inches(0.5),
+                    'VS', font_size=14, bold=True, color='text3', align=PP_ALIGN.CENTER)
+        self.y += h + 0.2
+
+    def walk(self, node):
+        for child in node.children:
+            if not isinstance(child, Node):
+                continue
+            role, tag = child.role, child.tag
+            if role == 'eyebrow':
+                self.text(child.clean_text().upper(), 11, 'purple', bold=True, center=self.centered, gap=0.1)
+            elif role == 'thanks':
+                self.y = max(self.y, 2.2)
+                self.text(child.clean_text(), 60, 'purple', bold=True, center=True)
+            elif tag == 'h1':
+                self.text(child.clean_text(), 44, bold=True, center=self.centered)
+            elif role == 'title' or tag == 'h2':
+                self.text(child.clean_text(), 28, bold=True)
+            elif tag == 'h3' and role is None:
+                self.text(child.clean_text(), 16, bold=True)
+            elif role == 'subhead':
+                self.text(child.clean_text(), 12, 'text3', bold=True)
+            elif role in ('body', 'quote') or tag == 'p':
+                self.text(child.clean_text(), 14, 'text2', center=self.centered)
+            elif role == 'name':
+                self.text(child.clean_text(), 14, 'text3', center=self.centered)
+            elif role == 'header':
+                self.header(child)
+            elif role == 'stats':
+                self.stats(child)
+            elif role == 'grid':
+                self.grid(child, 3 if 'g3' in child.classes else 2)
+            elif role == 'flow':
+                self.flow(child)
+            elif role == 'banner':
+                self.banner(child)
+            elif role == 'vs':
+                self.vs(child)
+            elif role != 'skip':
+                self.walk(child)
+
+
+def _nodes(node):
+    """All descendant Nodes of *node*, depth first."""
+    for c in node.children:
+        if isinstance(c, Node):
+            yield c
+            yield from _nodes(c)
+
+
+def section_to_slides(section):
+    """Lay out one section Node as SlideModels: one, or more if it does not fit on a slide."""
+    layout = _Layout(hero=section.role == 'hero', centered=section.find('thanks') is not None)
+    layout.walk(section)
+    return layout.slides
+
+
+def iter_slides(f, chunk_size=CHUNK):
+    """Stream SlideModels out of an HTML deck file object."""
+    for section in iter_sections(f, chunk_size):
+        yield from section_to_slides(section)
+
+
+def convert(html_path, out_path, theme='dark'):
+    """Convert an HTML deck to .pptx, rendering and writing each slide as soon as it is parsed; returns the count."""
+    theme = replace(get_theme(theme), fit_text=True)   # the HTML's text lengths are not known in advance
+    with open(html_path, encoding='utf-8') as f:
+        return write_streaming(iter_slides(f), theme, out_path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Convert an HTML review deck to PowerPoint.')
+    ap.add_argument('html')
+    ap.add_argument('-o', '--output', default='Q3_Review_from_html.pptx')
+    ap.add_argument('--theme', choices=sorted(THEMES), default='dark')
+    args = ap.parse_args(argv)
+    n = convert(args.html, args.output, args.theme)
+    print(f'\n✅ PowerPoint saved to: {args.output}')
+    print(f'   Total slides: {n}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""
+Incremental deck rebuilds for the edit-preview loop.
+
+write_incremental() fingerprints every SlideModel (its ops, every field of the
+theme and render_cache.renderer_version(), the digest of the renderer's
+sources and packages) and keeps the fingerprints in a manifest next to the
+output (<deck>.pptx.slides.json). A manifest written for another theme, even
+one that only differs in a palette color, or by other renderer code means a
+full rebuild.
+On the next run only slides whose fingerprint changed are rendered, in a
+scratch Presentation, and their ppt/slides/slideN.xml parts (and the slide's
+relationships, which name its layout) are swapped into the existing package;
+every other part is copied over as is, without being decompressed and deflated
+again. Decks with Theme.emoji_images or native charts are always rebuilt in
+full: a slide's pictures and charts name parts of the package it was rendered
+in, and a chart's build log can change without its op changing.
+
+    from incremental import write_incremental
+    rebuilt = write_incremental(deck_content.build(spec), 'dark', 'out.pptx')
+"""
+
+import hashlib
+import json
+import os
+import zipfile
+
+from render_cache import renderer_version
+from renderer import new_presentation, render, render_slide
+from theme import get_theme
+from zip_writer import DEFAULT_LEVEL, ZipStream, save
+
+MANIFEST_VERSION = 2
+
+
+def manifest_path(path):
+    return path + '.slides.json'
+
+
+def deck_key(theme):
+    """Hash of what shapes every part of the deck: the whole theme and the renderer version."""
+    return hashlib.sha256(repr((MANIFEST_VERSION, theme.key, renderer_version())).encode('utf-8')).hexdigest()
+
+
+def slide_fingerprint(model, theme):
+    """Hash of everything that decides one slide's XML."""
+    blob = repr((deck_key(theme), model.bg, model.ops))
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def _stamp(path):
+    st = os.stat(path)
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _read_manifest(path):
+    try:
+        with open(manifest_path(path), encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION and manifest.get('stamp') == _stamp(path):
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def _write_manifest(path, theme, fingerprints, charts):
+    manifest = {'version': MANIFEST_VERSION, 'theme': theme.name, 'deck': deck_key(theme), 'charts': charts,
+                'stamp': _stamp(path), 'slides': fingerprints}
+    with open(manifest_path(path), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+
+
+def _replace_parts(path, parts, level=DEFAULT_LEVEL):
+    """Rewrite the zip at *path* with *parts* ({partname: bytes}) swapped in."""
+    tmp = f'{path}.{os.getpid()}.tmp'
+    with zipfile.ZipFile(path) as src, open(tmp, 'wb') as fp:
+        dst = ZipStream(fp, level)
+        for info in src.infolist():
+            data = parts.get(info.filename)
+            if data is None:
+                dst.copy(src, info)  # unchanged parts keep their compressed bytes
+            else:
+                dst.write(info.filename, data)
+        dst.close()
+    os.replace(tmp, path)
+
+
+def write_incremental(slides, theme, path, level=DEFAULT_LEVEL):
+    """Save *slides* (a list of SlideModel) to *path*, re-rendering only what changed.
+
+    Returns the 0-based indices of the slides that were rendered; a full build (no
+    usable manifest, any change to the theme or the renderer, another slide count, emoji images
+    or charts) returns all of them.
+    """
+    theme = get_theme(theme)
+    slides = list(slides)
+    fingerprints = [slide_fingerprint(m, theme) for m in slides]
+    charts = any(op[0] == 'chart' for m in slides for op in m.ops)
+    manifest = _read_manifest(path) if os.path.exists(path) else None
+
+    # The theme and the renderer also shape presentation.xml, the master and the layouts, which are
+    # copied as is; emoji pictures and charts add parts
+    if (manifest is None or manifest['deck'] != deck_key(theme) or len(manifest['slides']) != len(slides)
+            or theme.emoji_images or charts or manifest['charts']):
+        save(render(slides, theme), path, level)
+        _write_manifest(path, theme, fingerprints, charts)
+        return list(range(len(slides)))
+
+    changed = [i for i, (old, new) in enumerate(zip(manifest['slides'], fingerprints)) if old != new]
+    if changed:
+        scratch = new_presentation(theme)
+        parts = {}
+        for i in changed:
+            part = render_slide(scratch, slides[i], theme).part
+            parts[f'ppt/slides/slide{i + 1}.xml'] = part.blob
+            parts[f'ppt/slides/_rels/slide{i + 1}.xml.rels'] = part.rels.xml
+        _replace_parts(path, parts, level)
+        _write_manifest(path, theme, fingerprints, charts)
+    return changed
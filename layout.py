@@ -0,0 +1,108 @@
+"""
+Batched grid/flow layout in NumPy.
+
+A grid is n cells laid out row-major in `cols` columns from an origin with a
+fixed pitch; a flow row is a grid with one row. solve_grids() places the cells
+of any number of grids (a slide, a deck, or thousands of decks) in one
+vectorized pass and returns EMU arrays; find_overlaps() and out_of_bounds()
+validate the resulting boxes in bulk.
+
+    xy, offsets = solve_grids(n=[6, 5], cols=[3, 5], x0=[Inches(0.6)] * 2, y0=[Inches(1.8), Inches(2)],
+                              dx=[Inches(4.1), Inches(2.3)], dy=[Inches(2.5), 0])
+    xy[offsets[0]:offsets[1]]  # (6, 2) lefts/tops of the first grid
+
+The slide size lives here too. Importing this module is cheap (numpy is
+imported by the functions that use it), so the renderer and lint.py take
+SLIDE_W/SLIDE_H from here without pulling in each other's dependencies.
+"""
+
+SLIDE_W = 12191695  # Inches(13.333), 16:9
+SLIDE_H = 6858000   # Inches(7.5)
+MARGIN = 548640  # Inches(0.6), the decks' left/right margin
+
+
+def _col(values, g):
+    import numpy as np
+
+    a = np.asarray(values, dtype=np.int64)
+    return np.broadcast_to(a, (g,)) if a.ndim == 0 else a
+
+
+def cell_pitch(cols, gutter, margin=MARGIN, width=SLIDE_W):
+    """Cell width and pitch so *cols* cells with *gutter* between them fill width - 2 * margin."""
+    import numpy as np
+
+    cols, gutter = np.asarray(cols, dtype=np.int64), np.asarray(gutter, dtype=np.int64)
+    cell = (width - 2 * margin - (cols - 1) * gutter) // np.maximum(cols, 1)
+    return cell, cell + gutter
+
+
+def solve_grids(n, cols, x0, y0, dx, dy):
+    """Place the cells of G grids at once.
+
+    Every argument is a length-G sequence (or a scalar shared by all grids):
+    item counts, columns (0 = all in one row), origins and pitches in EMU.
+    Returns (xy, offsets): xy is an (N, 2) int64 array of cell lefts/tops for
+    all grids concatenated, and grid g owns xy[offsets[g]:offsets[g + 1]].
+    """
+    import numpy as np
+
+    n = np.asarray(n, dtype=np.int64)
+    g = len(n)
+    cols = _col(cols, g)
+    cols = np.where(cols > 0, cols, np.maximum(n, 1))
+    offsets = np.zeros(g + 1, dtype=np.int64)
+    np.cumsum(n, out=offsets[1:])
+
+    owner = np.repeat(np.arange(g), n)
+    i = np.arange(offsets[-1]) - offsets[owner]     # index within its grid
+    c = cols[owner]
+    xy = np.empty((len(i), 2), dtype=np.int64)
+    xy[:, 0] = _col(x0, g)[owner] + (i % c) * _col(dx, g)[owner]
+    xy[:, 1] = _col(y0, g)[owner] + (i // c) * _col(dy, g)[owner]
+    return xy, offsets
+
+
+def find_overlaps(boxes, groups):
+    """Pairs of boxes in the same group whose interiors intersect.
+
+    *boxes* is an (N, 4) array of [left, top, width, height], *groups* an (N,)
+    array (e.g. the slide index). All groups are checked in one broadcast over
+    a (G, M, M) block, M being the largest group. Returns a (K, 2) array of
+    indices into *boxes*, i < j.
+    """
+    import numpy as np
+
+    boxes = np.asarray(boxes, dtype=np.int64)
+    groups = np.asarray(groups)
+    if len(boxes) < 2:
+        return np.empty((0, 2), dtype=np.int64)
+    order = np.argsort(groups, kind='stable')
+    keys, start, counts = np.unique(groups[order], return_index=True, return_counts=True)
+    m = counts.max()
+    slot = np.arange(len(order)) - np.repeat(start, counts)
+    row = np.repeat(np.arange(len(keys)), counts)
+
+    # (G, M, 4) with empty slots as zero-size boxes, which never overlap
+    block = np.zeros((len(keys), m, 4), dtype=np.int64)
+    block[row, slot] = boxes[order]
+    index = np.full((len(keys), m), -1, dtype=np.int64)
+    index[row, slot] = order
+
+    l, t = block[..., 0], block[..., 1]
+    r, b = l + block[..., 2], t + block[..., 3]
+    hit = ((l[:, :, None] < r[:, None, :]) & (l[:, None, :] < r[:, :, None])
+           & (t[:, :, None] < b[:, None, :]) & (t[:, None, :] < b[:, :, None]))
+    hit &= np.triu(np.ones((m, m), dtype=bool), 1)
+    gi, a, b_ = np.nonzero(hit)
+    pairs = np.stack([index[gi, a], index[gi, b_]], axis=1)
+    return np.sort(pairs, axis=1)
+
+
+def out_of_bounds(boxes, width=SLIDE_W, height=SLIDE_H):
+    """Boolean mask of boxes that leave the slide."""
+    import numpy as np
+
+    boxes = np.asarray(boxes, dtype=np.int64)
+    return ((boxes[:, 0] < 0) | (boxes[:, 1] < 0)
+            | (boxes[:, 0] + boxes[:, 2] > width) | (boxes[:, 1] + boxes[:, 3] > height))
@@ -0,0 +1,296 @@
+"""
+Lint generated decks for off-slide shapes, collisions and overflowing text.
+
+Slide XML is read straight out of the .pptx zip with lxml (no python-pptx
+object model). Per slide, shape bounding boxes are swept left to right in
+sorted order, keeping an active list of boxes whose x-range is still open, so
+only boxes that overlap horizontally are compared. Two boxes collide when
+they intersect and neither contains the other (text sitting on its card is
+fine). Text is measured with text_fit: a frame overflows when its wrapped
+text would not fit even after the shrink text_fit.fit() would apply, and
+text boxes take part in the collision and off-slide checks with the extent
+of their wrapped text rather than their (often generous) frame.
+
+    python lint.py decks_out -j 8            # every .pptx below decks_out
+    python lint.py deck.pptx --format jsonl
+
+Results stream out as each deck finishes. Exit status is 1 if any deck has an
+error (shape off the slide), or any issue at all with --strict.
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from lxml import etree
+
+from layout import SLIDE_H, SLIDE_W
+import text_fit
+
+NS = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+SHAPES = {f'{{{NS["p"]}}}{tag}' for tag in ('sp', 'pic', 'cxnSp', 'graphicFrame', 'grpSp')}
+SLIDE_PART = re.compile(r'ppt/slides/slide(\d+)\.xml$')
+SLIDE_SIZE = re.compile(rb'<p:sldSz[^>]*\bcx="(\d+)"[^>]*\bcy="(\d+)"')
+SLIDE_LAYOUT = re.compile(rb'Target="\.\./slideLayouts/(slideLayout\d+\.xml)"')
+
+TOLERANCE = 12700  # 1pt: touching edges and rounding are not collisions
+BOTTOM_INSET = int(text_fit.INSET_Y / 2 * text_fit.EMU_PER_PT)
+_A_T, _A_BR, _A_R = ('{%s}%s' % (NS['a'], tag) for tag in ('t', 'br', 'r'))
+SEVERITY = {'offslide': 'error', 'collision': 'warning', 'text-overflow': 'warning'}
+
+
+# ── Reading shapes ──
+
+class Box:
+    __slots__ = ('name', 'l', 't', 'r', 'b', 'text')
+
+    def __init__(self, name, l, t, w, h, text):
+        self.name, self.l, self.t, self.r, self.b, self.text = name, l, t, l + w, t + h, text
+
+    def contains(self, o):
+        return (self.l - TOLERANCE <= o.l and self.t - TOLERANCE <= o.t
+                and o.r <= self.r + TOLERANCE and o.b <= self.b + TOLERANCE)
+
+
+def text_levels(presentation_xml):
+    """{level: (sz, bold, {space element: centipoints})} of the deck's default text style (see text_styles.py)."""
+    style = etree.fromstring(presentation_xml).find('p:defaultTextStyle', NS)
+    levels = {}
+    for n in range(9):
+        lvl = style.find(f'a:lvl{n + 1}pPr', NS) if style is not None else None
+        if lvl is not None:
+            levels[str(n)] = _level(lvl)
+    return levels
+
+
+def layout_placeholders(layout_xml):
+    """{(ph type, idx): (x, y, cx, cy, levels)} of a slide layout's placeholders (see slide_master.py);
+    their first-level text style is level '0' of levels, as in text_levels()."""
+    placeholders = {}
+    for sp in etree.fromstring(layout_xml).iterfind('p:cSld/p:spTree/p:sp', NS):
+        ph = sp.find('p:nvSpPr/p:nvPr/p:ph', NS)
+        off = sp.find('p:spPr/a:xfrm/a:off', NS)
+        if ph is None or off is None:
+            continue
+        ext = off.getnext()
+        lvl = sp.find('p:txBody/a:lstStyle/a:lvl1pPr', NS)
+        placeholders[ph.get('type', 'obj'), ph.get('idx', '0')] = (
+            int(off.get('x')), int(off.get('y')), int(ext.get('cx')), int(ext.get('cy')),
+            {'0': _level(lvl)} if lvl is not None else {})
+    return placeholders
+
+
+def _level(lvl):
+    rpr = lvl.find('a:defRPr', NS)
+    return (int(rpr.get('sz', 0)) if rpr is not None else 0, rpr is not None and rpr.get('b') == '1',
+            _spacing(lvl))
+
+
+def _spacing(pPr):
+    return {pts.getparent().tag: int(pts.get('val')) for pts in pPr.iterfind('*/a:spcPts', NS)}
+
+
+def _text_frame(el, levels=None):
+    """(text, size pt, bold, para_space pt) of a shape's text, or None.
+
+    Paragraphs that name a list level take its size, bold and spacing from
+    *levels* (see text_levels()) unless they override them.
+    """
+    body = el.find('p:txBody', NS)
+    if body is None:
+        return None
+    bodyPr = body.find('a:bodyPr', NS)
+    if bodyPr is not None and (bodyPr.get('wrap') == 'none' or bodyPr.find('a:normAutofit', NS) is not None):
+        return None
+    paras, size, bold, space = [], 0, False, 0
+    for p in body.iterfind('a:p', NS):
+        paras.append(''.join('\n' if el.tag == _A_BR else el.text or '' for el in p.iter(_A_T, _A_BR)))
+        pPr = p.find('a:pPr', NS)
+        p_size, p_bold, p_space = (levels or {}).get('0' if pPr is None else pPr.get('lvl', '0'), (0, False, {}))
+        ppr_rpr = p.find('a:pPr/a:defRPr', NS)
+        if ppr_rpr is not None:
+            p_size = int(ppr_rpr.get('sz', p_size))
+            p_bold = ppr_rpr.get('b', '1' if p_bold else '0') == '1'
+        for rpr in p.iterfind('a:r/a:rPr', NS):
+            p_size = max(p_size, int(rpr.get('sz', 0)))
+            p_bold = p_bold or rpr.get('b') == '1'
+        if pPr is not None:
+            p_space = dict(p_space, **_spacing(pPr))
+        size, bold, space = max(size, p_size), bold or p_bold, max(space, sum(p_space.values()))
+    text = '\n'.join(paras)
+    if not text.strip():
+        return None
+    return text, (size or 1800) / 100, bold, space / 100
+
+
+def read_slides(path):
+    """Yield (slide number, [Box]) for each slide of a .pptx, plus the slide size first.
+
+    Placeholders without a position of their own take position and text style from their layout.
+    """
+    with zipfile.ZipFile(path) as z:
+        presentation = z.read('ppt/presentation.xml')
+        m = SLIDE_SIZE.search(presentation)
+        yield (int(m.group(1)), int(m.group(2))) if m else (SLIDE_W, SLIDE_H)
+        levels = text_levels(presentation)
+        layouts = {}  # layout part -> layout_placeholders()
+        parts = sorted((int(m.group(1)), name) for name in z.namelist() if (m := SLIDE_PART.match(name)))
+        for number, name in parts:
+            root = etree.fromstring(z.read(name))
+            tree = root.find('p:cSld/p:spTree', NS)
+            placeholders = None
+            boxes = []
+            for el in tree:
+                if el.tag not in SHAPES:
+                    continue
+                off = el.find('*/a:xfrm/a:off', NS)
+                if off is None:
+                    off = el.find('p:xfrm/a:off', NS)
+                if off is not None:
+                    ext = off.getnext()
+                    x, y, cx, cy = int(off.get('x')), int(off.get('y')), int(ext.get('cx')), int(ext.get('cy'))
+                    shape_levels = levels
+                else:
+                    ph = el.find('p:nvSpPr/p:nvPr/p:ph', NS)
+                    if ph is None:
+                        continue
+                    if placeholders is None:
+                        placeholders = _slide_placeholders(z, name, layouts)
+                    inherited = placeholders.get((ph.get('type', 'obj'), ph.get('idx', '0')))
+                    if inherited is None:
+                        continue
+                    x, y, cx, cy, shape_levels = inherited
+                cNvPr = el[0][0]  # p:nvSpPr (nvPicPr, ...) / p:cNvPr
+                boxes.append(Box(cNvPr.get('name') or el.tag.split('}')[1], x, y, cx, cy,
+                                 _text_frame(el, shape_levels)))
+            yield number, boxes
+
+
+def _slide_placeholders(z, slide_part, layouts):
+    try:
+        m = SLIDE_LAYOUT.search(z.read(slide_part.replace('slides/', 'slides/_rels/') + '.rels'))
+    except KeyError:
+        return {}
+    if m is None:
+        return {}
+    layout = 'ppt/slideLayouts/' + m.group(1).decode()
+    if layout not in layouts:
+        layouts[layout] = layout_placeholders(z.read(layout))
+    return layouts[layout]
+
+
+# ── Checks ──
+
+def sweep_pairs(boxes):
+    """Pairs of boxes whose interiors intersect, by a sorted sweep over left edges."""
+    active, pairs = [], []
+    for box in sorted(boxes, key=lambda b: b.l):
+        active = [a for a in active if a.r - TOLERANCE > box.l]
+        for a in active:
+            if a.t < box.b - TOLERANCE and box.t < a.b - TOLERANCE:
+                pairs.append((a, box))
+        active.append(box)
+    return pairs
+
+
+def text_overflows(box):
+    text, size, bold, space = box.text
+    fitted, _ = text_fit.fit(text, box.r - box.l, box.b - box.t, size, bold=bold, para_space=space)
+    return fitted < size
+
+
+def text_bottom(box):
+    """Bottom edge of the wrapped text of a (top-anchored) text box."""
+    text, size, bold, space = box.text
+    return box.t + text_fit.text_height(text, size, box.r - box.l, bold=bold, para_space=space) - BOTTOM_INSET
+
+
+def lint_deck(path):
+    """List of issues {'path', 'slide', 'kind', 'severity', 'message'} for one deck."""
+    issues = []
+
+    def issue(slide, kind, message):
+        issues.append({'path': path, 'slide': slide, 'kind': kind, 'severity': SEVERITY[kind], 'message': message})
+
+    try:
+        slides = read_slides(path)
+        width, height = next(slides)
+        for number, boxes in slides:
+            for box in boxes:
+                if box.text:
+                    # Text that fits is drawn within its frame; overflowing text spills below it
+                    if text_overflows(box):
+                        issue(number, 'text-overflow', f'{box.name}: text likely exceeds its frame '
+                              f'({box.text[0][:40]!r})')
+                        box.b = max(box.b, text_bottom(box))
+                    else:
+                        box.b = min(box.b, text_bottom(box))
+                if box.l < -TOLERANCE or box.t < -TOLERANCE or box.r > width + TOLERANCE or box.b > height + TOLERANCE:
+                    issue(number, 'offslide', f'{box.name} extends past the slide '
+                          f'({box.r / 914400:.2f}x{box.b / 914400:.2f}in > {width / 914400:.2f}x{height / 914400:.2f}in)')
+            for a, b in sweep_pairs(boxes):
+                if not (a.contains(b) or b.contains(a)):
+                    issue(number, 'collision', f'{a.name} overlaps {b.name}')
+    except (OSError, KeyError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        issues.append({'path': path, 'slide': None, 'kind': 'unreadable', 'severity': 'error', 'message': str(e)})
+    return issues
+
+
+def iter_decks(paths):
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, files in os.walk(path):
+                for name in sorted(files):
+                    if name.endswith('.pptx'):
+                        yield os.path.join(root, name)
+        else:
+            yield path
+
+
+def lint_many(paths, jobs=1):
+    """Yield (path, issues) per deck, in input order, as soon as each deck is linted."""
+    if jobs > 1:
+        decks = list(iter_decks(paths))
+        with ProcessPoolExecutor(jobs) as pool:
+            yield from zip(decks, pool.map(lint_deck, decks, chunksize=16))
+    else:
+        for path in iter_decks(paths):
+            yield path, lint_deck(path)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Lint generated decks for overflow, collisions and text overflow.')
+    ap.add_argument('paths', nargs='+', help='.pptx files or directories of them')
+    ap.add_argument('-j', '--jobs', type=int, default=1, help='worker processes (0 = all cores, default 1)')
+    ap.add_argument('--format', choices=['text', 'jsonl'], default='text')
+    ap.add_argument('--strict', action='store_true', help='fail on warnings too')
+    args = ap.parse_args(argv)
+
+    decks = failed = 0
+    counts = {}
+    for path, issues in lint_many(args.paths, args.jobs or os.cpu_count()):
+        decks += 1
+        for i in issues:
+            counts[i['severity']] = counts.get(i['severity'], 0) + 1
+            if args.format == 'jsonl':
+                print(json.dumps(i, ensure_ascii=False))
+            else:
+                print(f"{i['path']}:{i['slide']}: {i['severity']}: {i['kind']}: {i['message']}")
+        if any(i['severity'] == 'error' or args.strict for i in issues):
+            failed += 1
+        sys.stdout.flush()
+
+    summary = ', '.join(f'{n} {sev}s' for sev, n in sorted(counts.items())) or 'no issues'
+    print(f'{"❌" if failed else "✅"} {decks} decks linted: {summary}', file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Streaming mail merge: one deck per row of an employee roster.
+
+A roster is a CSV file with a header row, or JSONL with one object per line.
+Each column names a variable of the deck (see deck_content): "name" replaces
+the presenter's name on the title and closing slides, and a dotted column
+replaces one entry of a list variable, so "stat_data.0.0" is the first
+title-slide number ('2') and "stat_data.0.1" its label. A column named after
+a whole list variable takes it as JSON. Empty cells keep the deck's value.
+A "build_data" column names the person's build log, charted on the results
+slide in place of the impact banners (see charts.py).
+
+    name,stat_data.0.0,stat_data.1.0,stat_data.2.0
+    A. Person,4,5+,80%
+
+    python deck_engine.py roster.csv -o out --theme dark --theme white -j 8
+    python deck_engine.py roster.jsonl -o out --deck q3_compact --direct-xml --progress 1000
+
+    stats = mail_merge.merge('roster.csv', 'out', ['dark'], jobs=4)
+
+The roster is read lazily, a row at a time, and every row is checked
+against the slide fields it fills before it is rendered. A row that fails
+is reported with its line number and skipped. Valid rows go straight into
+deck_engine.render_iter(), which keeps a bounded number of them in flight.
+Only each row's output file name is kept, to reject a later row that would
+overwrite an earlier row's decks (the same name, or one that differs only in
+characters a file name drops, like "A. Person" and "A Person"); memory grows
+by a few dozen bytes a row however long the roster is.
+"""
+
+import copy
+import csv
+import json
+import os
+import sys
+import time
+
+import deck_content
+from deck_engine import output_name, render_iter
+from zip_writer import DEFAULT_LEVEL
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+ROSTER_FORMATS = ('.csv', '.jsonl', '.ndjson')
+
+
+class RosterError(ValueError):
+    """A roster file cannot be read at all (unknown format, no header)."""
+
+
+# ── Reading ──
+
+def read_roster(path):
+    """Yield (line number, {column: value}) for every row of a .csv or .jsonl roster, one at a time."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        with open(path, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            if reader.fieldnames is None:
+                raise RosterError(f'{path}: empty roster, expected a header row')
+            for row in reader:
+                yield reader.line_num, row
+    elif ext in ROSTER_FORMATS:
+        with open(path, encoding='utf-8') as f:
+            for line_num, line in enumerate(f, 1):
+                if line.strip():
+                    try:
+                        row = json.loads(line)
+                    except ValueError as e:
+                        row = {None: f'not JSON: {e}'}
+                    if not isinstance(row, dict):
+                        row = {None: 'a roster line must be a JSON object'}
+                    yield line_num, row
+    else:
+        raise RosterError(f'{path}: unsupported roster format {ext!r}, expected one of {ROSTER_FORMATS}')
+
+
+def _leaf(old, value, key):
+    """(value, problem): *value* for a roster cell replacing *old*, numbers taken as text where *old* is text."""
+    if isinstance(old, str) and isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value), None
+    if isinstance(old, list) != isinstance(value, list) or isinstance(old, str) != isinstance(value, str):
+        return None, f'column {key!r} should be a {type(old).__name__}, got {type(value).__name__}'
+    return value, None
+
+
+def _set(value, path, leaf, key):
+    """Replace the entry of nested lists *value* at index *path* with *leaf*; returns a problem or None."""
+    for n, step in enumerate(path):
+        if not isinstance(value, list):
+            return f'column {key!r}: {".".join([key.split(".")[0], *path[:n]])} is not a list'
+        try:
+            i = int(step)
+        except ValueError:
+            return f'column {key!r}: {step!r} is not an index'
+        if not 0 <= i < len(value):
+            return f'column {key!r}: index {i} out of range, the deck has {len(value)}'
+        if n == len(path) - 1:
+            leaf, problem = _leaf(value[i], leaf, key)
+            if problem:
+                return problem
+            value[i] = leaf
+        else:
+            value = value[i]
+    return None
+
+
+def row_spec(row, deck='q3'):
+    """(per-person spec, problems) for one roster row against *deck*; the spec is None if there are problems."""
+    defaults = deck_content.defaults(deck)
+    spec, problems = {}, []
+    for key, value in row.items():
+        if key is None:  # CSV cells beyond the header, or a JSONL line that is not an object
+            problems.append(value if isinstance(value, str) else f'{len(value)} more cell(s) than the header row')
+            continue
+        if value is None or value == '':
+            continue
+        var, *path = str(key).split('.')
+        if var not in defaults:
+            problems.append(f'unknown column {key!r}, expected a variable of deck {deck!r}: {sorted(defaults)}')
+            continue
+        if path:
+            problem = _set(spec.setdefault(var, copy.deepcopy(defaults[var])), path, value, key)
+            if problem:
+                problems.append(problem)
+            continue
+        if isinstance(defaults[var], list) and isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except ValueError:
+                problems.append(f'column {key!r} must hold a JSON list')
+                continue
+        value, problem = _leaf(defaults[var], value, key)
+        if problem:
+            problems.append(problem)
+            continue
+        spec[var] = value
+    if not problems:
+        problems = deck_content.validate(spec, deck)
+    return (None if problems else spec), problems
+
+
+def valid_specs(path, deck='q3', on_error=None):
+    """Yield the spec of every valid row of the roster at *path*, lazily.
+
+    A row whose decks would have the same file names as an earlier row's is
+    invalid. For each invalid row, on_error(line number, problems) is called
+    if given.
+    """
+    seen = {}  # output file name -> line number of the row that claimed it
+    for line_num, row in read_roster(path):
+        spec, problems = row_spec(row, deck)
+        if spec is not None:
+            name = output_name(spec, deck=deck)
+            if name in seen:
+                spec, problems = None, [f'duplicate name: line {seen[name]} already writes {name}']
+            else:
+                seen[name] = line_num
+        if spec is None:
+            if on_error is not None:
+                on_error(line_num, problems)
+            continue
+        yield spec
+
+
+def peak_rss_mb():
+    """Peak resident set size of this process and of its largest finished child, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    scale = 1 if sys.platform == 'darwin' else 1024  # ru_maxrss is bytes on macOS, KB elsewhere
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale
+    child = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale
+    return own / (1 << 20), child / (1 << 20)
+
+
+# ── Merging ──
+
+def merge(path, out_dir, themes='dark', jobs=1, deck='q3', incremental=False, level=DEFAULT_LEVEL, window=None,
+          profile=None, on_error=None, progress=None, stream=False):
+    """Render one deck per valid row of the roster at *path* into *out_dir* (see deck_engine.render_iter).
+
+    Returns {'rows', 'rendered', 'invalid', 'decks', 'seconds'}. *on_error*
+    is called as on_error(line number, problems) for each invalid row, and
+    *progress* (if given) as progress(stats) after every rendered row.
+    """
+    stats = {'rows': 0, 'rendered': 0, 'invalid': 0, 'decks': 0, 'seconds': 0.0}
+
+    def rejected(line_num, problems):
+        stats['invalid'] += 1
+        if on_error is not None:
+            on_error(line_num, problems)
+
+    start = time.perf_counter()
+    for paths, _, _ in render_iter(valid_specs(path, deck, rejected), out_dir, themes, jobs, deck, incremental,
+                                   level, profile, window, stream):
+        stats['rendered'] += 1
+        stats['decks'] += len(paths)
+        stats['seconds'] = time.perf_counter() - start
+        if progress is not None:
+            progress(stats)
+    stats['rows'] = stats['rendered'] + stats['invalid']
+    stats['seconds'] = time.perf_counter() - start
+    return stats
@@ -0,0 +1,180 @@
+"""
+Direct OOXML writer for the renderer's primitives.
+
+python-pptx builds every shape through proxy objects: each `p.font.size`,
+`p.font.color.rgb` or `shape.fill.fore_color.rgb` assignment walks and edits
+the element tree one child at a time. ShapeWriter formats the same `<p:sp>`
+markup (rounded rectangle, text box, multiline text box, picture, chart frame) from string
+templates instead, and parses all shapes of a slide in one lxml call when it
+is flushed. The XML is the same as python-pptx's, down to shape ids, names and
+attribute order, so decks written either way serialize to identical bytes.
+
+    writer = ShapeWriter(slide)
+    writer.text(left, top, w, h, 'Hello', 18, RGBColor(0xFF, 0xFF, 0xFF), False, PP_ALIGN.LEFT, 'Calibri')
+    writer.flush()
+
+Select it for a whole render with Theme.direct_xml (deck_engine --direct-xml).
+With Theme.text_styles, paragraphs refer to the deck's shared text styles
+(see text_styles.py) the same way the python-pptx path writes them, and with
+Theme.slide_master header text fills layout placeholders (see slide_master.py),
+with Theme.emoji_images emoji become pictures (see emoji_images.py), and chart
+frames refer to the deck's shared chart parts (see charts.py).
+"""
+
+import re
+from xml.sax.saxutils import escape, quoteattr
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+import text_styles
+
+_EXTLST = qn('p:extLst')
+_CTRL = re.compile(r'[\x00-\x08\x0B-\x1F]')
+_BREAK = re.compile('\n|\v')
+
+_NVSPPR = '<p:nvSpPr><p:cNvPr id="{id}" name="{name} {n}"/><p:cNvSpPr{box}/><p:nvPr/></p:nvSpPr>'
+_XFRM = '<a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></a:xfrm>'
+_RECT_STYLE = (
+    '<p:style><a:lnRef idx="1"><a:schemeClr val="accent1"/></a:lnRef>'
+    '<a:fillRef idx="3"><a:schemeClr val="accent1"/></a:fillRef>'
+    '<a:effectRef idx="2"><a:schemeClr val="accent1"/></a:effectRef>'
+    '<a:fontRef idx="minor"><a:schemeClr val="lt1"/></a:fontRef></p:style>'
+    '<p:txBody><a:bodyPr rtlCol="0" anchor="ctr"/><a:lstStyle/><a:p><a:pPr algn="ctr"/></a:p></p:txBody>'
+)
+_NO_LINE = '<a:ln><a:noFill/></a:ln>'
+_LINE = '<a:ln w="12700"><a:solidFill><a:srgbClr val="{}"/></a:solidFill></a:ln>'
+_PH_NVSPPR = ('<p:nvSpPr><p:cNvPr id="{id}" name="{name} {n}"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+              '<p:nvPr>{ph}</p:nvPr></p:nvSpPr><p:spPr/>')
+_PIC = ('<p:pic><p:nvPicPr><p:cNvPr id="{id}" name="Picture {n}" descr={descr}/><p:cNvPicPr>'
+        '<a:picLocks noChangeAspect="1"/></p:cNvPicPr><p:nvPr/></p:nvPicPr><p:blipFill><a:blip r:embed="{rId}"/>'
+        '<a:stretch><a:fillRect/></a:stretch></p:blipFill><p:spPr>' + _XFRM
+        + '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom></p:spPr></p:pic>')
+_CHART = ('<p:graphicFrame><p:nvGraphicFramePr><p:cNvPr id="{id}" name="Chart {n}"/><p:cNvGraphicFramePr>'
+          '<a:graphicFrameLocks noGrp="1"/></p:cNvGraphicFramePr><p:nvPr/></p:nvGraphicFramePr><p:xfrm>'
+          '<a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/></p:xfrm><a:graphic>'
+          '<a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/chart">'
+          '<c:chart xmlns:c="http://schemas.openxmlformats.org/drawingml/2006/chart" r:id="{rId}"/>'
+          '</a:graphicData></a:graphic></p:graphicFrame>')
+_TEXT_SPPR = '<a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+_PPR = ('<a:pPr algn="{algn}"><a:spcBef><a:spcPts val="{before}"/></a:spcBef>'
+        '<a:spcAft><a:spcPts val="{after}"/></a:spcAft>'
+        '<a:defRPr sz="{sz}" b="{b}"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+        '<a:latin typeface={font}/></a:defRPr></a:pPr>')
+
+
+def _centipoints(emu):
+    return int(emu) // 127
+
+
+def _styled_ppr(styles, size, color, bold, align, font, before, after):
+    """`a:pPr` naming a text_styles level plus only the properties that differ from it."""
+    level, (o_size, o_bold, o_color, o_font, o_align, o_before, o_after) = text_styles.match(
+        styles, size, color, bold, align, font, before, after)
+    attrs = (' lvl="%d"' % level if level else '') + (' algn="%s"' % align.xml_value if o_align else '')
+    children = ('<a:spcBef><a:spcPts val="%d"/></a:spcBef>' % _centipoints(before) if o_before else '') + (
+        '<a:spcAft><a:spcPts val="%d"/></a:spcAft>' % _centipoints(after) if o_after else '')
+    rpr_attrs = (' sz="%d"' % _centipoints(size * 12700) if o_size else '') + (
+        ' b="%d"' % bool(bold) if o_bold else '')
+    rpr = ('<a:solidFill><a:srgbClr val="%s"/></a:solidFill>' % (color,) if o_color else '') + (
+        '<a:latin typeface=%s/>' % quoteattr(font) if o_font else '')
+    if rpr:
+        children += '<a:defRPr%s>%s</a:defRPr>' % (rpr_attrs, rpr)
+    elif rpr_attrs:
+        children += '<a:defRPr%s/>' % rpr_attrs
+    return '<a:pPr%s>%s</a:pPr>' % (attrs, children) if children else '<a:pPr%s/>' % attrs
+
+
+def _runs(text):
+    """`a:r`/`a:br` markup for *text*, as python-pptx's _Paragraph.text setter writes it."""
+    out = []
+    for i, part in enumerate(_BREAK.split(text)):
+        if i:
+            out.append('<a:br/>')
+        if part:
+            out.append('<a:r><a:t>%s</a:t></a:r>' % escape(_CTRL.sub(lambda m: '_x%04X_' % ord(m.group()), part)))
+    return ''.join(out)
+
+
+class ShapeWriter:
+    """Collects shape XML for one python-pptx slide; flush() appends it to the slide's spTree."""
+
+    def __init__(self, slide):
+        self.slide = slide
+        self.next_id = slide.shapes._next_shape_id
+        self.parts = []
+
+    def _open(self, name, box, left, top, w, h):
+        shape_id = self.next_id
+        self.next_id += 1
+        self.parts.append('<p:sp>' + _NVSPPR.format(id=shape_id, name=name, n=shape_id - 1, box=box)
+                          + '<p:spPr>' + _XFRM.format(x=int(left), y=int(top), cx=int(w), cy=int(h)))
+
+    def rect(self, left, top, w, h, fill, border=None, radius=None):
+        """Rounded rectangle; colors are RGBColor, *radius* the corner adjustment (0-1)."""
+        self._open('Rounded Rectangle', '', left, top, w, h)
+        av = '<a:avLst/>' if radius is None else '<a:avLst><a:gd name="adj" fmla="val %d"/></a:avLst>' % int(
+            radius * 100000.0)
+        self.parts.append('<a:prstGeom prst="roundRect">%s</a:prstGeom><a:solidFill><a:srgbClr val="%s"/>'
+                          '</a:solidFill>%s</p:spPr>%s</p:sp>'
+                          % (av, fill, _LINE.format(border) if border else _NO_LINE, _RECT_STYLE))
+
+    def text(self, left, top, w, h, text, size, color, bold, align, font, styles=None):
+        """Single-paragraph text box (word wrap on, no autofit); *styles* are text_styles.levels() to refer to."""
+        self._open('TextBox', ' txBox="1"', left, top, w, h)
+        if styles is not None:
+            ppr = _styled_ppr(styles, size, color, bold, align, font, 0, 0)
+        else:
+            ppr = _PPR.format(algn=align.xml_value, before=0, after=0, sz=_centipoints(size * 12700),
+                              b=int(bool(bold)), color=color, font=quoteattr(font))
+        self.parts.append('%s<p:txBody><a:bodyPr wrap="square"/><a:lstStyle/><a:p>%s%s</a:p></p:txBody></p:sp>'
+                          % (_TEXT_SPPR, ppr, _runs(text)))
+
+    def multiline(self, left, top, w, h, lines, size, color, spacing, font, align, bold, styles=None):
+        """One paragraph per line, *spacing* (EMU) before each and 2pt after."""
+        self._open('TextBox', ' txBox="1"', left, top, w, h)
+        if styles is not None:
+            ppr = _styled_ppr(styles, size, color, bold, align, font, spacing, 2 * 12700)
+        else:
+            ppr = _PPR.format(algn=align.xml_value, before=_centipoints(spacing), after=_centipoints(2 * 12700),
+                              sz=_centipoints(size * 12700), b=int(bool(bold)), color=color,
+                              font=quoteattr(font))
+        paras = ''.join('<a:p>%s%s</a:p>' % (ppr, _runs(line)) for line in lines) or '<a:p/>'
+        self.parts.append('%s<p:txBody><a:bodyPr wrap="square"><a:spAutoFit/></a:bodyPr><a:lstStyle/>%s'
+                          '</p:txBody></p:sp>' % (_TEXT_SPPR, paras))
+
+    def placeholder(self, slot, text, size, color, bold, align, font):
+        """Fill a layout placeholder (slide_master.Slot): its text plus the formatting that differs from the slot."""
+        shape_id = self.next_id
+        self.next_id += 1
+        self.parts.append('<p:sp>%s<p:txBody><a:bodyPr/><a:lstStyle/><a:p>%s%s</a:p></p:txBody></p:sp>' % (
+            _PH_NVSPPR.format(id=shape_id, name=slot.base_name, n=shape_id - 1, ph=slot.ph_xml),
+            _styled_ppr((slot.style,), size, color, bold, align, font, 0, 0), _runs(text)))
+
+    def picture(self, left, top, w, h, rId, descr):
+        """Picture of the image part related to the slide as *rId*, with *descr* as its alt text."""
+        shape_id = self.next_id
+        self.next_id += 1
+        self.parts.append(_PIC.format(id=shape_id, n=shape_id - 1, descr=quoteattr(descr), rId=rId,
+                                      x=int(left), y=int(top), cx=int(w), cy=int(h)))
+
+    def chart(self, left, top, w, h, rId):
+        """Graphic frame showing the chart part related to the slide as *rId*."""
+        shape_id = self.next_id
+        self.next_id += 1
+        self.parts.append(_CHART.format(id=shape_id, n=shape_id - 1, rId=rId, x=int(left), y=int(top), cx=int(w),
+                                        cy=int(h)))
+
+    def flush(self):
+        """Parse the collected shapes in one go and append them to the slide."""
+        if not self.parts:
+            return
+        tree = parse_xml('<p:spTree %s>%s</p:spTree>' % (nsdecls('a', 'p', 'r'), ''.join(self.parts)))
+        self.parts = []
+        spTree = self.slide.shapes._spTree
+        ext = spTree.find(_EXTLST)
+        for el in list(tree):
+            if ext is None:
+                spTree.append(el)
+            else:
+                ext.addprevious(el)
@@ -0,0 +1,193 @@
+"""
+Fast-starting command line for the review decks.
+
+Only the standard library is imported up front. The project modules are
+imported by the command that needs them, and python-pptx, lxml and numpy
+only when a deck is actually rendered: --help, validate and render cache hits
+never load them, and finish in well under 100 ms.
+
+    python ppt.py render person.json -o deck.pptx --theme white   # cached in .render_cache
+    python ppt.py render -o deck.pptx --no-cache                  # bundled content, always rendered
+    python ppt.py validate person.json people.json --deck q3_compact
+    python ppt.py validate decks/q3.json                          # a whole deck spec
+    python ppt.py --profile-startup render person.json -o deck.pptx
+
+--profile-startup prints, on stderr, where the run's time went: every module
+imported after startup with its self and cumulative import time (like
+python -X importtime, slowest first), then the command's time, the part of
+it spent importing, and the process's total wall and CPU time.
+"""
+
+import argparse
+import builtins
+import json
+import sys
+import time
+
+START = time.perf_counter()
+
+CACHE_DIR = '.render_cache'  # render_cache.CACHE_DIR
+DEFAULT_LEVEL = 6            # zip_writer.DEFAULT_LEVEL
+
+
+# ── Startup profile ──
+
+class ImportProfile:
+    """Times every import statement that loads a new module while active.
+
+    Wraps builtins.__import__, so nested imports are attributed to the
+    module that triggered them: self time excludes them, cumulative includes
+    them (the two columns of python -X importtime).
+    """
+
+    def __init__(self):
+        self.records = []   # (module, self seconds, cumulative seconds, depth)
+        self._stack = []
+        self._import = None
+
+    def __enter__(self):
+        self._import = builtins.__import__
+        builtins.__import__ = self._timed
+        return self
+
+    def __exit__(self, *exc):
+        builtins.__import__ = self._import
+
+    def _timed(self, name, globals=None, locals=None, fromlist=(), level=0):
+        if level or name in sys.modules:
+            return self._import(name, globals, locals, fromlist, level)
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            return self._import(name, globals, locals, fromlist, level)
+        finally:
+            total = time.perf_counter() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += total
+            self.records.append((name, total - nested, total, len(self._stack)))
+
+    def report(self, command_s, top=20, file=sys.stderr):
+        imported = sum(total for _, _, total, depth in self.records if depth == 0)
+        print(f'{"self ms":>9} {"cumulative ms":>14}  module', file=file)
+        for name, own, total, depth in sorted(self.records, key=lambda r: -r[2])[:top]:
+            print(f'{own * 1000:9.1f} {total * 1000:14.1f}  {"  " * depth}{name}', file=file)
+        if len(self.records) > top:
+            print(f'{"":9} {"":14}  ... {len(self.records) - top} more', file=file)
+        print(f'\ncommand {command_s * 1000:.1f} ms, of which imports {imported * 1000:.1f} ms '
+              f'({len(self.records)} modules); ppt.py {(time.perf_counter() - START) * 1000:.1f} ms wall, '
+              f'process {time.process_time() * 1000:.1f} ms CPU including interpreter startup; '
+              f'pptx imported: {"pptx" in sys.modules}', file=file)
+
+
+# ── Commands ──
+
+def _read_json(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def cmd_render(args):
+    import render_cache
+
+    start = time.perf_counter()
+    try:
+        spec = _read_json(args.spec) if args.spec else None
+        data, how = _render(args, spec, render_cache)
+    except json.JSONDecodeError as e:
+        print(f'❌ {args.spec}: {e}')
+        return 1
+    except (OSError, ValueError) as e:  # missing spec file, unknown theme/deck, bad spec values (deck_spec.SpecError)
+        print(f'❌ {e}')
+        return 1
+    with open(args.output, 'wb') as f:
+        f.write(data)
+    print(f'✅ {args.output}  ({how}, {(time.perf_counter() - start) * 1000:.1f} ms)')
+    return 0
+
+
+def _render(args, spec, render_cache):
+    if args.no_cache:
+        from dataclasses import replace
+
+        from deck_engine import render_bytes
+        from theme import get_theme
+
+        theme = replace(get_theme(args.theme), fit_text=args.fit, direct_xml=True)
+        return render_bytes(spec, theme, args.deck, args.level), 'rendered'
+    cache = render_cache.RenderCache(args.cache_dir, int(args.cache_mb * (1 << 20)))
+    data = render_cache.render_cached(spec, args.theme, args.deck, args.level, args.fit, cache)
+    return data, 'cache hit' if cache.misses == 0 else 'rendered, cached'
+
+
+def cmd_validate(args):
+    """Per-person specs (an object or a list of them) against --deck, or whole deck specs."""
+    import deck_content
+    import deck_spec
+
+    if args.deck not in deck_content.DECKS:
+        print(f'❌ unknown deck {args.deck!r}, expected one of {sorted(deck_content.DECKS)}')
+        return 1
+    failed = 0
+    for path in args.specs:
+        try:
+            data = deck_spec.load_spec(path) if not path.endswith('.json') else _read_json(path)
+        except (OSError, ValueError) as e:
+            print(f'❌ {path}: {e}')
+            failed += 1
+            continue
+        if isinstance(data, dict) and 'slides' in data:
+            checks = [('deck spec', deck_spec.validate_spec(data))]
+        else:
+            people = data if isinstance(data, list) else [data]
+            checks = [(f'spec {i}' if isinstance(data, list) else 'spec', deck_content.validate(spec, args.deck))
+                      for i, spec in enumerate(people)]
+        bad = [(label, problems) for label, problems in checks if problems]
+        if bad:
+            failed += 1
+            for label, problems in bad:
+                for problem in problems:
+                    print(f'❌ {path}: {label}: {problem}')
+        else:
+            what = checks[0][0] if len(checks) == 1 else f'{len(checks)} specs'
+            print(f'✅ {path}: {what} OK' + ('' if what == 'deck spec' else f' for deck {args.deck!r}'))
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Render and check Q3 review decks (fast startup).')
+    ap.add_argument('--profile-startup', action='store_true',
+                    help='report import and startup times on stderr (like python -X importtime)')
+    sub = ap.add_subparsers(dest='command', required=True)
+
+    r = sub.add_parser('render', help='render one deck, through the render cache')
+    r.add_argument('spec', nargs='?', help='JSON file holding one per-person spec (default: the bundled content)')
+    r.add_argument('-o', '--output', required=True, help='where to write the .pptx')
+    r.add_argument('--theme', default='dark')
+    r.add_argument('--deck', default='q3')
+    r.add_argument('--level', type=int, choices=range(10), default=DEFAULT_LEVEL, metavar='0-9',
+                   help='zip compression level (default 6)')
+    r.add_argument('--fit', action='store_true', help='shrink text that would overflow its box')
+    r.add_argument('--cache-dir', default=CACHE_DIR)
+    r.add_argument('--cache-mb', type=float, default=512, help='disk budget of the render cache (default 512)')
+    r.add_argument('--no-cache', action='store_true', help='always render, bypassing the cache')
+    r.set_defaults(run=cmd_render)
+
+    v = sub.add_parser('validate', help='check specs without rendering them')
+    v.add_argument('specs', nargs='+', help='per-person specs (object or list) or deck specs (.json, .yaml, .toml)')
+    v.add_argument('--deck', default='q3', help='deck that per-person specs are checked against (default q3)')
+    v.set_defaults(run=cmd_validate)
+
+    args = ap.parse_args(argv)
+    if not args.profile_startup:
+        return args.run(args)
+    with ImportProfile() as profile:
+        start = time.perf_counter()
+        try:
+            return args.run(args)
+        finally:
+            profile.report(time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
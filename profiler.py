@@ -0,0 +1,209 @@
+"""
+Per-stage timing of deck builds: call counts and cumulative times, optionally a Chrome trace.
+
+While a Profiler is active, the build stages (content plan, new presentation,
+each slide, background, text fitting, XML flush, save) and every draw helper
+(add_rect, add_text, add_multiline, add_card, add_flow_step,
+add_banner_item) are swapped for timed wrappers; leaving it puts the
+original functions back. Nothing is wrapped otherwise, so builds pay nothing
+for the instrumentation when it is off, and a sampling rate bounds its cost
+when it stays on in production.
+
+    from profiler import Profiler
+    prof = Profiler(trace=True)
+    with prof:
+        deck_engine.write_deck('deck.pptx', {'name': 'A. Person'})
+    prof.write_report('profile.json')   # {stage: {count, total_ms, self_ms, mean_us}, ...}
+    prof.write_trace('trace.json')      # open in chrome://tracing or ui.perfetto.dev
+
+    python deck_engine.py people.json -o out --profile profile.json --trace trace.json
+    python deck_engine.py people.json -o out -j 8 --profile profile.json --profile-sample 0.01
+
+Stage times are inclusive ('total'); 'self' excludes nested stages, e.g. a
+card's own time without the add_rect/add_text calls it makes.
+"""
+
+import functools
+import json
+import os
+import random
+import threading
+import time
+
+# (module, attribute, stage): module-level functions swapped while profiling.
+# Modules that import a stage by name keep their own binding, so those are listed too.
+STAGES = (
+    ('deck_content', 'build', 'plan'),
+    ('renderer', 'new_presentation', 'new_presentation'),
+    ('renderer', 'render_slide', 'slide'),
+    ('incremental', 'new_presentation', 'new_presentation'),
+    ('incremental', 'render_slide', 'slide'),
+    ('streaming', 'new_presentation', 'new_presentation'),
+    ('streaming', 'render_slide', 'slide'),
+    ('renderer', 'set_bg', 'set_bg'),
+    ('renderer', 'fit_op', 'fit_text'),
+    ('emoji_images', 'png', 'emoji_png'),
+    ('charts', 'dataset', 'chart_data'),
+    ('zip_writer', 'write_package', 'save'),
+    ('incremental', '_replace_parts', 'save'),
+    ('streaming', 'write_parts', 'save'),   # a call per slide written, plus one for the parts left at the end
+)
+HELPERS = ('add_rect', 'add_text', 'add_multiline', 'add_placeholder', 'add_emoji', 'add_chart', 'add_card',
+           'add_flow_step', 'add_banner_item')
+
+_active = None
+_lock = threading.Lock()
+
+
+class Profiler:
+    """Aggregated stage timings over one or more profiled builds.
+
+    Use it as a context manager around a build; with *rate* < 1 each entry
+    is profiled with that probability and otherwise runs uninstrumented.
+    Snapshots from other processes can be folded in with merge().
+    """
+
+    def __init__(self, trace=False, rate=1.0):
+        self.trace = trace
+        self.rate = rate
+        self.runs = self.sampled = 0
+        self.wall = 0.0
+        self.stats = {}          # stage -> [count, total seconds, self seconds]
+        self.events = []         # (stage, start seconds, duration seconds, pid, tid) when tracing
+        self._stack = []
+        self._undo = None
+        self._start = None
+
+    # ── Activation ──
+
+    def __enter__(self):
+        global _active
+        self.runs += 1
+        if self.rate < 1 and random.random() >= self.rate:
+            return self
+        with _lock:
+            if _active is not None:
+                raise RuntimeError('another Profiler is already active')
+            _active = self
+        self.sampled += 1
+        self._undo = self._install()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        if self._undo is None:
+            return
+        self.wall += time.perf_counter() - self._start
+        for undo in reversed(self._undo):
+            undo()
+        self._undo = None
+        with _lock:
+            _active = None
+
+    def _install(self):
+        import importlib
+
+        import ooxml
+        import renderer
+
+        undo = []
+
+        def swap(owner, key, stage, wrap=self._wrap):
+            get, put = (owner.get, owner.__setitem__) if isinstance(owner, dict) else \
+                       (functools.partial(getattr, owner), functools.partial(setattr, owner))
+            original = get(key)
+            put(key, wrap(stage, original))
+            undo.append(lambda: put(key, original))
+
+        for module, attr, stage in STAGES:
+            module = importlib.import_module(module)
+            swap(module, attr, stage, self._wrap_slide if stage == 'slide' else self._wrap)
+        for name in HELPERS:
+            swap(renderer, name, name)
+        # render_slide dispatches through these tables, which hold their own references
+        for kind, fn in renderer.HELPERS.items():
+            swap(renderer.HELPERS, kind, fn.__name__)
+        for kind, fn in renderer.DIRECT_HELPERS.items():
+            swap(renderer.DIRECT_HELPERS, kind, fn.__name__)
+        swap(ooxml.ShapeWriter, 'flush', 'xml_flush')
+        return undo
+
+    # ── Wrappers ──
+
+    def _record(self, stage, start, total):
+        stack = self._stack
+        nested = stack.pop()
+        if stack:
+            stack[-1] += total
+        entry = self.stats.get(stage)
+        if entry is None:
+            entry = self.stats[stage] = [0, 0.0, 0.0]
+        entry[0] += 1
+        entry[1] += total
+        entry[2] += total - nested
+        if self.trace:
+            self.events.append((stage, start, total, os.getpid(), threading.get_ident()))
+
+    def _wrap(self, stage, fn):
+        @functools.wraps(fn)
+        def timed(*args, **kwargs):
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._record(stage, start, time.perf_counter() - start)
+        return timed
+
+    def _wrap_slide(self, stage, fn):
+        """render_slide(prs, model, theme), recorded per slide position ('slide 01', ...)."""
+        @functools.wraps(fn)
+        def timed(prs, *args, **kwargs):
+            name = f'{stage} {len(prs.slides) + 1:02d}'
+            self._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                return fn(prs, *args, **kwargs)
+            finally:
+                self._record(name, start, time.perf_counter() - start)
+        return timed
+
+    # ── Results ──
+
+    def snapshot(self):
+        """Plain, picklable state of this profiler (see merge())."""
+        return {'runs': self.runs, 'sampled': self.sampled, 'wall': self.wall,
+                'stats': self.stats, 'events': self.events}
+
+    def merge(self, snapshot):
+        """Fold in the snapshot() of another profiler, e.g. from a worker process."""
+        self.runs += snapshot['runs']
+        self.sampled += snapshot['sampled']
+        self.wall += snapshot['wall']
+        for stage, (count, total, own) in snapshot['stats'].items():
+            entry = self.stats.setdefault(stage, [0, 0.0, 0.0])
+            entry[0] += count
+            entry[1] += total
+            entry[2] += own
+        self.events.extend(snapshot['events'])
+
+    def report(self):
+        """JSON-ready summary: runs, sampled runs, profiled wall time and per-stage timings."""
+        stages = {stage: {'count': count, 'total_ms': round(total * 1000, 3), 'self_ms': round(own * 1000, 3),
+                          'mean_us': round(total / count * 1e6, 1)}
+                  for stage, (count, total, own) in sorted(self.stats.items(), key=lambda kv: -kv[1][2])}
+        return {'runs': self.runs, 'sampled': self.sampled, 'wall_ms': round(self.wall * 1000, 3),
+                'stages': stages}
+
+    def write_report(self, path):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+    def write_trace(self, path):
+        """Write the recorded spans as Chrome trace-event JSON (complete 'X' events, microseconds)."""
+        events = [{'name': stage, 'cat': stage.split()[0], 'ph': 'X', 'ts': round(start * 1e6, 3),
+                   'dur': round(total * 1e6, 3), 'pid': pid, 'tid': tid}
+                  for stage, start, total, pid, tid in self.events]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
@@ -0,0 +1,227 @@
+"""
+Content-addressed cache of finished .pptx files.
+
+Reviewers often download the same deck (same person, theme and quarter)
+again and again. render_cached() keys each deck by a hash of the normalized
+spec, theme, deck, compression level and text fitting, plus a renderer
+version: a digest of the modules that shape the output, the bundled deck
+specs and the installed python-pptx/lxml. Editing any of those invalidates
+old entries without a manual version bump; so does rewriting a build log a
+spec charts (see charts.py), whose size and mtime are part of the key.
+
+Finished bytes live on disk (<dir>/<key[:2]>/<key>.pptx), size-bounded with
+least-recently-used eviction (a hit refreshes the file's mtime, so recency
+survives restarts and is shared by processes using the same directory), and
+in a small in-memory hot tier. This module only uses the standard library:
+a hit returns without importing python-pptx, numpy or any of the renderer;
+they are imported on the first miss.
+
+    from render_cache import RenderCache, render_cached
+    cache = RenderCache('.render_cache', max_bytes=512 << 20)
+    data = render_cached({'name': 'A. Person'}, 'white', cache=cache)
+    cache.stats()   # {'hot_hits': ..., 'disk_hits': ..., 'misses': ..., 'evictions': ...}
+
+    python render_cache.py person.json -o deck.pptx --theme white --stats
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from importlib.util import find_spec
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = '.render_cache'
+DEFAULT_LEVEL = 6  # zip_writer.DEFAULT_LEVEL, repeated so this module imports nothing heavy
+
+# Everything whose contents can change the bytes of a rendered deck
+RENDER_SOURCES = ('charts.py', 'deck_content.py', 'deck_engine.py', 'deck_spec.py', 'emoji_images.py', 'layout.py',
+                  'ooxml.py', 'renderer.py', 'slide_cache.py', 'slide_master.py', 'text_fit.py', 'text_styles.py',
+                  'theme.py', 'zip_writer.py')
+RENDER_PACKAGES = ('pptx', 'lxml')
+# Deck variables naming data files read at render time
+DATA_VARS = ('build_data',)
+
+_version = None
+
+
+def renderer_version():
+    """Digest of the renderer sources, bundled decks and package versions (computed once per process)."""
+    global _version
+    if _version is None:
+        h = hashlib.sha256()
+        deck_dir = os.path.join(HERE, 'decks')
+        files = [os.path.join(HERE, name) for name in RENDER_SOURCES]
+        files += [os.path.join(deck_dir, name) for name in sorted(os.listdir(deck_dir))]
+        files += [spec.origin for spec in map(find_spec, RENDER_PACKAGES) if spec is not None]  # __version__
+        for path in files:
+            h.update(path.encode() + b'\0')
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        _version = h.hexdigest()[:16]
+    return _version
+
+
+def _data_stamps(spec):
+    """[size, mtime] of each data file *spec* names (None where it names none or the file is missing)."""
+    stamps = []
+    for var in DATA_VARS:
+        path = (spec or {}).get(var)
+        try:
+            st = os.stat(path) if isinstance(path, str) and path else None
+        except OSError:
+            st = None
+        stamps.append(st and [st.st_size, st.st_mtime_ns])
+    return stamps
+
+
+def cache_key(spec=None, theme='dark', deck='q3', level=DEFAULT_LEVEL, fit=False):
+    """Hex key for one deck; *spec* is normalized (key order, whitespace) before hashing."""
+    payload = json.dumps([renderer_version(), spec or {}, theme, deck, level, bool(fit), _data_stamps(spec)],
+                         sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class RenderCache:
+    """Disk LRU of .pptx bytes bounded by *max_bytes*, fronted by an in-memory tier of *hot_bytes*."""
+
+    def __init__(self, directory=CACHE_DIR, max_bytes=512 << 20, hot_bytes=32 << 20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hot_bytes = hot_bytes
+        self.hot_hits = self.disk_hits = self.misses = self.evictions = self.hot_evictions = 0
+        self._hot = OrderedDict()   # key -> bytes, least recent first
+        self._hot_size = 0
+        self._index = None          # key -> size on disk, least recent first (built on first write)
+        self._disk_size = 0
+
+    def path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.pptx')
+
+    def _scan(self):
+        """Index the files already on disk, oldest mtime first."""
+        entries = []
+        if os.path.isdir(self.directory):
+            for sub in os.scandir(self.directory):
+                if sub.is_dir():
+                    for f in os.scandir(sub.path):
+                        if f.name.endswith('.pptx'):
+                            st = f.stat()
+                            entries.append((st.st_mtime_ns, f.name[:-5], st.st_size))
+        self._index = OrderedDict((key, size) for _, key, size in sorted(entries))
+        self._disk_size = sum(self._index.values())
+
+    def _remember(self, key, data):
+        if len(data) > self.hot_bytes:
+            return
+        old = self._hot.pop(key, None)
+        self._hot_size += len(data) - (len(old) if old is not None else 0)
+        self._hot[key] = data
+        while self._hot_size > self.hot_bytes:
+            _, dropped = self._hot.popitem(last=False)
+            self._hot_size -= len(dropped)
+            self.hot_evictions += 1
+
+    def get(self, key):
+        """Cached bytes for *key*, or None."""
+        data = self._hot.get(key)
+        if data is not None:
+            self._hot.move_to_end(key)
+            self.hot_hits += 1
+            return data
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.disk_hits += 1
+        if self._index is not None and key in self._index:
+            self._index.move_to_end(key)
+        self._remember(key, data)
+        return data
+
+    def put(self, key, data):
+        """Store *data* under *key*, then evict least recently used files beyond max_bytes."""
+        if self._index is None:
+            self._scan()
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f'{path}.{os.getpid()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._disk_size += len(data) - self._index.pop(key, 0)
+        self._index[key] = len(data)
+        self._remember(key, data)
+        while self._disk_size > self.max_bytes and len(self._index) > 1:
+            old, size = self._index.popitem(last=False)
+            self._disk_size -= size
+            self.evictions += 1
+            self._hot_size -= len(self._hot.pop(old, b''))
+            try:
+                os.remove(self.path(old))
+            except FileNotFoundError:
+                pass
+
+    def stats(self):
+        if self._index is None:
+            self._scan()
+        return {'hot_hits': self.hot_hits, 'disk_hits': self.disk_hits, 'misses': self.misses,
+                'evictions': self.evictions, 'hot_evictions': self.hot_evictions,
+                'entries': len(self._index), 'disk_bytes': self._disk_size,
+                'hot_entries': len(self._hot), 'hot_bytes': self._hot_size}
+
+
+def render_cached(spec=None, theme='dark', deck='q3', level=DEFAULT_LEVEL, fit=False, cache=None):
+    """.pptx bytes for *spec* in theme *theme* (a name), rendered only on a cache miss."""
+    cache = cache if cache is not None else RenderCache()
+    key = cache_key(spec, theme, deck, level, fit)
+    data = cache.get(key)
+    if data is None:
+        from dataclasses import replace
+
+        from deck_engine import render_bytes
+        from theme import get_theme
+
+        data = render_bytes(spec, replace(get_theme(theme), fit_text=fit, direct_xml=True), deck, level)
+        cache.put(key, data)
+    return data
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Render one deck through the content-addressed cache.')
+    ap.add_argument('spec', nargs='?', help='JSON file holding one deck spec (default: the bundled content)')
+    ap.add_argument('-o', '--output', required=True, help='where to write the .pptx')
+    ap.add_argument('--theme', default='dark')
+    ap.add_argument('--deck', default='q3')
+    ap.add_argument('--level', type=int, default=DEFAULT_LEVEL, help='zip compression level 0-9')
+    ap.add_argument('--fit', action='store_true', help='shrink text that would overflow its box')
+    ap.add_argument('--cache-dir', default=CACHE_DIR)
+    ap.add_argument('--max-mb', type=float, default=512, help='disk budget of the cache (default 512)')
+    ap.add_argument('--stats', action='store_true', help='print cache counters as JSON to stderr')
+    args = ap.parse_args(argv)
+
+    spec = None
+    if args.spec:
+        with open(args.spec, encoding='utf-8') as f:
+            spec = json.load(f)
+    cache = RenderCache(args.cache_dir, int(args.max_mb * (1 << 20)))
+    start = time.perf_counter()
+    data = render_cached(spec, args.theme, args.deck, args.level, args.fit, cache)
+    with open(args.output, 'wb') as f:
+        f.write(data)
+    hit = cache.misses == 0
+    print(f'✅ {args.output}  ({"cache hit" if hit else "rendered"}, {(time.perf_counter() - start) * 1000:.1f} ms, '
+          f'pptx imported: {"pptx" in sys.modules})')
+    if args.stats:
+        print(json.dumps(cache.stats()), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
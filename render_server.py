@@ -0,0 +1,310 @@
+"""
+HTTP rendering service: POST a deck spec, get the .pptx back.
+
+A small asyncio HTTP/1.1 server (standard library only, keep-alive aware).
+Rendering is CPU-bound, so each request is queued and handed to a
+ProcessPoolExecutor of warm workers (see deck_engine._init_worker). At most
+--jobs renders run at once, and at most --queue more wait their turn; past
+that the server answers 503 with Retry-After instead of piling up work.
+
+    python render_server.py --port 8000 -j 4 --queue 64
+
+    curl -X POST 'localhost:8000/render?theme=white' -d '{"name": "A. Person"}' -o deck.pptx
+
+The request body is one deck spec (a JSON object, see deck_content), sent
+with a Content-Length (chunked bodies get 501); a spec deck_content.validate
+rejects gets 400 with its messages. Query
+parameters: theme, deck, level (zip compression 0-9) and fit=1. Decks are
+written with the direct XML backend (byte-identical to python-pptx, see
+ooxml.py). With --cache-dir, repeated requests are answered from a
+content-addressed cache without touching the queue (see render_cache.py).
+GET /health returns queue, request and cache counters as JSON.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import re
+import signal
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import replace
+from urllib.parse import parse_qs, quote, urlsplit
+
+import deck_content
+from deck_engine import _init_worker, output_name, render_bytes
+from render_cache import RenderCache, cache_key
+from theme import THEMES
+from zip_writer import DEFAULT_LEVEL
+
+PPTX_TYPE = 'application/vnd.openxmlformats-officedocument.presentationml.presentation'
+MAX_BODY = 1 << 20
+CHUNK = 1 << 16
+LINGER = 2.0  # seconds to discard an unread request body before closing
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           413: 'Payload Too Large', 500: 'Internal Server Error', 501: 'Not Implemented',
+           503: 'Service Unavailable'}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _render_job(job):
+    spec, theme, deck, level = job
+    return render_bytes(spec, theme, deck, level)
+
+
+def content_disposition(filename):
+    """An attachment header for *filename* that stays Latin-1: an ASCII fallback plus the UTF-8 name (RFC 6266)."""
+    fallback = re.sub(r'[^ -~]|["\\]', '_', filename)
+    header = f'Content-Disposition: attachment; filename="{fallback}"'
+    if fallback != filename:
+        header += f"; filename*=UTF-8''{quote(filename, safe='')}"
+    return header
+
+
+def parse_job(query, body):
+    """(spec, theme, deck, level) from the query string and JSON body of a /render request."""
+    params = {k: v[-1] for k, v in parse_qs(query).items()}
+    try:
+        spec = json.loads(body or b'{}')
+    except ValueError as e:
+        raise HTTPError(400, f'body is not valid JSON: {e}') from None
+    if not isinstance(spec, dict):
+        raise HTTPError(400, 'body must be a JSON object (one deck spec)')
+    name, deck = params.get('theme', 'dark'), params.get('deck', 'q3')
+    if name not in THEMES:
+        raise HTTPError(400, f'unknown theme {name!r}, expected one of {sorted(THEMES)}')
+    if deck not in deck_content.DECKS:
+        raise HTTPError(400, f'unknown deck {deck!r}, expected one of {sorted(deck_content.DECKS)}')
+    problems = deck_content.validate(spec, deck)
+    if problems:
+        raise HTTPError(400, '; '.join(problems))
+    level = params.get('level', str(DEFAULT_LEVEL))
+    if level not in set('0123456789'):
+        raise HTTPError(400, f'level must be 0-9, got {level!r}')
+    theme = replace(THEMES[name], direct_xml=True, fit_text=params.get('fit') in ('1', 'true'))
+    return spec, theme, deck, int(level)
+
+
+class RenderService:
+    """Bounded render queue in front of a process pool.
+
+    Render cache lookups and writes touch the disk, so they run on one
+    background thread (which also keeps RenderCache single-threaded) rather
+    than on the event loop.
+    """
+
+    def __init__(self, jobs=1, queue_size=64, cache=None):
+        self.jobs = jobs
+        self.cache = cache
+        self.queue = asyncio.Queue(queue_size)
+        self.pool = ProcessPoolExecutor(jobs, initializer=_init_worker)
+        self.io = ThreadPoolExecutor(1, thread_name_prefix='render-cache')
+        self.stats = {'served': 0, 'rejected': 0, 'failed': 0, 'busy': 0}
+        self._dispatchers = []
+
+    def start(self):
+        # Fork the workers now: a client socket open when they fork would stay open in them after we close it
+        self.pool.submit(int)
+        self._dispatchers = [asyncio.create_task(self._dispatch()) for _ in range(self.jobs)]
+
+    async def close(self):
+        for task in self._dispatchers:
+            task.cancel()
+        self.pool.shutdown(cancel_futures=True)
+        self.io.shutdown(cancel_futures=True)
+
+    async def _dispatch(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            job, future = await self.queue.get()
+            if future.cancelled():  # client went away while queued
+                continue
+            self.stats['busy'] += 1
+            try:
+                result = await loop.run_in_executor(self.pool, _render_job, job)
+            except Exception as e:
+                if not future.cancelled():
+                    future.set_exception(e)
+            else:
+                if not future.cancelled():
+                    future.set_result(result)
+            finally:
+                self.stats['busy'] -= 1
+
+    async def render(self, job):
+        """The .pptx bytes for *job*: from the cache, else queued for a worker (HTTPError 503 when full)."""
+        if self.cache is None:
+            return await self._queue(job)
+        loop = asyncio.get_running_loop()
+        spec, theme, deck, level = job
+        key = await loop.run_in_executor(self.io, cache_key, spec, theme.name, deck, level, theme.fit_text)
+        data = await loop.run_in_executor(self.io, self.cache.get, key)
+        if data is None:
+            data = await self._queue(job)
+            await loop.run_in_executor(self.io, self.cache.put, key, data)
+        return data
+
+    async def _queue(self, job):
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((job, future))
+        except asyncio.QueueFull:
+            self.stats['rejected'] += 1
+            raise HTTPError(503, 'render queue is full, retry later') from None
+        return await future
+
+    async def health(self):
+        health = dict(self.stats, queued=self.queue.qsize(), queue_size=self.queue.maxsize, jobs=self.jobs)
+        if self.cache is not None:
+            health['cache'] = await asyncio.get_running_loop().run_in_executor(self.io, self.cache.stats)
+        return health
+
+
+# ── HTTP ──
+
+async def _read_request(reader):
+    """(method, target, headers, body) of the next request, or None at end of stream."""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise HTTPError(400, 'malformed request line') from None
+    headers = {}
+    while (line := await reader.readline()) not in (b'\r\n', b'\n', b''):
+        key, _, value = line.decode('latin-1').partition(':')
+        headers[key.strip().lower()] = value.strip()
+    if 'transfer-encoding' in headers:
+        raise HTTPError(501, 'Transfer-Encoding is not supported, send the body with a Content-Length')
+    length = headers.get('content-length') or '0'
+    if not (length.isascii() and length.isdigit()):  # int() would also take signs, '_' and spaces
+        raise HTTPError(400, f'Content-Length must be a non-negative integer, got {length!r}')
+    length = int(length)
+    if length > MAX_BODY:
+        raise HTTPError(413, f'body larger than {MAX_BODY} bytes')
+    body = await reader.readexactly(length) if length else b''
+    return method, target, headers, body
+
+
+async def _respond(writer, status, body, content_type='application/json', extra=()):
+    head = [f'HTTP/1.1 {status} {REASONS[status]}', f'Content-Type: {content_type}',
+            f'Content-Length: {len(body)}', *extra]
+    writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1'))
+    for i in range(0, len(body), CHUNK):
+        writer.write(body[i:i + CHUNK])
+        await writer.drain()
+    await writer.drain()
+
+
+async def _handle(service, method, target, body):
+    """(status, body, content type, extra headers) for one request."""
+    url = urlsplit(target)
+    if url.path == '/health':
+        return 200, json.dumps(await service.health()).encode(), 'application/json', ()
+    if url.path != '/render':
+        raise HTTPError(404, f'no route for {url.path}')
+    if method != 'POST':
+        raise HTTPError(405, 'use POST /render')
+    job = parse_job(url.query, body)
+    try:
+        data = await service.render(job)
+    except ValueError as e:  # bad spec values (deck_spec.SpecError is a ValueError)
+        raise HTTPError(400, str(e)) from None
+    service.stats['served'] += 1
+    spec, theme, deck, _ = job
+    return 200, data, PPTX_TYPE, (content_disposition(output_name(spec, theme.name, deck)),)
+
+
+async def _linger(reader, writer):
+    """Half-close and discard what the client is still sending before the connection is closed.
+
+    Closing a socket with unread input makes the kernel reset the connection,
+    and a reset can reach the client before it has read our error response.
+    """
+    async def drain():
+        while await reader.read(CHUNK):
+            pass
+    with contextlib.suppress(OSError, asyncio.TimeoutError):
+        writer.write_eof()
+        await asyncio.wait_for(drain(), LINGER)
+
+
+def make_handler(service):
+    async def handle_connection(reader, writer):
+        try:
+            while True:
+                keep_alive, request = True, None
+                try:
+                    request = await _read_request(reader)
+                    if request is None:
+                        break
+                    method, target, headers, body = request
+                    keep_alive = headers.get('connection', '').lower() != 'close'
+                    status, data, ctype, extra = await _handle(service, method, target, body)
+                except HTTPError as e:
+                    status, data, ctype = e.status, json.dumps({'error': str(e)}).encode(), 'application/json'
+                    extra = ('Retry-After: 1',) if e.status == 503 else ()
+                    keep_alive = keep_alive and request is not None  # else the body may be unread
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except Exception as e:
+                    service.stats['failed'] += 1
+                    status, data, ctype, extra = 500, json.dumps({'error': repr(e)}).encode(), 'application/json', ()
+                extra = (*extra, 'Connection: keep-alive' if keep_alive else 'Connection: close')
+                await _respond(writer, status, data, ctype, extra)
+                if not keep_alive:
+                    if request is None:
+                        await _linger(reader, writer)
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+    return handle_connection
+
+
+async def serve(host='127.0.0.1', port=8000, jobs=1, queue_size=64, cache=None):
+    """Run the service until SIGINT/SIGTERM, then shut the worker pool down."""
+    service = RenderService(jobs, queue_size, cache)
+    service.start()
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        with contextlib.suppress(NotImplementedError):  # no signal handlers on Windows event loops
+            loop.add_signal_handler(sig, stop.set)
+    server = await asyncio.start_server(make_handler(service), host, port)
+    addr = server.sockets[0].getsockname()
+    print(f'✅ rendering on http://{addr[0]}:{addr[1]}  (jobs={jobs}, queue={queue_size})', flush=True)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        await service.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description='Serve POST /render: deck spec in, .pptx out.')
+    ap.add_argument('--host', default='127.0.0.1')
+    ap.add_argument('--port', type=int, default=8000, help='0 picks a free port')
+    ap.add_argument('-j', '--jobs', type=int, default=0, help='render worker processes (default: all cores)')
+    ap.add_argument('--queue', type=int, default=64, help='requests allowed to wait for a worker (default 64)')
+    ap.add_argument('--cache-dir', help='serve repeated requests from a render cache in this directory')
+    ap.add_argument('--cache-mb', type=float, default=512, help='disk budget of the render cache (default 512)')
+    args = ap.parse_args(argv)
+    cache = RenderCache(args.cache_dir, int(args.cache_mb * (1 << 20))) if args.cache_dir else None
+    try:
+        asyncio.run(serve(args.host, args.port, args.jobs or os.cpu_count(), args.queue, cache))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    sys.exit(main())
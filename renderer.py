@@ -0,0 +1,337 @@
+"""
+Theme-parameterized slide renderer.
+
+Deck content is described once as a list of SlideModel objects: a background
+role plus draw ops that name colors by palette role. render() replays that
+model onto a fresh Presentation for a given Theme, so several themed variants
+of the same deck share all content and layout work.
+"""
+
+import io
+
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+from pptx.parts.slide import SlidePart
+from pptx.util import Emu, Inches, Pt
+from pptx.enum.text import PP_ALIGN
+from pptx.enum.shapes import MSO_SHAPE
+
+import charts
+import emoji_images
+from layout import SLIDE_H, SLIDE_W
+from ooxml import ShapeWriter
+import slide_master
+import text_styles
+from slide_cache import component
+from text_fit import fit
+from theme import get_theme
+
+
+_template_bytes = None
+
+
+def _template():
+    """Bytes of python-pptx's default.pptx, read from disk once per process."""
+    global _template_bytes
+    if _template_bytes is None:
+        from pptx.api import _default_pptx_path
+        with open(_default_pptx_path(), 'rb') as f:
+            _template_bytes = f.read()
+    return _template_bytes
+
+
+def new_presentation(theme=None):
+    """Return an empty 16:9 Presentation opened from the cached default template.
+
+    With a *theme* that has slide_master, the template's master and layouts
+    are replaced by the generated ones (see slide_master.py); with text_styles,
+    its named text styles are registered in the deck (see text_styles.py).
+    """
+    prs = Presentation(io.BytesIO(_template()))
+    prs.slide_width = SLIDE_W
+    prs.slide_height = SLIDE_H
+    if theme is not None and theme.slide_master:
+        slide_master.apply(prs, theme)
+    if theme is not None and theme.text_styles:
+        text_styles.apply(prs, theme)
+    return prs
+
+
+# ── Primitives ──
+
+def set_bg(slide, color):
+    fill = slide.background.fill
+    fill.solid()
+    fill.fore_color.rgb = color
+
+
+def add_rect(slide, theme, left, top, w, h, fill_color, border_color=None, radius=None):
+    if isinstance(slide, ShapeWriter):
+        return slide.rect(left, top, w, h, theme.color(fill_color), theme.color(border_color), radius)
+    shape = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, left, top, w, h)
+    shape.fill.solid()
+    shape.fill.fore_color.rgb = theme.color(fill_color)
+    if border_color:
+        shape.line.color.rgb = theme.color(border_color)
+        shape.line.width = Pt(1)
+    else:
+        shape.line.fill.background()
+    if radius is not None:
+        shape.adjustments[0] = radius
+    return shape
+
+
+def add_emoji(slide, theme, left, top, w, text, data, font_size, align):
+    """Emoji *text* as a picture of its PNG *data*, where a *font_size* text box would draw the glyph."""
+    x, y, side = emoji_images.place(left, top, w, font_size, align)
+    if isinstance(slide, ShapeWriter):
+        return slide.picture(x, y, side, side, emoji_images.relate(slide.slide.part, data), text)
+    pic = slide.shapes.add_picture(io.BytesIO(data), x, y, side, side)
+    pic._element.nvPicPr.cNvPr.set('descr', text)
+    return pic
+
+
+def add_text(slide, theme, left, top, w, h, text, font_size=18, color='text1', bold=False,
+             align=PP_ALIGN.LEFT, font_name=None):
+    if theme.emoji_images:
+        data = emoji_images.png(text, font_size)
+        if data is not None:
+            return add_emoji(slide, theme, left, top, w, text, data, font_size, align)
+    styles = text_styles.levels(theme) if theme.text_styles else None
+    if isinstance(slide, ShapeWriter):
+        return slide.text(left, top, w, h, text, font_size, theme.color(color), bold, align,
+                          font_name or theme.font, styles)
+    txBox = slide.shapes.add_textbox(left, top, w, h)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    tf.auto_size = None
+    p = tf.paragraphs[0]
+    p.text = text
+    if styles is not None:
+        text_styles.style_paragraph(p, styles, font_size, theme.color(color), bold, align,
+                                    font_name or theme.font, Pt(0), Pt(0))
+        return txBox
+    p.font.size = Pt(font_size)
+    p.font.color.rgb = theme.color(color)
+    p.font.bold = bold
+    p.font.name = font_name or theme.font
+    p.alignment = align
+    p.space_before = Pt(0)
+    p.space_after = Pt(0)
+    return txBox
+
+
+def add_multiline(slide, theme, left, top, w, h, lines, font_size=14, color='text2',
+                  spacing=Pt(6), font_name=None, align=PP_ALIGN.LEFT, bold=False):
+    """lines is a list of strings."""
+    styles = text_styles.levels(theme) if theme.text_styles else None
+    if isinstance(slide, ShapeWriter):
+        return slide.multiline(left, top, w, h, lines, font_size, theme.color(color), spacing,
+                               font_name or theme.font, align, bold, styles)
+    txBox = slide.shapes.add_textbox(left, top, w, h)
+    tf = txBox.text_frame
+    tf.word_wrap = True
+    for i, line in enumerate(lines):
+        p = tf.paragraphs[0] if i == 0 else tf.add_paragraph()
+        p.text = line
+        if styles is not None:
+            text_styles.style_paragraph(p, styles, font_size, theme.color(color), bold, align,
+                                        font_name or theme.font, spacing, Pt(2))
+            continue
+        p.font.size = Pt(font_size)
+        p.font.color.rgb = theme.color(color)
+        p.font.name = font_name or theme.font
+        p.font.bold = bold
+        p.alignment = align
+        p.space_before = spacing
+        p.space_after = Pt(2)
+    return txBox
+
+
+def add_placeholder(slide, theme, slot, text, font_size=18, color='text1', bold=False, align=PP_ALIGN.LEFT,
+                    font_name=None):
+    """Fill layout placeholder *slot* (see slide_master.py) with what add_text() would draw at its position."""
+    if isinstance(slide, ShapeWriter):
+        return slide.placeholder(slot, text, font_size, theme.color(color), bold, align, font_name or theme.font)
+    slide.shapes.clone_placeholder(slide.slide_layout.placeholders.get(idx=slot.idx))
+    shape = slide.shapes[-1]
+    p = shape.text_frame.paragraphs[0]
+    p.text = text
+    text_styles.style_paragraph(p, (slot.style,), font_size, theme.color(color), bold, align,
+                                font_name or theme.font, Pt(0), Pt(0))
+    return shape
+
+
+def add_chart(slide, theme, left, top, w, h, source, chart='bar', metric='builds', title=None):
+    """Native *chart* ('bar' or 'line') of *metric* aggregated from the build log at *source* (see charts.py)."""
+    rId = charts.relate(slide.slide.part if isinstance(slide, ShapeWriter) else slide.part,
+                        charts.dataset(source, chart, metric), chart, theme, title)
+    if isinstance(slide, ShapeWriter):
+        return slide.chart(left, top, w, h, rId)
+    return slide.shapes._add_chart_graphicFrame(rId, left, top, w, h)
+
+
+# ── Components ──
+
+@component('card', 'emoji', 'title', 'desc')
+def add_card(slide, theme, left, top, w, h, emoji, title, desc, border_color='card_bd', fill_color='card_bg',
+             desc_size=10, title_size=None):
+    ex, ey, eh, esize = theme.card['emoji']
+    tx, ty, tsize = theme.card['title']
+    add_rect(slide, theme, left, top, w, h, fill_color, border_color, 0.04)
+    add_text(slide, theme, left + Inches(ex), top + Inches(ey), w - Inches(2 * ex), Inches(eh),
+             emoji, font_size=esize, align=PP_ALIGN.CENTER)
+    add_text(slide, theme, left + Inches(tx), top + Inches(ty), w - Inches(2 * tx), Inches(0.4),
+             title, font_size=title_size or tsize, bold=True, color='text1', align=PP_ALIGN.CENTER)
+    add_text(slide, theme, left + Inches(tx), top + Inches(theme.card['desc_dy']), w - Inches(2 * tx), Inches(0.8),
+             desc, font_size=desc_size, color='text2', align=PP_ALIGN.CENTER)
+
+
+@component('flow_step', 'emoji', 'title', 'desc')
+def add_flow_step(slide, theme, left, top, emoji, title, desc, show_arrow=True, title_size=10):
+    """Single flow step box."""
+    eh, esize = theme.flow['emoji']
+    arrow_dy, arrow_w = theme.flow['arrow']
+    add_rect(slide, theme, left, top, Inches(1.6), Inches(1.5), 'card_bg', 'card_bd', 0.06)
+    add_text(slide, theme, left, top + Inches(0.1), Inches(1.6), Inches(eh),
+             emoji, font_size=esize, align=PP_ALIGN.CENTER)
+    add_text(slide, theme, left + Inches(0.05), top + Inches(theme.flow['title_dy']), Inches(1.5), Inches(0.35),
+             title, font_size=title_size, bold=True, color='text1', align=PP_ALIGN.CENTER)
+    add_text(slide, theme, left + Inches(0.05), top + Inches(theme.flow['desc_dy']), Inches(1.5), Inches(0.5),
+             desc, font_size=8, color='text3', align=PP_ALIGN.CENTER)
+    if show_arrow:
+        add_text(slide, theme, left + Inches(1.6), top + Inches(arrow_dy), Inches(arrow_w), Inches(0.4),
+                 '→', font_size=18, color='purple', bold=True, align=PP_ALIGN.CENTER)
+
+
+@component('banner_item', 'num', 'label')
+def add_banner_item(slide, theme, left, top, w, num, label, bg_color):
+    add_rect(slide, theme, left, top, w, Inches(1.1), bg_color, radius=0.08)
+    add_text(slide, theme, left, top + Inches(0.1), w, Inches(0.5),
+             num, font_size=30, bold=True, color='white', align=PP_ALIGN.CENTER)
+    add_text(slide, theme, left, top + Inches(0.6), w, Inches(0.4),
+             label, font_size=10, color='banner_label', align=PP_ALIGN.CENTER)
+
+
+HELPERS = {
+    'rect': add_rect,
+    'text': add_text,
+    'multiline': add_multiline,
+    'card': add_card,
+    'flow_step': add_flow_step,
+    'banner_item': add_banner_item,
+    'chart': add_chart,
+}
+# Components without the template cache: cloning saves nothing when shapes are written as XML
+DIRECT_HELPERS = {kind: getattr(fn, '__wrapped__', fn) for kind, fn in HELPERS.items()}
+
+
+# ── Content model ──
+
+class SlideModel:
+    """Theme-independent content of one slide: a background role and draw ops."""
+
+    def __init__(self, bg='bg'):
+        self.bg = bg
+        self.ops = []
+
+    def _op(self, kind, args, kwargs):
+        self.ops.append((kind, args, kwargs))
+
+    def rect(self, *args, **kwargs):
+        self._op('rect', args, kwargs)
+
+    def text(self, *args, **kwargs):
+        self._op('text', args, kwargs)
+
+    def multiline(self, *args, **kwargs):
+        self._op('multiline', args, kwargs)
+
+    def card(self, *args, **kwargs):
+        self._op('card', args, kwargs)
+
+    def flow_step(self, *args, **kwargs):
+        self._op('flow_step', args, kwargs)
+
+    def banner_item(self, *args, **kwargs):
+        self._op('banner_item', args, kwargs)
+
+    def chart(self, *args, **kwargs):
+        self._op('chart', args, kwargs)
+
+
+# ── Text fitting ──
+
+def fit_op(kind, args, kwargs, theme):
+    """Return kwargs with font sizes shrunk so the op's text fits its box."""
+    family = kwargs.get('font_name') or theme.font
+    if kind == 'text' and len(args) == 5:
+        w, h, text = args[2:]
+        size, _ = fit(text, w, h, kwargs.get('font_size', 18), family, kwargs.get('bold', False))
+        return dict(kwargs, font_size=size)
+    if kind == 'multiline' and len(args) == 5:
+        w, h, lines = args[2:]
+        spacing = kwargs.get('spacing', Pt(6))
+        size, _ = fit('\n'.join(lines), w, h, kwargs.get('font_size', 14), family, kwargs.get('bold', False),
+                      para_space=Emu(spacing).pt + 2)
+        return dict(kwargs, font_size=size)
+    if kind == 'card' and len(args) == 7:
+        w, title, desc = args[2], args[5], args[6]
+        tx, _, tsize = theme.card['title']
+        size, _ = fit(desc, w - Inches(2 * tx), Inches(0.8), kwargs.get('desc_size', 10), family)
+        title_size, _ = fit(title, w - Inches(2 * tx), Inches(0.4), kwargs.get('title_size') or tsize, family, True)
+        return dict(kwargs, desc_size=size, title_size=title_size)
+    if kind == 'flow_step' and len(args) == 5:
+        size, _ = fit(args[3], Inches(1.5), Inches(0.35), kwargs.get('title_size', 10), family, True)
+        return dict(kwargs, title_size=size)
+    return kwargs
+
+
+def _add_slide(prs, layout):
+    """prs.slides.add_slide() without cloning the layout's placeholders; add_placeholder() adds those used.
+
+    The slide is related and listed directly: python-pptx's relate_to() and
+    add_sldId() look through every slide already in the deck for a matching
+    relationship or the highest id, which makes building an n-slide deck O(n²).
+    """
+    part, sldIdLst = prs.part, prs.slides._sldIdLst
+    slide_part = SlidePart.new(part._next_slide_partname, part.package, layout.part)
+    rId = part.rels._add_relationship(RT.SLIDE, slide_part)   # a new part, so no existing relationship to reuse
+    sldIdLst._add_sldId(id=int(sldIdLst[-1].get('id')) + 1 if len(sldIdLst) else 256, rId=rId)
+    return slide_part.slide
+
+
+def render_slide(prs, model, theme):
+    """Append one SlideModel to *prs*: a blank-layout slide, or with Theme.slide_master one on the
+    generated layout whose placeholders take the most of its text."""
+    if theme.slide_master:
+        index, slots = slide_master.choose(model)
+        s = _add_slide(prs, prs.slide_layouts[index])
+        slots = {geometry: slide_master.slots(theme)[index][n] for geometry, n in slots.items()}
+        if model.bg != 'bg':  # the master has the theme background
+            set_bg(s, theme.color(model.bg))
+    else:
+        s = _add_slide(prs, prs.slide_layouts[6])  # blank layout: no placeholders to clone
+        set_bg(s, theme.color(model.bg))
+        slots = None
+    target, helpers = (ShapeWriter(s), DIRECT_HELPERS) if theme.direct_xml else (s, HELPERS)
+    for kind, args, kwargs in model.ops:
+        if theme.fit_text:
+            kwargs = fit_op(kind, args, kwargs, theme)
+        slot = slots and kind == 'text' and slots.pop(tuple(args[:4]), None)
+        if slot:
+            add_placeholder(target, theme, slot, args[4], **kwargs)
+        else:
+            helpers[kind](target, theme, *args, **kwargs)
+    if theme.direct_xml:
+        target.flush()
+    return s
+
+
+def render(slides, theme):
+    """Replay a list (or iterator) of SlideModel onto a new Presentation in *theme*."""
+    theme = get_theme(theme)
+    prs = new_presentation(theme)
+    for model in slides:
+        render_slide(prs, model, theme)
+    return prs
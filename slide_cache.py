@@ -0,0 +1,181 @@
+"""
+Prebuilt component templates, reused by cloning their shape XML.
+
+A card, flow step or banner item has the same geometry and styling in every
+deck; only its text changes. The first call of a cached helper builds the
+shapes normally (with placeholder text), keeps a copy of the resulting
+``<p:sp>`` elements, and fills in the real text. Later calls with the same
+archetype and theme deep-copy those elements into the slide's ``spTree`` and
+substitute the text runs, skipping python-pptx's per-property object model.
+
+    @component('card', 'emoji', 'title', 'desc')
+    def add_card(slide, theme, left, top, w, h, emoji, title, desc, border_color='card_bd'):
+        ...
+"""
+
+import copy
+import functools
+import inspect
+import re
+from collections import OrderedDict
+
+from pptx.oxml.ns import qn
+
+import emoji_images
+
+_P = qn('a:p')
+_T = qn('a:t')
+_CNVPR = qn('p:cNvPr')
+_MARK = '\ue000'  # private-use char prefixing placeholder text while a template is built
+_SENTINEL = re.compile('^' + _MARK + r'(\d+)$')
+
+
+class TemplateCache:
+    """LRU cache of component shape XML keyed by (archetype, Theme.key, geometry)."""
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self.enabled = True
+        self.hits = self.misses = self.evictions = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        return {'size': len(self._entries), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+
+CACHE = TemplateCache()
+
+
+def _set_text(p, text):
+    """Replace the runs of an ``a:p`` the way python-pptx's ``_Paragraph.text`` does."""
+    for child in p.content_children:
+        p.remove(child)
+    p.append_text(text)
+
+
+def _renumber(slide, elements):
+    """Give cloned shapes fresh ids (and matching default names) on *slide*."""
+    next_id = slide.shapes._next_shape_id
+    for el in elements:
+        cnvpr = el.find('.//' + _CNVPR)
+        old_id = cnvpr.get('id')
+        cnvpr.set('id', str(next_id))
+        name = cnvpr.get('name')
+        if name.endswith(' %d' % (int(old_id) - 1)):
+            cnvpr.set('name', name.rsplit(' ', 1)[0] + ' %d' % (next_id - 1))
+        next_id += 1
+
+
+def _fill(elements, slots, texts):
+    paragraphs = [list(el.iter(_P)) for el in elements]
+    for locations, text in zip(slots, texts):
+        for ei, pi in locations:
+            _set_text(paragraphs[ei][pi], text)
+
+
+def _build_template(fn, slide, bound, text_params):
+    """Build *fn* with placeholder text and record where each text slot landed."""
+    n = 0
+    for name in text_params:
+        value = bound.arguments[name]
+        if isinstance(value, (list, tuple)):
+            bound.arguments[name] = [_MARK + str(n + i) for i in range(len(value))]
+            n += len(value)
+        else:
+            bound.arguments[name] = _MARK + str(n)
+            n += 1
+
+    spTree = slide.shapes._spTree
+    start = len(spTree)
+    result = fn(*bound.args, **bound.kwargs)
+    elements = list(spTree)[start:]
+
+    slots = [[] for _ in range(n)]
+    for ei, el in enumerate(elements):
+        for pi, p in enumerate(el.iter(_P)):
+            m = _SENTINEL.match(''.join(t.text or '' for t in p.iter(_T)))
+            if m:
+                slots[int(m.group(1))].append((ei, pi))
+    return elements, slots, result
+
+
+def _split(bound, text_params):
+    """Split bound arguments into (geometry key, flat text list)."""
+    key, texts = [], []
+    for name, value in list(bound.arguments.items())[1:]:
+        if name == 'theme':
+            continue
+        if name not in text_params:
+            key.append(tuple(value) if isinstance(value, list) else value)
+        elif isinstance(value, (list, tuple)):
+            key.append(len(value))
+            texts.extend(value)
+        else:
+            texts.append(value)
+    return tuple(key), texts
+
+
+def component(archetype, *text_params, cache=None):
+    """Decorator caching a shape-building helper as an XML template.
+
+    The helper takes (slide, theme, ...). *text_params* name the arguments
+    that only supply text (a list argument yields one slot per item); every
+    other argument except slide and theme is part of the cache key together
+    with (archetype, Theme.key); the whole theme goes in, so two themes that
+    share a name but not a palette or font never share a template. Cache hits
+    return None since no python-pptx shape proxies are created. With Theme.emoji_images, calls passing an emoji drawn as a picture are not cached.
+    """
+    def decorate(fn):
+        sig = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        def wrapper(slide, *args, **kwargs):
+            c = CACHE if cache is None else cache
+            if not c.enabled:
+                return fn(slide, *args, **kwargs)
+            bound = sig.bind(slide, *args, **kwargs)
+            bound.apply_defaults()
+            geometry, texts = _split(bound, text_params)
+            theme = bound.arguments['theme']
+            if theme.emoji_images and any(map(emoji_images.drawable, texts)):
+                return fn(slide, *args, **kwargs)  # emoji drawn as pictures have no text to substitute
+            key = (archetype, theme.key, geometry)
+
+            entry = c.get(key)
+            if entry is None:
+                c.misses += 1
+                elements, slots, result = _build_template(fn, slide, bound, text_params)
+                c.put(key, ([copy.deepcopy(el) for el in elements], slots))
+                _fill(elements, slots, texts)
+                return result
+
+            c.hits += 1
+            templates, slots = entry
+            elements = [copy.deepcopy(el) for el in templates]
+            _renumber(slide, elements)
+            spTree = slide.shapes._spTree
+            for el in elements:
+                spTree.insert_element_before(el, 'p:extLst')
+            _fill(elements, slots, texts)
+            return None
+
+        return wrapper
+    return decorate
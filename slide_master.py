@@ -0,0 +1,188 @@
+"""
+Generated slide master and themed layouts.
+
+Without them every slide uses the template's blank layout, carries its own
+background fill and draws its header text (eyebrow label, title, section
+number, ...) as free text boxes that spell out position and formatting. With
+Theme.slide_master, apply() replaces the template's master and its eleven
+Office layouts with a master holding the theme background and the layouts
+below, whose placeholders hold the position and formatting of those
+recurring header slots. A slide then takes the layout whose slots its text
+ops fill best; an op at a slot's exact position becomes a placeholder that
+carries only its text, plus whatever formatting differs from the slot.
+
+    prs = new_presentation()
+    slide_master.apply(prs, theme)       # renderer.new_presentation(theme) does this itself
+    index, slots = slide_master.choose(model)
+
+Everything else on the slide (cards, panels, badges whose color varies per
+section) is drawn as before. The rendered slides are unchanged.
+"""
+
+from xml.sax.saxutils import escape
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+
+import text_styles
+
+# (name, layout type, slots); slot = (placeholder type, name, at (l, t, w, h) in, size pt, color role, bold, align)
+LAYOUTS = (
+    ('Blank', 'blank', ()),
+    ('Title', 'title', (
+        ('body',     'Eyebrow',   (0.5, 0.8, 12.3, 0.4), 12, 'purple', True,  'ctr'),
+        ('ctrTitle', 'Title',     (1, 1.6, 11.3, 1.5),   44, 'text1',  True,  'ctr'),
+        ('subTitle', 'Subtitle',  (2.5, 3.4, 8.3, 0.8),  16, 'text2',  False, 'ctr'),
+        ('body',     'Presenter', (4, 4.4, 5.3, 0.4),    14, 'text3',  False, 'ctr'),
+    )),
+    ('Section Header', 'secHead', (
+        ('body',  'Number',   (0.6, 0.45, 0.7, 0.65), 22, 'white', True,  'ctr'),
+        ('title', 'Title',    (1.5, 0.4, 8, 0.4),     22, 'text1', True,  'l'),
+        ('body',  'Subtitle', (1.5, 0.85, 8, 0.3),    12, 'text2', False, 'l'),
+    )),
+    # The eyebrow/title/subtitle header above card grids, flows and panels
+    ('Card Grid', 'cust', (
+        ('body',  'Eyebrow',  (0.6, 0.4, 4, 0.3),  11, 'purple', True,  'l'),
+        ('title', 'Title',    (0.6, 0.85, 10, 0.5), 28, 'text1', True,  'l'),
+        ('body',  'Subtitle', (0.6, 1.4, 9, 0.4),  13, 'text2',  False, 'l'),
+    )),
+    ('Before/After', 'cust', (
+        ('body',  'Number',   (0.6, 0.45, 0.7, 0.65), 22, 'white', True,  'ctr'),
+        ('title', 'Title',    (1.5, 0.4, 8, 0.4),     22, 'text1', True,  'l'),
+        ('body',  'Subtitle', (1.5, 0.85, 8, 0.3),    12, 'text2', False, 'l'),
+        ('body',  'Before',   (1, 1.85, 5, 0.4),      17, 'pink',  True,  'l'),
+        ('body',  'After',    (7.3, 1.85, 5, 0.4),    17, 'teal',  True,  'l'),
+    )),
+    ('Closing', 'cust', (
+        ('title', 'Title',     (1, 2.2, 11.3, 1.5), 60, 'purple', True,  'ctr'),
+        ('body',  'Message',   (1, 3.8, 11.3, 0.5), 18, 'text2',  False, 'ctr'),
+        ('body',  'Presenter', (1, 4.6, 11.3, 0.4), 14, 'text3',  False, 'ctr'),
+    )),
+)
+BLANK = 0
+
+# Base names python-pptx gives the placeholders it clones onto a slide ('Title 2', 'Text Placeholder 3', ...)
+_BASE_NAMES = {'title': 'Title', 'ctrTitle': 'Title', 'subTitle': 'Subtitle', 'body': 'Text Placeholder'}
+
+_SPTREE = ('<p:spTree><p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+           '<p:grpSpPr/>{}</p:spTree>')
+_LAYOUT_PH = ('<p:sp><p:nvSpPr><p:cNvPr id="{id}" name="{name}"/><p:cNvSpPr><a:spLocks noGrp="1"/></p:cNvSpPr>'
+              '<p:nvPr>{ph}</p:nvPr></p:nvSpPr><p:spPr><a:xfrm><a:off x="{x}" y="{y}"/><a:ext cx="{cx}" cy="{cy}"/>'
+              '</a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr><p:txBody>'
+              '<a:bodyPr wrap="square" lIns="91440" tIns="45720" rIns="91440" bIns="45720" rtlCol="0" anchor="t">'
+              '<a:noAutofit/></a:bodyPr><a:lstStyle>{style}</a:lstStyle><a:p><a:r><a:rPr lang="en-US"/>'
+              '<a:t>{name}</a:t></a:r></a:p></p:txBody></p:sp>')
+_BG = '<p:bg><p:bgPr><a:solidFill><a:srgbClr val="{}"/></a:solidFill><a:effectLst/></p:bgPr></p:bg>'
+
+
+class Slot:
+    """One placeholder of a layout: its <p:ph> identity and the paragraph style it gives its text."""
+
+    __slots__ = ('type', 'idx', 'name', 'base_name', 'ph_xml', 'style')
+
+    def __init__(self, ph_type, idx, name, style):
+        self.type, self.idx, self.name, self.style = ph_type, idx, name, style
+        self.base_name = _BASE_NAMES[ph_type]
+        self.ph_xml = '<p:ph type="%s"%s/>' % (ph_type, ' idx="%d"' % idx if idx else '')
+
+
+def _emu(x):
+    return int(x * 914400)  # == int(pptx.util.Inches(x))
+
+
+def _geometry(at):
+    return tuple(_emu(v) for v in at)
+
+
+def _idx(ph_type, position):
+    """Title placeholders keep the default idx 0; the others are numbered from 10 in slot order."""
+    return 0 if ph_type in ('title', 'ctrTitle') else 10 + position
+
+
+def _slot_positions():
+    """geometry -> [(layout index, slot position)] of every slot; the same for every theme."""
+    positions = {}
+    for index, (_, _, layout_slots) in enumerate(LAYOUTS):
+        for n, slot in enumerate(layout_slots):
+            positions.setdefault(_geometry(slot[2]), []).append((index, n))
+    return positions
+
+
+_BY_GEOMETRY = _slot_positions()
+_slots = {}  # (palette id, font) -> (palette, per layout [Slot])
+
+
+def slots(theme):
+    """Per layout, its Slots with styles resolved for *theme* (text_styles level tuples)."""
+    key = (id(theme.palette), theme.font)
+    cached = _slots.get(key)
+    if cached is not None and cached[0] is theme.palette:
+        return cached[1]
+    out = []
+    for _, _, layout_slots in LAYOUTS:
+        out.append([Slot(ph_type, _idx(ph_type, n), name,
+                         (int(size * 12700) // 127, bold, str(theme.color(role)), theme.font, algn, 0, 0))
+                    for n, (ph_type, name, _, size, role, bold, algn) in enumerate(layout_slots)])
+    _slots[key] = theme.palette, out
+    return out
+
+
+def choose(model):
+    """(layout index, {geometry: slot position}) for a SlideModel: the layout with the most of
+    its slots at the exact position of one of the slide's text ops, ties going to the first."""
+    hits = {}
+    for kind, args, _ in model.ops:
+        if kind == 'text':
+            for index, n in _BY_GEOMETRY.get(tuple(args[:4]), ()):
+                hits.setdefault(index, {}).setdefault(tuple(args[:4]), n)
+    if not hits:
+        return BLANK, {}
+    index = max(sorted(hits), key=lambda i: len(hits[i]))
+    return index, hits[index]
+
+
+# ── Generated parts ──
+
+def layout_xml(index, theme):
+    """Inner XML of generated layout *index* (its <p:cSld> and color map override)."""
+    name, _, layout_slots = LAYOUTS[index]
+    shapes = ''.join(_LAYOUT_PH.format(id=n + 2, name=escape(slot.name), ph=slot.ph_xml,
+                                       style=text_styles.level_xml((slot.style,)),
+                                       **dict(zip(('x', 'y', 'cx', 'cy'), _geometry(layout_slots[n][2]))))
+                     for n, slot in enumerate(slots(theme)[index]))
+    return ('<p:cSld name="%s">%s</p:cSld><p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>'
+            % (escape(name), _SPTREE.format(shapes)))
+
+
+def _parse(xml):
+    """Elements of an XML fragment, parsed in one go with the namespaces a slide part declares."""
+    return list(parse_xml('<p:x %s>%s</p:x>' % (nsdecls('a', 'p', 'r'), xml)))
+
+
+def apply(prs, theme):
+    """Turn the template's master and layouts into the generated ones for *theme*.
+
+    The master keeps its theme part, color map and "other" text style; its
+    placeholders go, its background becomes the theme's, and its title and
+    body styles become the named 'title' and 'body' text styles. The first
+    len(LAYOUTS) layouts are rewritten in place and the rest removed.
+    """
+    layouts = prs.slide_layouts
+    for layout in list(layouts)[len(LAYOUTS):]:
+        layouts.remove(layout)
+    for index, layout in enumerate(layouts):
+        element = layout._element
+        element.attrib.clear()
+        if LAYOUTS[index][1] != 'cust':
+            element.set('type', LAYOUTS[index][1])
+        element.set('preserve', '1')
+        element[:] = _parse(layout_xml(index, theme))
+
+    master = prs.slide_masters[0]._element
+    master.replace(master.find(qn('p:cSld')),
+                   _parse('<p:cSld>%s%s</p:cSld>' % (_BG.format(theme.color('bg')), _SPTREE.format('')))[0])
+    styles = text_styles.levels(theme)
+    tx = master.find(qn('p:txStyles'))
+    for tag, level in (('p:titleStyle', 'title'), ('p:bodyStyle', 'body')):
+        xml = text_styles.level_xml((styles[text_styles.LEVEL[level]],))
+        tx.replace(tx.find(qn(tag)), _parse('<%s>%s</%s>' % (tag, xml, tag))[0])
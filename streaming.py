@@ -0,0 +1,67 @@
+"""
+Constant-memory rendering for very long decks.
+
+render() keeps every slide's XML tree alive until the deck is saved, so a
+deck of thousands of slides needs memory in proportion to its length (about
+180 KB per slide, nearly all of it lxml trees). write_streaming() renders one
+SlideModel at a time and writes the finished slide and its relationships to
+the output zip straight away, then swaps the slide part for a _Flushed stub:
+the same part name, content type and relationships, but no XML. The package
+keeps only that manifest, which python-pptx still walks to name new pictures
+and charts; the master, layouts, theme, pictures and charts are written
+after the last slide, then [Content_Types].xml and the package relationships.
+
+The parts are the same as zip_writer.save(render(...)) writes, in another
+order. ZipStream only needs write(), so nothing is spooled to disk; *file*
+can be a path, a file, a pipe or a socket.
+
+    from streaming import write_streaming
+    write_streaming(deck_content.build(spec), 'dark', 'out.pptx')
+    write_streaming(iter_models(), theme, sys.stdout.buffer, level=1)
+"""
+
+from pptx.opc.package import Part
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+
+from renderer import new_presentation, render_slide
+from theme import get_theme
+from zip_writer import CACHE, DEFAULT_LEVEL, ZipStream, content_types_xml, write_parts
+
+
+class _Flushed(Part):
+    """A slide part already written out: its name, content type and relationships, without the XML."""
+
+    def __init__(self, part):
+        super().__init__(part.partname, part.content_type, part.package)
+        self.__dict__['_rels'] = part._rels    # lazyproperty's slot: keep the pictures and charts reachable
+
+
+def _flush(z, prs):
+    """Write the deck's newest slide to *z* and point the presentation at a stub in its place."""
+    sldId = prs.slides._sldIdLst[-1]
+    rel = prs.part.rels[sldId.rId]
+    write_parts(z, (rel.target_part,))
+    rel._target = rel.__dict__['target_part'] = _Flushed(rel.target_part)    # target_part is a lazyproperty too
+
+
+def write_streaming(slides, theme, file, level=DEFAULT_LEVEL, cache=CACHE):
+    """Render a list (or iterator) of SlideModel in *theme* to a path or writable binary file object,
+    holding one slide's XML at a time. Returns the number of slides."""
+    if isinstance(file, str):
+        with open(file, 'wb') as fp:
+            return write_streaming(slides, theme, fp, level, cache)
+    theme = get_theme(theme)
+    prs = new_presentation(theme)
+    z = ZipStream(file, level, cache)
+    count = 0
+    for model in slides:
+        render_slide(prs, model, theme)
+        _flush(z, prs)
+        count += 1
+    package = prs.part.package
+    parts = tuple(package.iter_parts())
+    write_parts(z, (part for part in parts if not isinstance(part, _Flushed)))
+    z.write(CONTENT_TYPES_URI.membername, content_types_xml(parts))
+    z.write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+    z.close()
+    return count
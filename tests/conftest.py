@@ -0,0 +1,28 @@
+"""
+Shared pytest setup: the modules live flat in the repository root.
+
+    python -m pytest -q tests
+"""
+
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture(scope='session')
+def build_log(tmp_path_factory):
+    """Path of a small synthetic build log (.npz) for native charts; their disk cache goes to a temp dir too."""
+    import charts
+    from bench_charts import write_builds
+
+    path = str(tmp_path_factory.mktemp('builds') / 'builds.npz')
+    write_builds(path, 20000)
+    cache_dir, charts.CACHE_DIR = charts.CACHE_DIR, str(tmp_path_factory.mktemp('chart_cache'))
+    yield path
+    charts.CACHE_DIR = cache_dir
+    charts.reset()
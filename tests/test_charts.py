@@ -0,0 +1,102 @@
+"""Native charts: aggregation against a plain-Python reference, and embedding each dataset once."""
+
+import io
+import zipfile
+from dataclasses import replace
+
+import pytest
+
+import charts
+import deck_content
+import zip_writer
+from renderer import SlideModel, render
+from theme import THEMES
+
+def _reference_stat(values, metric):
+    if not values:
+        return None
+    if metric == 'builds':
+        return float(len(values))
+    if metric == 'failure_rate':
+        return sum(f for _, f in values) * 100 / len(values)
+    seconds = sorted(s for s, _ in values)
+    if metric == 'mean_minutes':
+        return sum(seconds) / len(seconds) / 60
+    q = 0.5 if metric == 'p50_minutes' else 0.9
+    return seconds[int(q * (len(seconds) - 1))] / 60
+
+
+def reference(builds, chart, metric):
+    """charts.aggregate() computed one row at a time, from Python lists."""
+    names = builds['teams']
+    rows = list(zip(builds['team'].tolist(), builds['day'].tolist(), builds['seconds'].tolist(),
+                    builds['failed'].tolist()))
+    counts = {}
+    for t, *_ in rows:
+        counts[t] = counts.get(t, 0) + 1
+    ranked = sorted(counts, key=lambda t: (-counts[t], t))
+    limit = charts.MAX_BARS if chart == 'bar' else charts.MAX_SERIES
+    kept = ranked if len(ranked) <= limit else ranked[:limit - 1]
+    groups = [names[t] for t in kept] + (['Other'] if len(kept) < len(ranked) else [])
+    index = {t: i for i, t in enumerate(kept)}
+    if chart == 'bar':
+        values = [[] for _ in groups]
+        for t, _, s, f in rows:
+            values[index.get(t, len(kept))].append((s, f))
+        return groups, [[_reference_stat(v, metric) for v in values]]
+    first = min(d for _, d, _, _ in rows)
+    width = -(-(max(d for _, d, _, _ in rows) - first + 1) // charts.MAX_POINTS)
+    buckets = -(-(max(d for _, d, _, _ in rows) - first + 1) // width)
+    values = [[[] for _ in range(buckets)] for _ in groups]
+    for t, d, s, f in rows:
+        values[index.get(t, len(kept))][(d - first) // width].append((s, f))
+    return groups, [[_reference_stat(v, metric) for v in series] for series in values]
+
+
+def _close(a, b):
+    return (a is None) == (b is None) and (a is None or abs(a - b) <= 0.006 + 1e-4 * abs(b))
+
+
+@pytest.mark.parametrize('metric', charts.METRICS)
+@pytest.mark.parametrize('chart', charts.CHARTS)
+def test_aggregate_matches_reference(build_log, chart, metric):
+    builds = charts.load_builds(build_log)
+    ds = charts.aggregate(builds, chart, metric)
+    groups, expected = reference(builds, chart, metric)
+    assert (list(ds.categories) if chart == 'bar' else [name for name, _ in ds.series]) == groups
+    got = [list(values) for _, values in ds.series]
+    assert all(_close(a, b) for row, ref in zip(got, expected) for a, b in zip(row, ref))
+    if chart == 'line':
+        assert len(ds.categories) <= charts.MAX_POINTS
+
+
+def chart_parts(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        names = z.namelist()
+    return (sum(n.startswith('ppt/charts/chart') for n in names),
+            sum(n.startswith('ppt/embeddings/') for n in names))
+
+
+def build(slides, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(slides, theme), buf)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize('direct', [False, True], ids=['python-pptx', 'direct'])
+def test_each_dataset_built_once_per_batch(build_log, direct, tmp_path, monkeypatch):
+    monkeypatch.setattr(charts, 'CACHE_DIR', str(tmp_path))
+    charts.reset()
+    theme = replace(THEMES['dark'], direct_xml=direct)
+    slides = deck_content.build({'build_data': build_log})
+    decks = [chart_parts(build(slides, theme)) for _ in range(3)]
+    assert decks == [(2, 2)] * 3
+    assert {k: charts.stats[k] for k in ('loaded', 'aggregated', 'built', 'embedded')} == \
+        {'loaded': 1, 'aggregated': 2, 'built': 2, 'embedded': 6}
+
+
+def test_same_dataset_twice_is_stored_once(build_log):
+    twice = [SlideModel(), SlideModel()]
+    for s in twice:
+        s.chart(0, 0, 5486400, 2743200, build_log, chart='bar', metric='p50_minutes', title='Median')
+    assert chart_parts(build(twice, replace(THEMES['dark'], direct_xml=True))) == (1, 1)
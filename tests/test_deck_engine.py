@@ -0,0 +1,26 @@
+"""Batch engine: decks build in one process, as bytes or files, under the expected names."""
+
+import io
+
+from pptx import Presentation
+
+import deck_engine
+
+
+def test_render_bytes_opens_with_every_slide():
+    prs = Presentation(io.BytesIO(deck_engine.render_bytes({'name': 'A. Person'})))
+    assert len(prs.slides) == len(deck_engine.build_deck({'name': 'A. Person'}).slides) > 0
+
+
+def test_render_many_writes_one_deck_per_spec_and_theme(tmp_path):
+    specs = [{'name': 'A. Person'}, {'name': 'B. Person'}]
+    paths = deck_engine.render_many(specs, str(tmp_path), ['dark', 'white'])
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert names == sorted(deck_engine.output_name(s, t) for s in specs for t in ('dark', 'white'))
+    assert len(paths) == 4
+
+
+def test_output_name():
+    assert deck_engine.output_name({'name': 'A. Person'}) == 'Q3_Review_A_Person.pptx'
+    assert deck_engine.output_name({'name': 'A. Person'}, 'white', 'q3_compact') == \
+        'Q3_Review_A_Person_Compact_White_Theme.pptx'
@@ -0,0 +1,99 @@
+"""Deck merging: slides copied unchanged, shared parts stored once, the CLI and its imports."""
+
+import os
+import subprocess
+import sys
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.opc.constants import CONTENT_TYPE as CT
+
+import deck_merge
+from bench_merge import render_decks
+from conftest import ROOT
+from deck_files import deck_paths
+
+
+def distinct_masters(paths):
+    """How many different (slide master, theme) pairs the decks at *paths* use."""
+    pairs = set()
+    for path in paths:
+        with zipfile.ZipFile(path) as z:
+            pairs.add((z.read('ppt/slideMasters/slideMaster1.xml'), z.read('ppt/theme/theme1.xml')))
+    return len(pairs)
+
+
+def slide_count(src):
+    return sum(n.startswith('ppt/slides/slide') for n in src.infos)
+
+
+@pytest.fixture(scope='module', params=[False, True], ids=['template', 'slide_master'])
+def decks(request, tmp_path_factory):
+    """Five decks, two themes; with slide_master each theme brings its own master."""
+    out_dir = tmp_path_factory.mktemp('decks')
+    return render_decks(str(out_dir), 5, ['dark', 'white', 'dark'], request.param)
+
+
+def test_slides_and_their_parts_are_copied_unchanged(decks, tmp_path):
+    out = str(tmp_path / 'merged.pptx')
+    stats = deck_merge.merge_decks(decks, out)
+    k = 0
+    with deck_merge.Source(out) as merged:
+        for path in decks:
+            with deck_merge.Source(path) as src:
+                for i in range(1, slide_count(src) + 1):
+                    k += 1
+                    name, mine = f'ppt/slides/slide{i}.xml', f'ppt/slides/slide{k}.xml'
+                    assert merged.read(mine) == src.read(name)
+                    assert ([(rid, src.read(t)) for rid, _, t, ext in src.rels(name) if not ext]
+                            == [(rid, merged.read(t)) for rid, _, t, ext in merged.rels(mine) if not ext])
+        assert merged.read('ppt/presentation.xml').count(b'<p:sldId ') == k == stats['slides']
+    assert stats['decks'] == len(decks)
+
+
+def test_one_master_per_distinct_master_and_theme(request, decks, tmp_path):
+    out = str(tmp_path / 'merged.pptx')
+    stats = deck_merge.merge_decks(decks, out)
+    with deck_merge.Source(out) as merged:
+        masters = sum(ct == CT.PML_SLIDE_MASTER for ct in merged.overrides.values())
+    assert masters == distinct_masters(decks) == (2 if 'slide_master' in request.node.name else 1)
+    assert stats['reused'] > 0 and stats['parts_out'] < stats['parts_in']
+
+
+def test_merge_opens_in_python_pptx(decks, tmp_path):
+    out = str(tmp_path / 'merged.pptx')
+    stats = deck_merge.merge_decks(decks[:2], out)
+    assert len(Presentation(out).slides) == stats['slides']
+
+
+def test_other_slide_size_is_rejected(decks, tmp_path):
+    prs = Presentation(decks[0])
+    prs.slide_width += 1
+    odd = str(tmp_path / 'odd.pptx')
+    prs.save(odd)
+    out = tmp_path / 'merged.pptx'
+    with pytest.raises(deck_merge.MergeError):
+        deck_merge.merge_decks([decks[0], odd], str(out))
+    assert not out.exists() and os.listdir(tmp_path) == ['odd.pptx']
+
+
+def test_deck_paths(tmp_path):
+    for name in ('b.pptx', 'a.PPTX', 'notes.txt'):
+        (tmp_path / name).write_bytes(b'')
+    (tmp_path / 'sub').mkdir()
+    (tmp_path / 'sub' / 'c.pptx').write_bytes(b'')
+    assert list(deck_paths([str(tmp_path), 'x.pptx'])) == [str(tmp_path / 'a.PPTX'), str(tmp_path / 'b.pptx'),
+                                                           'x.pptx']
+
+
+def test_cli_skips_its_output_and_leaves_export_unloaded(decks, tmp_path):
+    src = os.path.dirname(decks[0])
+    out = os.path.join(src, 'all.pptx')
+    code = ('import sys, deck_merge; rc = deck_merge.main(sys.argv[1:]); '
+            'sys.exit(rc or 3 * ("export" in sys.modules))')
+    for _ in range(2):  # the second run finds all.pptx among the sources and must leave it out
+        result = subprocess.run([sys.executable, '-c', code, out, src], cwd=ROOT, capture_output=True, text=True)
+        assert result.returncode == 0, result.stdout + result.stderr
+    assert f'{len(decks)} decks' in result.stdout
+    os.remove(out)
@@ -0,0 +1,47 @@
+"""Deck specs: base plans are cached per spec and compiler source; per-person plans are not stored."""
+
+import json
+import os
+
+import deck_content
+import deck_spec
+
+
+def q3_spec():
+    return deck_spec.load_spec(deck_content.DECKS['q3'])
+
+
+def test_cached_plan_matches_a_fresh_compile(tmp_path):
+    spec = q3_spec()
+    first = deck_spec.compile_cached(spec, None, str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+    again = deck_spec.compile_cached(spec, None, str(tmp_path))
+    assert first == again == json.loads(json.dumps(deck_spec.compile_spec(spec)))
+
+
+def test_per_person_plans_are_not_stored(tmp_path):
+    spec = q3_spec()
+    overrides = {'name': 'A. Person'}
+    assert deck_spec.compile_cached(spec, overrides, str(tmp_path)) == deck_spec.compile_spec(spec, overrides)
+    assert not tmp_path.exists() or os.listdir(tmp_path) == []
+    for i in range(20):
+        deck_content.build({'name': f'Person {i}'}, cache_dir=str(tmp_path))
+    deck_content.build(None, cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_hash_follows_the_compiler_source(monkeypatch):
+    spec = q3_spec()
+    before = deck_spec.spec_hash(spec, {'name': 'A. Person'})
+    monkeypatch.setattr(deck_spec, '_compiler', 'another-build')
+    assert deck_spec.spec_hash(spec, {'name': 'A. Person'}) != before
+
+
+def test_stale_plan_is_not_read(tmp_path, monkeypatch):
+    spec = q3_spec()
+    monkeypatch.setattr(deck_spec, '_compiler', 'old-code')
+    stale = os.path.join(tmp_path, deck_spec.spec_hash(spec) + '.json')
+    with open(stale, 'w', encoding='utf-8') as f:
+        json.dump({'version': deck_spec.PLAN_VERSION, 'slides': []}, f)
+    monkeypatch.setattr(deck_spec, '_compiler', 'new-code')
+    assert deck_spec.compile_cached(spec, None, str(tmp_path))['slides']
@@ -0,0 +1,167 @@
+"""Emoji pictures: each emoji becomes a picture of a stored image part, or stays text."""
+
+import hashlib
+import io
+import os
+import re
+import subprocess
+import sys
+import zipfile
+from dataclasses import replace
+
+import pytest
+from lxml import etree
+
+import deck_content
+import emoji_images
+import text_fit
+import zip_writer
+from conftest import ROOT
+from renderer import render
+from theme import THEMES
+
+NS = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+      'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+      'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'}
+REL = re.compile(rb'Id="(rId\d+)"[^>]*Target="\.\./(media/[^"]+)"')
+DRAWN = ('☁️', '⚙️')     # the decks' emoji that common text fonts (DejaVu Sans, Arial) also have
+
+
+@pytest.fixture(autouse=True)
+def png_cache(tmp_path, monkeypatch):
+    cache_dir = str(tmp_path / 'png')
+    monkeypatch.setattr(emoji_images, 'CACHE_DIR', cache_dir)
+    emoji_images.reset()
+    yield cache_dir
+    emoji_images.reset()
+
+
+def use_text_font(monkeypatch):
+    """Rasterize from the system text font, which draws DRAWN in monochrome; skip without one."""
+    path = text_fit.find_font()
+    if path is None:
+        pytest.skip('no system text font to rasterize emoji from')
+    monkeypatch.setenv('EMOJI_FONT', path)
+    emoji_images.reset()
+    if not all(map(emoji_images.drawable, DRAWN)):
+        pytest.skip(f'{path} lacks {DRAWN}')
+
+
+@pytest.fixture(params=['no font', 'text font'])
+def emoji_font(request, tmp_path, monkeypatch):
+    """No emoji font at all, or the system text font (whatever emoji fonts are installed)."""
+    if request.param == 'no font':
+        monkeypatch.setenv('EMOJI_FONT', str(tmp_path / 'missing.ttf'))
+        emoji_images.reset()
+    else:
+        use_text_font(monkeypatch)
+    return request.param
+
+
+def build(deck, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(deck_content.build(None, deck), theme), buf)
+    return buf.getvalue()
+
+
+def parts(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+def emoji_shapes(data):
+    """(emoji text boxes, [(alt text, media part)] of pictures, {media part: bytes}) of a .pptx."""
+    texts, pictures = [], []
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        media = {n[4:]: z.read(n) for n in z.namelist() if n.startswith('ppt/media/')}
+        for name in z.namelist():
+            if not re.match(r'ppt/slides/slide\d+\.xml$', name):
+                continue
+            rels = dict(REL.findall(z.read(name.replace('slides/', 'slides/_rels/') + '.rels')))
+            root = etree.fromstring(z.read(name))
+            for sp in root.iterfind('p:cSld/p:spTree/p:sp', NS):
+                text = ''.join(t.text or '' for t in sp.iterfind('p:txBody/a:p/a:r/a:t', NS))
+                if emoji_images.is_emoji(text):
+                    texts.append(text)
+            for pic in root.iterfind('p:cSld/p:spTree/p:pic', NS):
+                rId = pic.find('p:blipFill/a:blip', NS).get(f'{{{NS["r"]}}}embed')
+                pictures.append((pic.find('p:nvPicPr/p:cNvPr', NS).get('descr'), rels.get(rId.encode(), b'').decode()))
+    return texts, pictures, media
+
+
+@pytest.mark.parametrize('theme', sorted(THEMES))
+@pytest.mark.parametrize('deck', list(deck_content.DECKS))
+def test_emoji_embedded_or_left_as_text(deck, theme, emoji_font):
+    theme = THEMES[theme]
+    plain = build(deck, theme)
+    data = build(deck, replace(theme, emoji_images=True))
+    before, _, _ = emoji_shapes(plain)
+    texts, pictures, media = emoji_shapes(data)
+    assert before and sorted(before) == sorted(texts + [alt for alt, _ in pictures])
+    assert all(part in media for _, part in pictures)
+    assert len({hashlib.sha1(blob).digest() for blob in media.values()}) == len(media)
+    if emoji_font == 'no font':
+        assert not pictures and parts(data) == parts(plain)
+    else:
+        drawn = {alt for alt, _ in pictures}
+        assert drawn and drawn == set(DRAWN) & set(before)
+
+
+def test_png_is_rasterized_once_then_read_back(monkeypatch, png_cache):
+    from PIL import Image
+
+    use_text_font(monkeypatch)
+    data = emoji_images.png('⚙️', 20)
+    assert data.startswith(b'\x89PNG') and Image.open(io.BytesIO(data)).size == (40, 40)
+    assert emoji_images.png('⚙️', 20) is data
+    assert emoji_images.png('⚙️', 10) != data
+    assert emoji_images.stats == {'memory_hits': 1, 'disk_hits': 0, 'rasterized': 2, 'skipped': 0}
+    assert len([f for _, _, files in os.walk(png_cache) for f in files]) == 2
+
+    emoji_images.reset()    # as in a new process: only the disk cache is left
+    assert emoji_images.png('⚙️', 20) == data
+    assert emoji_images.stats['disk_hits'] == 1 and emoji_images.stats['rasterized'] == 0
+    assert emoji_images.png('🤖', 20) is None and emoji_images.png('A', 20) is None
+
+
+def test_one_image_part_per_png(monkeypatch):
+    from pptx.util import Inches
+
+    from renderer import SlideModel
+
+    use_text_font(monkeypatch)
+    slides = [SlideModel() for _ in range(3)]
+    for i, s in enumerate(slides):
+        s.card(Inches(0.5), Inches(0.5), Inches(3), Inches(2), '⚙️', f'Card {i}', 'Same emoji, same size')
+        s.card(Inches(4), Inches(0.5), Inches(3), Inches(2), '☁️', f'Other {i}', 'Another emoji')
+    buf = io.BytesIO()
+    zip_writer.save(render(slides, replace(THEMES['dark'], emoji_images=True)), buf)
+    texts, pictures, media = emoji_shapes(buf.getvalue())
+    assert not texts and sorted(alt for alt, _ in pictures) == ['☁️'] * 3 + ['⚙️'] * 3
+    assert len(media) == 2 and all(part.endswith('.png') for part in media)
+    by_emoji = {}
+    for alt, part in pictures:
+        by_emoji.setdefault(alt, set()).add(part)
+    assert sorted(map(len, by_emoji.values())) == [1, 1]     # repeats point at the part already stored
+    with zipfile.ZipFile(buf) as z:
+        assert b'Extension="png" ContentType="image/png"' in z.read('[Content_Types].xml')
+
+
+def test_picture_xml(monkeypatch):
+    use_text_font(monkeypatch)
+    data = build('q3', replace(THEMES['dark'], emoji_images=True))
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        name = next(n for n in z.namelist() if re.match(r'ppt/slides/slide\d+\.xml$', n) and b'<p:pic>' in z.read(n))
+        pic = etree.fromstring(z.read(name)).find('p:cSld/p:spTree/p:pic', NS)
+    assert pic.find('p:nvPicPr/p:cNvPr', NS).get('descr') in DRAWN
+    assert pic.find('p:nvPicPr/p:cNvPicPr/a:picLocks', NS).get('noChangeAspect') == '1'
+    assert pic.find('p:blipFill/a:blip', NS).get(f'{{{NS["r"]}}}embed').startswith('rId')
+    off, ext = pic.find('p:spPr/a:xfrm/a:off', NS), pic.find('p:spPr/a:xfrm/a:ext', NS)
+    assert off is not None and ext.get('cx') == ext.get('cy') and int(ext.get('cx')) > 0
+
+
+def test_cache_dir_does_not_follow_the_working_directory(tmp_path):
+    code = 'import emoji_images; print(emoji_images.CACHE_DIR)'
+    out = subprocess.run([sys.executable, '-c', code], cwd=tmp_path, env=dict(os.environ, PYTHONPATH=ROOT),
+                         capture_output=True, text=True, check=True).stdout.strip()
+    assert out == os.path.join(ROOT, '.emoji_cache')
@@ -0,0 +1,136 @@
+"""Export pool: cache keys, and timeouts, crashes and bad decks handled per deck (no LibreOffice needed)."""
+
+import os
+import subprocess
+import sys
+import time
+import zipfile
+
+import pytest
+
+import export
+
+TIMEOUT = 1.0
+
+
+def write_deck(path, text, date_time=(2025, 1, 1, 0, 0, 0)):
+    """A minimal zip standing in for a .pptx; *text* is its presentation.xml."""
+    with zipfile.ZipFile(path, 'w') as z:
+        z.writestr(zipfile.ZipInfo('ppt/presentation.xml', date_time), text)
+    return str(path)
+
+
+class FakeWorker(export.Worker):
+    """A Worker whose 'soffice' is an idle Python process; what a conversion does depends on the deck's name.
+
+    hang*: never answers (until the timeout kills the process); crash*: the
+    process dies mid-conversion the first time; bad*: fails with the process
+    still up; anything else writes a PDF and two PNGs.
+    """
+
+    crashed = set()
+
+    def start(self):
+        self.stop()
+        self.proc = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(600)'])
+        self.killed = False
+
+    def stop(self):
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+    def _convert(self, src, outputs, width):
+        name = os.path.basename(src)
+        if name.startswith('hang'):
+            self.proc.wait()
+            raise RuntimeError('bridge disposed')       # what UNO raises once soffice is gone
+        if name.startswith('crash') and name not in self.crashed:
+            self.crashed.add(name)
+            self.proc.kill()
+            self.proc.wait()
+            raise RuntimeError('connection lost')
+        if name.startswith('bad'):
+            raise export.ExportError(f'{src}: LibreOffice cannot open it')
+        for fmt, path in outputs:
+            if fmt == 'pdf':
+                with open(path, 'wb') as f:
+                    f.write(b'%PDF ' + name.encode())
+            else:
+                os.makedirs(path)
+                for i in (1, 2):
+                    with open(os.path.join(path, f'slide{i:03d}.png'), 'wb') as f:
+                        f.write(b'PNG %d' % i)
+
+
+class FakePool(export.ExportPool):
+    worker_class = FakeWorker
+
+
+@pytest.fixture
+def pool(tmp_path):
+    FakeWorker.crashed.clear()
+
+    def make(size=1, **kwargs):
+        return FakePool(size, TIMEOUT, str(tmp_path / 'cache'), sys.executable, **kwargs)
+    return make
+
+
+def test_content_hash_ignores_zip_timestamps(tmp_path):
+    a = write_deck(tmp_path / 'a.pptx', '<p:presentation/>')
+    b = write_deck(tmp_path / 'b.pptx', '<p:presentation/>', (2025, 6, 1, 12, 0, 0))
+    c = write_deck(tmp_path / 'c.pptx', '<p:presentation>B</p:presentation>')
+    assert open(a, 'rb').read() != open(b, 'rb').read()
+    assert export.content_hash(a) == export.content_hash(b) != export.content_hash(c)
+
+
+def test_timeout_kills_and_restarts(pool, tmp_path):
+    decks = [write_deck(tmp_path / f'{name}.pptx', name) for name in ('hang', 'ok')]
+    with pool() as p:
+        start = time.monotonic()
+        results = list(p.export_many(decks, str(tmp_path / 'out')))
+        assert time.monotonic() - start < TIMEOUT + 5
+        (_, _, hang_error, _), (_, outputs, ok_error, _) = results
+        assert isinstance(hang_error, export.ExportTimeout)
+        assert ok_error is None and open(outputs['pdf'], 'rb').read() == b'%PDF ok.pptx'
+        assert p.stats['timeouts'] == 1 and p.stats['restarts'] == 1 and p.stats['converted'] == 1
+
+
+def test_crash_is_retried_on_a_restarted_worker(pool, tmp_path):
+    deck = write_deck(tmp_path / 'crash.pptx', 'crash')
+    with pool() as p:
+        (_, outputs, error, _), = p.export_many([deck], str(tmp_path / 'out'), ('pdf', 'png'))
+        assert error is None and [os.path.basename(f) for f in outputs['png']] == ['crash_01.png', 'crash_02.png']
+        assert p.stats['restarts'] == 1 and p.stats['failures'] == 0
+
+
+def test_crash_past_the_retries_fails_the_deck(pool, tmp_path):
+    deck = write_deck(tmp_path / 'crash.pptx', 'crash')
+    with pool(retries=0) as p:
+        (_, outputs, error, _), = p.export_many([deck], str(tmp_path / 'out'))
+        assert outputs is None and 'connection lost' in str(error)
+
+
+def test_bad_decks_fail_alone(pool, tmp_path):
+    names = ['ok1', 'bad1', 'hang', 'crash', 'bad2', 'ok2']
+    decks = [write_deck(tmp_path / f'{name}.pptx', name) for name in names]
+    with pool(size=2) as p:
+        start = time.monotonic()
+        results = list(p.export_many(iter(decks), str(tmp_path / 'out')))
+        assert time.monotonic() - start < TIMEOUT + 5
+        assert [os.path.basename(path) for path, *_ in results] == [name + '.pptx' for name in names]
+        failed = {os.path.basename(path)[:-5]: type(error) for path, _, error, _ in results if error is not None}
+        assert failed == {'bad1': export.ExportError, 'bad2': export.ExportError, 'hang': export.ExportTimeout}
+        assert p.stats['converted'] == 3 and p.stats['failures'] == 2 and p.stats['timeouts'] == 1
+
+
+def test_cached_decks_start_no_worker(pool, tmp_path):
+    decks = [write_deck(tmp_path / f'ok{i}.pptx', f'ok{i}') for i in range(3)]
+    with pool() as p:
+        assert all(error is None for _, _, error, _ in p.export_many(decks, str(tmp_path / 'out')))
+    with pool(size=2) as p:
+        assert all(error is None for _, _, error, _ in p.export_many(decks, str(tmp_path / 'again')))
+        assert p.stats['cache_hits'] == 3 and p.stats['converted'] == 0
+        assert all(worker.proc is None for worker in p.workers)
+    assert sorted(os.listdir(tmp_path / 'again')) == ['ok0.pdf', 'ok1.pdf', 'ok2.pdf']
@@ -0,0 +1,33 @@
+"""HTML converter: the bundled decks convert cleanly, and tall sections carry on onto new slides."""
+
+import io
+import os
+
+import pytest
+from pptx import Presentation
+
+import html_convert
+import lint
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.parametrize('theme', ['dark', 'white'])
+@pytest.mark.parametrize('html', ['q3_hr_ppt.html', 'q3_hr_presentation.html'])
+def test_bundled_html_converts_without_lint_errors(tmp_path, html, theme):
+    out = str(tmp_path / 'deck.pptx')
+    n = html_convert.convert(os.path.join(ROOT, html), out, theme)
+    assert len(Presentation(out).slides) == n
+    errors = [i for i in lint.lint_deck(out) if i['severity'] == 'error']
+    assert errors == []
+
+
+def test_tall_section_continues_on_a_new_slide(tmp_path):
+    cards = ''.join(f'<div class="card"><div class="card-emoji">🚀</div><div class="card-title">Card {i}</div>'
+                    f'<div class="card-text">Some words about card {i}.</div></div>' for i in range(12))
+    html = f'<html><body><section class="slide"><h2>Many cards</h2><div class="grid g3">{cards}</div></section>'
+    slides = list(html_convert.iter_slides(io.StringIO(html + '</body></html>')))
+    assert len(slides) > 1
+    assert sum(kind == 'card' for s in slides for kind, _, _ in s.ops) == 12
+    bottom = max(args[1] + args[3] for s in slides for kind, args, _ in s.ops if kind == 'card')
+    assert bottom <= html_convert.SLIDE_H
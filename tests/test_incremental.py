@@ -0,0 +1,58 @@
+"""Incremental rebuilds: only changed slides are rendered, a changed theme or renderer redoes them all."""
+
+import zipfile
+from dataclasses import replace
+
+from pptx.dml.color import RGBColor
+
+import deck_content
+import incremental
+import zip_writer
+from incremental import write_incremental
+from renderer import render
+from theme import DARK
+
+
+def parts(path):
+    with zipfile.ZipFile(path) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+def test_rebuild_renders_only_changed_slides(tmp_path):
+    path, full = str(tmp_path / 'deck.pptx'), str(tmp_path / 'full.pptx')
+    first = deck_content.build({'name': 'A. Person'})
+    assert write_incremental(first, 'dark', path) == list(range(len(first)))
+    assert write_incremental(first, 'dark', path) == []
+
+    second = deck_content.build({'name': 'B. Person'})
+    changed = write_incremental(second, 'dark', path)
+    assert 0 < len(changed) < len(second)
+    zip_writer.save(render(second, 'dark'), full)
+    assert parts(path) == parts(full)
+
+
+def test_theme_change_rebuilds_everything(tmp_path):
+    path = str(tmp_path / 'deck.pptx')
+    slides = deck_content.build(None)
+    write_incremental(slides, 'dark', path)
+    assert write_incremental(slides, 'white', path) == list(range(len(slides)))
+
+
+def test_palette_change_under_the_same_name_rebuilds_everything(tmp_path):
+    path, full = str(tmp_path / 'deck.pptx'), str(tmp_path / 'full.pptx')
+    slides = deck_content.build(None)
+    theme = replace(DARK, slide_master=True)    # the palette is in the master and layouts too
+    write_incremental(slides, theme, path)
+    recolored = replace(theme, palette=dict(DARK.palette, bg=RGBColor(0, 0, 0)))
+    assert write_incremental(slides, recolored, path) == list(range(len(slides)))
+    zip_writer.save(render(slides, recolored), full)
+    assert parts(path) == parts(full)
+
+
+def test_renderer_change_rebuilds_everything(tmp_path, monkeypatch):
+    path = str(tmp_path / 'deck.pptx')
+    slides = deck_content.build(None)
+    write_incremental(slides, 'dark', path)
+    monkeypatch.setattr(incremental, 'renderer_version', lambda: 'other renderer code')
+    assert write_incremental(slides, 'dark', path) == list(range(len(slides)))
+    assert write_incremental(slides, 'dark', path) == []
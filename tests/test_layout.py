@@ -0,0 +1,54 @@
+"""Layout solver: batched grids and overlap checks agree with plain Python loops."""
+
+import os
+import random
+import subprocess
+import sys
+
+import numpy as np
+from pptx.util import Inches
+
+import layout
+
+CARD_W, CARD_H = Inches(3.8), Inches(2.1)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def python_cells(counts, pitch):
+    return [[Inches(0.6) + (i % 3) * pitch, Inches(1.8) + (i // 3) * Inches(2.5)] for n in counts for i in range(n)]
+
+
+def python_overlaps(cells, counts):
+    pairs, start = [], 0
+    for n in counts:
+        for a in range(start, start + n):
+            for b in range(a + 1, start + n):
+                (ax, ay), (bx, by) = cells[a], cells[b]
+                if ax < bx + CARD_W and bx < ax + CARD_W and ay < by + CARD_H and by < ay + CARD_H:
+                    pairs.append((a, b))
+        start += n
+    return pairs
+
+
+def test_grids_and_overlaps_match_python():
+    rng = random.Random(0)
+    counts = [rng.randint(1, 12) for _ in range(300)]
+    for pitch in (Inches(4.1), Inches(3.0)):    # 3.0 < card width: neighbours overlap
+        xy, offsets = layout.solve_grids(counts, 3, Inches(0.6), Inches(1.8), pitch, Inches(2.5))
+        assert xy.tolist() == python_cells(counts, pitch)
+        assert offsets.tolist() == np.cumsum([0] + counts).tolist()
+        boxes = np.empty((len(xy), 4), dtype=np.int64)
+        boxes[:, :2], boxes[:, 2:] = xy, (CARD_W, CARD_H)
+        pairs = layout.find_overlaps(boxes, np.repeat(np.arange(len(counts)), counts))
+        assert sorted(map(tuple, pairs.tolist())) == python_overlaps(xy.tolist(), counts)
+        assert bool(len(pairs)) == (pitch < CARD_W)
+
+
+def test_out_of_bounds():
+    boxes = [[0, 0, layout.SLIDE_W, layout.SLIDE_H], [-1, 0, 10, 10], [layout.SLIDE_W - 5, 0, 10, 10]]
+    assert layout.out_of_bounds(boxes).tolist() == [False, True, True]
+
+
+def test_slide_size_is_light_to_import():
+    code = 'import sys, layout, renderer; assert "numpy" not in sys.modules, "numpy imported"'
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
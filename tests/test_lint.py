@@ -0,0 +1,50 @@
+"""Deck lint: off-slide shapes are errors, collisions and overflowing text warnings."""
+
+import os
+import subprocess
+import sys
+
+from pptx.util import Inches, Pt
+
+import lint
+from renderer import new_presentation
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def kinds(path):
+    return sorted(i['kind'] for i in lint.lint_deck(path))
+
+
+def test_flags_offslide_collision_and_overflow(tmp_path):
+    prs = new_presentation()
+    s = prs.slides.add_slide(prs.slide_layouts[6])
+    s.shapes.add_shape(1, Inches(12), Inches(6), Inches(3), Inches(3))          # runs off the slide
+    s.shapes.add_shape(1, Inches(1), Inches(1), Inches(2), Inches(2))
+    s.shapes.add_shape(1, Inches(2), Inches(2), Inches(2), Inches(2))           # overlaps the one above
+    box = s.shapes.add_textbox(Inches(6), Inches(1), Inches(1), Inches(0.3))
+    box.text_frame.word_wrap = True
+    box.text_frame.text = 'Far too many words for such a small one-line text box'
+    box.text_frame.paragraphs[0].runs[0].font.size = Pt(18)
+    path = str(tmp_path / 'bad.pptx')
+    prs.save(path)
+    found = kinds(path)
+    assert 'offslide' in found and 'collision' in found and 'text-overflow' in found
+    assert lint.main([path]) == 1
+
+
+def test_clean_slide_has_no_issues(tmp_path):
+    prs = new_presentation()
+    s = prs.slides.add_slide(prs.slide_layouts[6])
+    s.shapes.add_shape(1, Inches(1), Inches(1), Inches(4), Inches(2))
+    s.shapes.add_textbox(Inches(1.2), Inches(1.2), Inches(3), Inches(0.5)).text_frame.text = 'On its card'
+    s.shapes.add_shape(1, Inches(6), Inches(1), Inches(4), Inches(2))
+    path = str(tmp_path / 'clean.pptx')
+    prs.save(path)
+    assert lint.lint_deck(path) == []
+    assert lint.main([path, '--strict']) == 0
+
+
+def test_lint_does_not_import_the_renderer():
+    code = 'import sys, lint; assert not {"pptx", "renderer"} & set(sys.modules), "renderer imported"'
+    subprocess.run([sys.executable, '-c', code], cwd=ROOT, check=True)
@@ -0,0 +1,61 @@
+"""Mail merge: row validation, duplicate names and the decks written per row."""
+
+import json
+import os
+
+import pytest
+
+import mail_merge
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+
+def test_row_spec_sets_list_entries():
+    spec, problems = mail_merge.row_spec({'name': 'Ada', 'stat_data.0.0': '7', 'learnings': ''})
+    assert problems == [] and spec['name'] == 'Ada' and spec['stat_data'][0][0] == '7'
+    assert 'learnings' not in spec
+
+
+@pytest.mark.parametrize('row, problem', [({'nope': 'x'}, 'unknown column'),
+                                          ({'stat_data.9.0': '1'}, 'out of range'),
+                                          ({'stat_data.x.0': '1'}, 'is not an index'),
+                                          ({'name': 'A', None: ['extra']}, 'more cell(s) than the header')])
+def test_row_spec_problems(row, problem):
+    spec, problems = mail_merge.row_spec(row)
+    assert spec is None and problem in ' '.join(problems)
+
+
+def test_duplicate_names_are_rejected(tmp_path):
+    roster = write(tmp_path / 'roster.csv', 'name\nA. Person\nB. Person\nA Person\nA. Person\n')
+    errors = []
+    specs = list(mail_merge.valid_specs(roster, on_error=lambda *e: errors.append(e)))
+    assert [s['name'] for s in specs] == ['A. Person', 'B. Person']
+    assert [line for line, _ in errors] == [4, 5]
+    assert errors[0][1] == ['duplicate name: line 2 already writes Q3_Review_A_Person.pptx']
+
+
+def test_rows_without_a_name_share_the_default(tmp_path):
+    roster = write(tmp_path / 'roster.jsonl', '{}\n{"stat_data.0.0": "3"}\n')
+    errors = []
+    assert list(mail_merge.valid_specs(roster, on_error=lambda *e: errors.append(e))) == [{}]
+    assert [line for line, _ in errors] == [2]
+
+
+def test_merge_writes_each_valid_row(tmp_path):
+    rows = [{'name': 'Ada'}, {'name': 'Ada'}, {'name': 'Bo', 'stat_data.0.0': 3}, {'name': 'Cy', 'bogus': 1}, 'x']
+    roster = write(tmp_path / 'roster.jsonl', '\n'.join(map(json.dumps, rows)) + '\n')
+    out = tmp_path / 'out'
+    errors = []
+    stats = mail_merge.merge(roster, str(out), ['dark', 'white'], on_error=lambda *e: errors.append(e))
+    assert (stats['rows'], stats['rendered'], stats['invalid'], stats['decks']) == (5, 2, 3, 4)
+    assert [line for line, _ in errors] == [2, 4, 5]
+    assert sorted(os.listdir(out)) == ['Q3_Review_Ada.pptx', 'Q3_Review_Ada_White_Theme.pptx',
+                                       'Q3_Review_Bo.pptx', 'Q3_Review_Bo_White_Theme.pptx']
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(mail_merge.RosterError):
+        list(mail_merge.read_roster(write(tmp_path / 'roster.txt', 'name\n')))
@@ -0,0 +1,56 @@
+"""Direct OOXML writer: every deck and edge case is byte-identical to the python-pptx path."""
+
+import io
+import zipfile
+from dataclasses import replace
+
+import pytest
+from pptx.enum.text import PP_ALIGN
+from pptx.util import Inches, Pt
+
+import deck_content
+from renderer import SlideModel, render
+from theme import THEMES
+
+
+def edge_cases(build_log):
+    s = SlideModel()
+    s.rect(0, 0, Inches(1), Inches(1), 'card_bg')
+    s.rect(Inches(1), 0, Inches(1), Inches(1), 'card_bg', 'card_bd', 0.06)
+    s.text(0, Inches(1), Inches(4), Inches(1), 'two\nlines & <tags> "quoted"\vsoft\x07bell', font_size=10.5)
+    s.text(0, Inches(2), Inches(4), Inches(1), '', bold=True, align=PP_ALIGN.RIGHT, font_name='Arial')
+    s.multiline(0, Inches(3), Inches(4), Inches(2), ['first', '', 'third\nwrapped'], spacing=Pt(4))
+    s.multiline(0, Inches(5), Inches(4), Inches(2), [])
+    s.card(Inches(5), Inches(1), Inches(3.8), Inches(2.1), '🚀', 'Title', 'Description text')
+    s.flow_step(Inches(5), Inches(4), '⚙️', 'Step', 'Detail', show_arrow=True)
+    s.banner_item(Inches(9), Inches(4), Inches(2.9), '42', 'label', 'banner_t')
+    c = SlideModel()
+    c.chart(Inches(0.5), Inches(0.5), Inches(6), Inches(3), build_log, chart='bar', metric='p90_minutes',
+            title='Build & <test> "time"')
+    c.chart(Inches(6.5), Inches(0.5), Inches(6), Inches(3), build_log, chart='line', metric='failure_rate')
+    c.text(Inches(0.5), Inches(4), Inches(4), Inches(1), 'after the charts')
+    c.chart(Inches(6.5), Inches(4), Inches(6), Inches(3), build_log, chart='bar', metric='p90_minutes',
+            title='Build & <test> "time"')    # the same dataset twice
+    return [s, c]
+
+
+def parts(prs):
+    buf = io.BytesIO()
+    prs.save(buf)
+    with zipfile.ZipFile(buf) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+FLAGS = [dict(fit_text=fit, text_styles=styles, slide_master=master, emoji_images=emoji)
+         for fit in (False, True) for styles in (False, True) for master in (False, True) for emoji in (False, True)]
+
+
+@pytest.mark.parametrize('flags', FLAGS, ids=lambda f: '-'.join(k for k, v in f.items() if v) or 'plain')
+@pytest.mark.parametrize('theme', sorted(THEMES))
+@pytest.mark.parametrize('deck', [*deck_content.DECKS, 'edge cases'])
+def test_direct_xml_matches_python_pptx(deck, theme, flags, build_log):
+    slides = edge_cases(build_log) if deck == 'edge cases' else deck_content.build(None, deck)
+    theme = replace(THEMES[theme], **flags)
+    a, b = parts(render(slides, theme)), parts(render(slides, replace(theme, direct_xml=True)))
+    assert sorted(a) == sorted(b)
+    assert [name for name in a if a[name] != b[name]] == []
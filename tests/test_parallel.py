@@ -0,0 +1,34 @@
+"""Process-pool rendering: the same decks as a single process, and wrappers that leave tracked files alone."""
+
+import os
+import subprocess
+import sys
+import zipfile
+
+import deck_engine
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def parts(path):
+    with zipfile.ZipFile(path) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+def test_jobs_render_the_same_decks(tmp_path):
+    specs = [{'name': f'Employee {i}'} for i in range(4)]
+    serial = deck_engine.render_many(specs, str(tmp_path / 'serial'), ['dark', 'white'])
+    pooled = deck_engine.render_many(specs, str(tmp_path / 'pooled'), ['dark', 'white'], jobs=2)
+    assert [os.path.basename(p) for p in serial] == [os.path.basename(p) for p in pooled]
+    for a, b in zip(serial, pooled):
+        assert parts(a) == parts(b)
+
+
+def test_wrappers_default_to_the_output_directory(tmp_path):
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    for script, name in (('generate_ppt_1.py', 'Q3_Review_Manprit_Singh_Panesar.pptx'),
+                         ('generate_ppt_white.py', 'Q3_Review_White_Theme.pptx')):
+        subprocess.run([sys.executable, os.path.join(ROOT, script)], cwd=tmp_path, env=env, check=True,
+                       stdout=subprocess.DEVNULL)
+        assert os.listdir(tmp_path) == ['decks_out']
+        assert name in os.listdir(tmp_path / 'decks_out')
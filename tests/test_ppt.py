@@ -0,0 +1,98 @@
+"""ppt.py launcher: fast startup without python-pptx, validate, render forwarding and its error messages."""
+
+import io
+import json
+import subprocess
+import sys
+import time
+import zipfile
+from dataclasses import replace
+
+import pytest
+
+import ppt
+from conftest import ROOT
+
+
+def run(*args):
+    """Run ppt.py in a fresh interpreter; (return code, stdout, stderr, seconds)."""
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, 'ppt.py', *args], cwd=ROOT, capture_output=True, text=True)
+    return result.returncode, result.stdout, result.stderr, time.perf_counter() - start
+
+
+def write(path, data):
+    path.write_text(data if isinstance(data, str) else json.dumps(data), encoding='utf-8')
+    return str(path)
+
+
+def parts(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+NO_PPTX = """
+import sys, ppt
+try:
+    ppt.main(sys.argv[1:])
+except SystemExit:
+    pass
+print('pptx' in sys.modules, 'lxml' in sys.modules)
+"""
+
+
+@pytest.mark.parametrize('args', [('--help',), ('validate', 'decks/q3.json')])
+def test_starts_fast_without_pptx(args):
+    result = subprocess.run([sys.executable, '-c', NO_PPTX, *args], cwd=ROOT, capture_output=True, text=True)
+    assert result.stdout.splitlines()[-1] == 'False False'
+    assert min(run(*args)[3] for _ in range(3)) < 0.1    # interpreter startup included
+
+
+def test_profile_startup_reports_imports(tmp_path):
+    rc, _, err, _ = run('--profile-startup', 'validate', write(tmp_path / 'p.json', {'name': 'Ada'}))
+    assert rc == 0
+    assert err.startswith('  self ms  cumulative ms  module') and 'deck_content' in err
+    assert 'of which imports' in err and 'pptx imported: False' in err
+
+
+def test_validate(tmp_path, capsys):
+    good = write(tmp_path / 'good.json', [{'name': 'Ada'}, {'name': 'Bo'}])
+    bad = write(tmp_path / 'bad.json', {'no_such_var': 1})
+    broken = write(tmp_path / 'broken.json', '{"name": ')
+    assert ppt.main(['validate', good, f'{ROOT}/decks/q3.json']) == 0
+    out = capsys.readouterr().out
+    assert '2 specs OK for deck \'q3\'' in out and 'deck spec OK' in out
+    assert ppt.main(['validate', good, bad, broken]) == 1
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith('✅') and 'unknown variable' in lines[1] and lines[2].startswith(f'❌ {broken}: ')
+    assert ppt.main(['validate', good, '--deck', 'nope']) == 1
+    assert 'unknown deck' in capsys.readouterr().out
+
+
+def test_render_no_cache_forwards_to_deck_engine(tmp_path, capsys):
+    import deck_engine
+    from theme import THEMES
+
+    spec = {'name': 'Ada'}
+    out = tmp_path / 'deck.pptx'
+    assert ppt.main(['render', write(tmp_path / 'p.json', spec), '-o', str(out), '--theme', 'white',
+                     '--no-cache']) == 0
+    assert '(rendered,' in capsys.readouterr().out
+    expected = deck_engine.render_bytes(spec, replace(THEMES['white'], direct_xml=True))
+    assert parts(out.read_bytes()) == parts(expected)
+
+
+def test_cache_hit_does_not_import_pptx(tmp_path):
+    args = ('render', write(tmp_path / 'p.json', {'name': 'Ada'}), '-o', str(tmp_path / 'deck.pptx'),
+            '--cache-dir', str(tmp_path / 'cache'))
+    assert 'rendered, cached' in run(*args)[1]
+    rc, out, err, _ = run('--profile-startup', *args)
+    assert rc == 0 and 'cache hit' in out and 'pptx imported: False' in err
+
+
+@pytest.mark.parametrize('content, message', [('{"name": ', 'Expecting value'), (None, 'No such file')])
+def test_unreadable_spec_is_a_one_line_error(tmp_path, content, message):
+    path = str(tmp_path / 'p.json') if content is None else write(tmp_path / 'p.json', content)
+    rc, out, err, _ = run('render', path, '-o', str(tmp_path / 'deck.pptx'), '--no-cache')
+    assert rc == 1 and err == ''
+    assert out.startswith('❌') and message in out and len(out.splitlines()) == 1
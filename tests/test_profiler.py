@@ -0,0 +1,135 @@
+"""Profiler: stages wrapped on every render path, nothing left patched, reports, merging and traces."""
+
+import glob
+import importlib
+import io
+import json
+import os
+from dataclasses import replace
+
+import pytest
+
+import deck_content
+import deck_engine
+import profiler
+from conftest import ROOT
+from incremental import write_incremental
+from profiler import Profiler
+from theme import THEMES
+
+CORE = {'plan', 'new_presentation', 'set_bg', 'save'}
+UNPROFILED = {('deck_engine', 'new_presentation')}   # the pool's warm-up, never inside a profiled build
+
+
+def render_paths(tmp_path, build_log):
+    """name -> a build through one of the ways decks are written."""
+    spec, dark = {'name': 'A. Person'}, THEMES['dark']
+    path = str(tmp_path / 'incremental.pptx')
+    return {
+        'python-pptx': lambda: deck_engine.write_deck(io.BytesIO(), spec, dark),
+        'direct_xml': lambda: deck_engine.write_deck(io.BytesIO(), spec, replace(dark, direct_xml=True)),
+        'stream': lambda: deck_engine.write_deck(io.BytesIO(), spec, dark, stream=True),
+        'incremental': lambda: write_incremental(deck_content.build(spec), dark, path),
+        'incremental update': lambda: write_incremental(deck_content.build({'name': 'B. Person'}), dark, path),
+        'fit': lambda: deck_engine.write_deck(io.BytesIO(), spec, replace(dark, fit_text=True)),
+        'emoji_images': lambda: deck_engine.write_deck(io.BytesIO(), spec, replace(dark, emoji_images=True)),
+        'charts': lambda: deck_engine.write_deck(io.BytesIO(), {'build_data': build_log}, dark),
+    }
+
+
+def bindings():
+    return {(module, attr): getattr(importlib.import_module(module), attr) for module, attr, _ in profiler.STAGES}
+
+
+def test_stage_targets_exist():
+    for (module, attr), fn in bindings().items():
+        assert callable(fn), f'{module}.{attr}'
+
+
+def test_every_by_name_import_of_a_stage_is_listed():
+    staged = {id(fn) for fn in bindings().values()}
+    listed = set(bindings())
+    for path in glob.glob(os.path.join(ROOT, '*.py')):
+        name = os.path.basename(path)[:-3]
+        if name.startswith('bench_'):
+            continue
+        module = importlib.import_module(name)
+        for attr, value in vars(module).items():
+            if id(value) in staged and getattr(value, '__module__', name) != name:
+                assert (name, attr) in listed | UNPROFILED, f'{name}.{attr} is a stage imported by name'
+
+
+def test_every_stage_binding_is_reached(tmp_path, build_log, monkeypatch):
+    # One stage per binding (a plain wrapper, since only 'slide' gets the per-position one)
+    monkeypatch.setattr(profiler, 'STAGES', tuple((m, a, f'{m}.{a}') for m, a, _ in profiler.STAGES))
+    prof = Profiler()
+    for build in render_paths(tmp_path, build_log).values():
+        with prof:
+            build()
+    assert set(prof.stats) >= {stage for _, _, stage in profiler.STAGES}
+
+
+@pytest.mark.parametrize('path', ['python-pptx', 'direct_xml', 'stream', 'incremental', 'incremental update'])
+def test_each_render_path_reports_the_core_stages(tmp_path, build_log, path):
+    paths = render_paths(tmp_path, build_log)
+    if path == 'incremental update':
+        paths['incremental']()
+    prof = Profiler()
+    with prof:
+        paths[path]()
+    stages = set(prof.report()['stages'])
+    assert CORE <= stages and 'slide 01' in stages
+
+
+def test_nothing_is_patched_when_off():
+    before = bindings()
+    with Profiler(rate=0) as prof:
+        assert bindings() == before
+        deck_engine.write_deck(io.BytesIO())
+    assert (prof.runs, prof.sampled, prof.stats) == (1, 0, {})
+    with Profiler():
+        assert all(fn is not before[key] for key, fn in bindings().items())
+    assert bindings() == before
+
+
+def test_only_one_profiler_at_a_time():
+    with Profiler():
+        with pytest.raises(RuntimeError):
+            with Profiler():
+                pass
+    with Profiler():    # the first one let go
+        pass
+
+
+def test_report_and_merge():
+    one, two = Profiler(), Profiler()
+    with one:
+        deck_engine.write_deck(io.BytesIO())
+    for _ in range(2):
+        with two:
+            deck_engine.write_deck(io.BytesIO())
+    counts = {stage: entry[0] for stage, entry in one.stats.items()}
+    one.merge(json.loads(json.dumps(two.snapshot())))   # as it comes back from a worker process
+    report = one.report()
+    assert (report['runs'], report['sampled']) == (3, 3)
+    assert report['stages']['plan']['count'] == 3
+    assert all(report['stages'][stage]['count'] == 3 * n for stage, n in counts.items())
+    own = [st['self_ms'] for st in report['stages'].values()]
+    assert own == sorted(own, reverse=True)
+    for st in report['stages'].values():
+        assert 0 <= st['self_ms'] <= st['total_ms'] + 1e-3
+
+
+def test_write_report_and_trace(tmp_path):
+    prof = Profiler(trace=True)
+    with prof:
+        deck_engine.write_deck(io.BytesIO())
+    prof.write_report(str(tmp_path / 'profile.json'))
+    prof.write_trace(str(tmp_path / 'trace.json'))
+    assert json.loads((tmp_path / 'profile.json').read_text()) == prof.report()
+    events = json.loads((tmp_path / 'trace.json').read_text())['traceEvents']
+    assert len(events) == sum(count for count, _, _ in prof.stats.values())
+    assert {e['ph'] for e in events} == {'X'} and {e['pid'] for e in events} == {os.getpid()}
+    save, = [e for e in events if e['name'] == 'save']
+    slides = [e for e in events if e['cat'] == 'slide']
+    assert len(slides) == len(deck_content.build(None)) and all(e['ts'] + e['dur'] <= save['ts'] for e in slides)
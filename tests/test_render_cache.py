@@ -0,0 +1,76 @@
+"""Render cache: keys, the disk LRU and its hot tier, and hits without the renderer."""
+
+import os
+import subprocess
+import sys
+
+import render_cache
+from render_cache import RenderCache, cache_key, render_cached
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_key_normalizes_spec_and_separates_options():
+    assert cache_key({'name': 'A', 'team': 'B'}) == cache_key({'team': 'B', 'name': 'A'})
+    assert cache_key(None) == cache_key({})
+    base = cache_key({'name': 'A'})
+    others = [cache_key({'name': 'B'}), cache_key({'name': 'A'}, 'white'), cache_key({'name': 'A'}, deck='q3_compact'),
+              cache_key({'name': 'A'}, level=1), cache_key({'name': 'A'}, fit=True)]
+    assert base not in others and len(set(others)) == len(others)
+
+
+def test_key_follows_data_files(tmp_path):
+    log = tmp_path / 'builds.npz'
+    log.write_bytes(b'x')
+    before = cache_key({'build_data': str(log)})
+    log.write_bytes(b'xy')
+    assert cache_key({'build_data': str(log)}) != before
+
+
+def test_disk_lru_evicts_least_recent(tmp_path):
+    cache = RenderCache(str(tmp_path), max_bytes=250, hot_bytes=0)
+    for key in ('aa1', 'bb2', 'cc3'):
+        cache.put(key, b'x' * 100)
+    assert cache.evictions == 1 and cache.get('aa1') is None
+    assert cache.get('bb2') == b'x' * 100
+    cache.put('dd4', b'y' * 100)    # bb2 was just read, so cc3 goes
+    assert cache.get('cc3') is None and cache.get('bb2') is not None
+    assert sorted(f for _, _, files in os.walk(tmp_path) for f in files) == ['bb2.pptx', 'dd4.pptx']
+
+
+def test_recency_survives_a_restart(tmp_path):
+    first = RenderCache(str(tmp_path), max_bytes=250)
+    first.put('aa1', b'x' * 100)
+    first.put('bb2', b'x' * 100)
+    os.utime(first.path('bb2'), ns=(1, 1))     # bb2 now looks least recently used
+    second = RenderCache(str(tmp_path), max_bytes=250)
+    second.put('cc3', b'x' * 100)
+    assert second.get('bb2') is None and second.get('aa1') is not None
+    assert second.stats()['entries'] == 2
+
+
+def test_hot_tier(tmp_path):
+    cache = RenderCache(str(tmp_path), hot_bytes=150)
+    cache.put('aa1', b'x' * 100)
+    assert cache.get('aa1') and cache.hot_hits == 1
+    cache.put('bb2', b'y' * 100)    # pushes aa1 out of memory, not off disk
+    assert cache.get('aa1') and cache.disk_hits == 1 and cache.hot_evictions >= 1
+
+
+def test_render_cached_renders_once(tmp_path, monkeypatch):
+    cache = RenderCache(str(tmp_path))
+    data = render_cached({'name': 'A. Person'}, 'white', cache=cache)
+    assert data[:2] == b'PK' and cache.misses == 1
+    assert render_cached({'name': 'A. Person'}, 'white', cache=cache) == data
+    assert cache.misses == 1 and cache.hot_hits == 1
+    monkeypatch.setattr(render_cache, '_version', 'another renderer')
+    assert render_cached({'name': 'A. Person'}, 'white', cache=cache) == data
+    assert cache.misses == 2
+
+
+def test_hit_does_not_import_the_renderer(tmp_path):
+    out = tmp_path / 'deck.pptx'
+    cmd = [sys.executable, 'render_cache.py', '-o', str(out), '--cache-dir', str(tmp_path / 'cache')]
+    assert 'rendered' in subprocess.run(cmd, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    second = subprocess.run(cmd, cwd=ROOT, check=True, capture_output=True, text=True).stdout
+    assert 'cache hit' in second and 'pptx imported: False' in second
@@ -0,0 +1,112 @@
+"""render_server: request parsing, error statuses and the render cache off the event loop."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+import render_server
+from render_cache import RenderCache
+
+
+class RecordingCache(RenderCache):
+    """RenderCache noting which thread each call ran on."""
+
+    def __init__(self, directory):
+        super().__init__(directory)
+        self.threads = []
+
+    def get(self, key):
+        self.threads.append(threading.current_thread())
+        return super().get(key)
+
+    def put(self, key, data):
+        self.threads.append(threading.current_thread())
+        return super().put(key, data)
+
+
+async def exchange(port, raw):
+    """Send *raw* bytes on a new connection; (status, headers, body) of the reply, and whether it was closed."""
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(raw)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while (line := await reader.readline()) != b'\r\n':
+        key, _, value = line.decode('latin-1').partition(':')
+        headers[key.strip().lower()] = value.strip()
+    body = await reader.readexactly(int(headers['content-length']))
+    closed = await reader.read(1) == b''
+    writer.close()
+    return status, headers, body, closed
+
+
+def post(body, query='', headers=None):
+    headers = {'Content-Length': str(len(body)), **(headers or {})}
+    head = ''.join(f'{k}: {v}\r\n' for k, v in headers.items() if v is not None)
+    return f'POST /render{query} HTTP/1.1\r\nHost: test\r\nConnection: close\r\n{head}\r\n'.encode() + body
+
+
+def run_server(cache, *requests):
+    """Replies to *requests* (raw bytes, each on its own connection, in order) from a one-worker server."""
+    async def go():
+        service = render_server.RenderService(1, 4, cache)
+        service.start()
+        server = await asyncio.start_server(render_server.make_handler(service), '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return [await exchange(port, raw) for raw in requests]
+        finally:
+            server.close()
+            await service.close()
+    return asyncio.run(go())
+
+
+def test_bad_content_length_is_400_and_closes():
+    (status, _, body, closed), = run_server(None, post(b'{}', headers={'Content-Length': 'abc'}))
+    assert status == 400 and 'Content-Length' in json.loads(body)['error']
+    assert closed
+
+
+@pytest.mark.parametrize('value', ['-1', '+2', ' 2_0'])
+def test_signed_content_length_is_400(value):
+    (status, *_), = run_server(None, post(b'{}', headers={'Content-Length': value}))
+    assert status == 400
+
+
+def test_chunked_body_is_501():
+    raw = post(b'2\r\n{}\r\n0\r\n\r\n', headers={'Content-Length': None, 'Transfer-Encoding': 'chunked'})
+    (status, _, body, closed), = run_server(None, raw)
+    assert status == 501 and 'Transfer-Encoding' in json.loads(body)['error']
+    assert closed
+
+
+@pytest.mark.parametrize('spec, message', [({'no_such_var': 1}, 'unknown variable'),
+                                           ({'name': ['a', 'list']}, "variable 'name' should be a str")])
+def test_invalid_spec_is_400(spec, message):
+    (status, _, body, _), = run_server(None, post(json.dumps(spec).encode()))
+    assert status == 400 and message in json.loads(body)['error']
+
+
+def test_cache_runs_off_the_event_loop(tmp_path):
+    cache = RecordingCache(str(tmp_path))
+    raw = post(json.dumps({'name': 'Ada'}).encode())
+    first, second = run_server(cache, raw, raw)
+    assert first[0] == second[0] == 200 and first[2] == second[2]
+    assert first[2][:2] == b'PK'
+    assert cache.misses == 1 and cache.hot_hits == 1
+    assert len(cache.threads) == 3 and threading.main_thread() not in cache.threads
+
+
+@pytest.mark.parametrize('name, fallback, encoded', [('张伟', 'Q3_Review___.pptx', 'Q3_Review_%E5%BC%A0%E4%BC%9F.pptx'),
+                                                     ('Łukasz', 'Q3_Review__ukasz.pptx', 'Q3_Review_%C5%81ukasz.pptx')])
+def test_non_latin1_name_gets_an_encoded_filename(name, fallback, encoded):
+    (status, headers, body, _), = run_server(None, post(json.dumps({'name': name}).encode()))
+    assert status == 200 and body[:2] == b'PK'
+    assert headers['content-disposition'] == f'attachment; filename="{fallback}"; filename*=UTF-8\'\'{encoded}'
+
+
+def test_ascii_filename_has_no_extended_form():
+    assert render_server.content_disposition('Q3_Review_Ada.pptx') == \
+        'Content-Disposition: attachment; filename="Q3_Review_Ada.pptx"'
@@ -0,0 +1,47 @@
+"""Component template cache: clones match shapes built one by one, per theme."""
+
+import io
+import zipfile
+from dataclasses import replace
+
+from pptx.dml.color import RGBColor
+from pptx.util import Inches
+
+import deck_engine
+import zip_writer
+from renderer import add_card, new_presentation
+from slide_cache import CACHE
+from theme import DARK
+
+
+def parts(prs):
+    buf = io.BytesIO()
+    zip_writer.save(prs, buf)
+    with zipfile.ZipFile(buf) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+def test_cloned_decks_match_uncached(monkeypatch):
+    CACHE.clear()
+    for theme in ('dark', 'white'):
+        monkeypatch.setattr(CACHE, 'enabled', False)
+        built = parts(deck_engine.build_deck({'name': 'A. Person'}, theme))
+        monkeypatch.setattr(CACHE, 'enabled', True)
+        deck_engine.build_deck({'name': 'B. Person'}, theme)    # fill the cache
+        cloned = parts(deck_engine.build_deck({'name': 'A. Person'}, theme))
+        assert cloned == built
+    assert CACHE.hits
+
+
+def test_same_name_other_palette_gets_its_own_template():
+    CACHE.clear()
+    red = replace(DARK, palette=dict(DARK.palette, card_bg=RGBColor(0xFF, 0x00, 0x00)))
+    xml = []
+    for theme in (DARK, red):
+        prs = new_presentation(theme)
+        s = prs.slides.add_slide(prs.slide_layouts[6])
+        add_card(s, theme, Inches(1), Inches(1), Inches(3), Inches(2), '🚀', 'Title', 'Description')
+        xml.append(s.shapes._spTree.xml)
+    assert '16182D' in xml[0] and 'FF0000' not in xml[0]
+    assert 'FF0000' in xml[1]
+    assert CACHE.misses == 2
@@ -0,0 +1,150 @@
+"""Generated slide master: every slide looks the same as with blank-layout slides."""
+
+import io
+import re
+import zipfile
+from dataclasses import replace
+
+import pytest
+from lxml import etree
+
+import deck_content
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+NS = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+      'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+PPR_ATTRS = ('algn', 'marL', 'indent')
+RPR_ATTRS = ('sz', 'b')
+LAYOUT = re.compile(rb'Target="\.\./(slideLayouts/slideLayout\d+\.xml)"')
+BODY_DEFAULTS = {'wrap': 'square', 'lIns': '91440', 'tIns': '45720', 'rIns': '91440', 'bIns': '45720',
+                 'anchor': 't', 'autofit': 'noAutofit'}  # no autofit element means none
+
+
+def _props(pPr):
+    """Formatting set directly on a paragraph (or list level) properties element."""
+    props = {}
+    if pPr is None:
+        return props
+    for name in PPR_ATTRS:
+        if pPr.get(name) is not None:
+            props[name] = pPr.get(name)
+    for tag in ('spcBef', 'spcAft'):
+        pts = pPr.find(f'a:{tag}/a:spcPts', NS)
+        if pts is not None:
+            props[tag] = pts.get('val')
+    rpr = pPr.find('a:defRPr', NS)
+    if rpr is not None:
+        for name in RPR_ATTRS:
+            if rpr.get(name) is not None:
+                props[name] = rpr.get(name)
+        color = rpr.find('a:solidFill/*', NS)
+        if color is not None:
+            props['color'] = color.get('val')
+        latin = rpr.find('a:latin', NS)
+        if latin is not None:
+            props['typeface'] = latin.get('typeface')
+    return props
+
+
+def _body(bodyPr):
+    """Text frame properties a bodyPr sets (wrap, insets, anchor, autofit)."""
+    if bodyPr is None:
+        return {}
+    body = {name: bodyPr.get(name) for name in BODY_DEFAULTS if bodyPr.get(name) is not None}
+    for fit in bodyPr:
+        body['autofit'] = etree.QName(fit).localname
+    return body
+
+
+def _layout_placeholders(xml):
+    """{(ph type, idx): (spPr element, bodyPr props, level-1 paragraph props)} of a layout."""
+    out = {}
+    for sp in etree.fromstring(xml).iterfind('p:cSld/p:spTree/p:sp', NS):
+        ph = sp.find('p:nvSpPr/p:nvPr/p:ph', NS)
+        if ph is not None:
+            out[ph.get('type', 'obj'), ph.get('idx', '0')] = (
+                sp.find('p:spPr', NS), _body(sp.find('p:txBody/a:bodyPr', NS)),
+                _props(sp.find('p:txBody/a:lstStyle/a:lvl1pPr', NS)))
+    return out
+
+
+def _xfrm(xfrm):
+    off, ext = xfrm.find('a:off', NS), xfrm.find('a:ext', NS)
+    return off.get('x'), off.get('y'), ext.get('cx'), ext.get('cy')
+
+
+def _geometry(spPr):
+    geom = spPr.find('a:prstGeom', NS)
+    return geom.get('prst'), tuple(gd.get('fmla') for gd in geom.iterfind('a:avLst/a:gd', NS))
+
+
+def _fill(spPr):
+    fill = spPr.find('a:solidFill/*', NS) if spPr is not None else None
+    return None if fill is None else fill.get('val')
+
+
+def resolved_slides(data):
+    """Per slide: (background, [(geometry, fill, line, text frame, [(text, paragraph props)])]) as seen."""
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        style = etree.fromstring(z.read('ppt/presentation.xml')).find('p:defaultTextStyle', NS)
+        levels = [_props(style.find(f'a:lvl{n}pPr', NS)) for n in range(1, 10)]
+        master = etree.fromstring(z.read('ppt/slideMasters/slideMaster1.xml'))
+        master_bg = master.find('p:cSld/p:bg/p:bgPr/a:solidFill/*', NS)
+        layouts = {}
+        out = []
+        names = sorted((n for n in z.namelist() if re.match(r'ppt/slides/slide\d+\.xml$', n)),
+                       key=lambda n: int(re.search(r'\d+', n).group()))
+        for name in names:
+            layout = LAYOUT.search(z.read(name.replace('slides/', 'slides/_rels/') + '.rels')).group(1).decode()
+            if layout not in layouts:
+                layouts[layout] = _layout_placeholders(z.read('ppt/' + layout))
+            root = etree.fromstring(z.read(name))
+            bg = root.find('p:cSld/p:bg/p:bgPr/a:solidFill/*', NS)
+            if bg is None:
+                bg = master_bg
+            shapes = []
+            for sp in root.iterfind('p:cSld/p:spTree/p:sp', NS):
+                spPr = sp.find('p:spPr', NS)
+                xfrm, body, base = spPr.find('a:xfrm', NS), {}, {}
+                ph = sp.find('p:nvSpPr/p:nvPr/p:ph', NS)
+                if ph is not None:
+                    l_spPr, body, base = layouts[layout][ph.get('type', 'obj'), ph.get('idx', '0')]
+                    xfrm = xfrm if xfrm is not None else l_spPr.find('a:xfrm', NS)
+                paras = []
+                for p in sp.iterfind('p:txBody/a:p', NS):
+                    if p.find('a:r', NS) is None:
+                        continue
+                    pPr = p.find('a:pPr', NS)
+                    level = int(pPr.get('lvl', 0)) if pPr is not None else 0
+                    inherited = base if ph is not None else levels[level]
+                    text = ''.join(t.text or '' for t in p.iterfind('a:r/a:t', NS))
+                    # marL/indent="0" are the defaults the style levels spell out
+                    paras.append((text, {'marL': '0', 'indent': '0', **inherited, **_props(pPr)}))
+                frame = {**BODY_DEFAULTS, **body, **_body(sp.find('p:txBody/a:bodyPr', NS))}
+                shapes.append((_xfrm(xfrm), _geometry(spPr if ph is None else l_spPr), _fill(spPr),
+                               _fill(spPr.find('a:ln', NS)), frame, paras))
+            out.append((bg.get('val'), shapes))
+        return out
+
+
+def build(deck, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(deck_content.build(None, deck), theme), buf)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize('direct', [False, True], ids=['python-pptx', 'direct'])
+@pytest.mark.parametrize('styles', [False, True], ids=['plain', 'styles'])
+@pytest.mark.parametrize('theme', sorted(THEMES))
+@pytest.mark.parametrize('deck', list(deck_content.DECKS))
+def test_slides_resolve_the_same(deck, theme, styles, direct):
+    theme = replace(THEMES[theme], text_styles=styles, direct_xml=direct)
+    plain = resolved_slides(build(deck, theme))
+    master = resolved_slides(build(deck, replace(theme, slide_master=True)))
+    assert len(plain) == len(master)
+    for n, (a, b) in enumerate(zip(plain, master), 1):
+        assert a[0] == b[0], f'slide {n}: background'
+        assert len(a[1]) == len(b[1]), f'slide {n}: shape count'
+        assert [i for i, (x, y) in enumerate(zip(a[1], b[1])) if x != y] == [], f'slide {n}: shapes differ'
@@ -0,0 +1,127 @@
+"""Streaming render: the same parts as render() + save(), written slide by slide, one slide's XML held at a time."""
+
+import io
+import json
+import zipfile
+from dataclasses import replace
+
+import pytest
+from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+
+import deck_content
+import deck_engine
+import streaming
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+
+def parts(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        return {name: z.read(name) for name in z.namelist()}
+
+
+def saved(slides, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(slides, theme), buf)
+    return buf.getvalue()
+
+
+def streamed(slides, theme):
+    buf = io.BytesIO()
+    n = streaming.write_streaming(slides, theme, buf)
+    return buf.getvalue(), n
+
+
+@pytest.mark.parametrize('flags', [{}, {'direct_xml': True}, {'slide_master': True}, {'text_styles': True}],
+                         ids=['pptx', 'direct_xml', 'slide_master', 'text_styles'])
+@pytest.mark.parametrize('theme', ['dark', 'white'])
+@pytest.mark.parametrize('deck', ['q3', 'q3_compact'])
+def test_parts_match_render_and_save(deck, theme, flags):
+    theme = replace(THEMES[theme], **flags)
+    slides = deck_content.build(None, deck)
+    data, n = streamed(iter(slides), theme)
+    assert n == len(slides)
+    assert parts(data) == parts(saved(slides, theme))
+    assert len(Presentation(io.BytesIO(data)).slides) == n
+
+
+class Sink:
+    """A write-only, unseekable output that remembers the part names written so far."""
+
+    def __init__(self):
+        self.data = bytearray()
+
+    def write(self, b):
+        self.data += b
+        return len(b)
+
+    def flush(self):
+        pass
+
+    def written(self, name):
+        return name.encode() in self.data
+
+
+def test_each_slide_is_written_and_released_before_the_next(monkeypatch):
+    seen = []
+    render_slide = streaming.render_slide
+
+    def spy(prs, model, theme):
+        seen.append(prs)
+        return render_slide(prs, model, theme)
+    monkeypatch.setattr(streaming, 'render_slide', spy)
+
+    sink = Sink()
+    models = deck_content.build(None)
+
+    def slides():
+        for i, model in enumerate(models):
+            if i:
+                rels = [rel for rel in seen[0].part.rels.values() if rel.reltype == RT.SLIDE]
+                assert len(rels) == i
+                assert all(isinstance(rel.target_part, streaming._Flushed) for rel in rels)
+                assert sink.written(f'ppt/slides/slide{i}.xml') and not sink.written(f'ppt/slides/slide{i + 1}.xml')
+            yield model
+
+    assert streaming.write_streaming(slides(), 'dark', sink) == len(models)
+    assert parts(bytes(sink.data)) == parts(saved(models, THEMES['dark']))
+
+
+def test_write_deck_stream_writes_the_same_parts():
+    plain, stream = io.BytesIO(), io.BytesIO()
+    deck_engine.write_deck(plain, {'name': 'A. Person'}, 'white')
+    deck_engine.write_deck(stream, {'name': 'A. Person'}, 'white', stream=True)
+    assert parts(stream.getvalue()) == parts(plain.getvalue())
+
+
+def test_cli_stream_flag(tmp_path):
+    specs = tmp_path / 'people.json'
+    specs.write_text(json.dumps([{'name': 'A. Person'}, {'name': 'B. Person'}]), encoding='utf-8')
+    for mode in ('plain', 'stream'):
+        argv = [str(specs), '-o', str(tmp_path / mode), '--theme', 'dark', '--theme', 'white', '--direct-xml']
+        assert deck_engine.main(argv + (['--stream'] if mode == 'stream' else [])) == 0
+    names = sorted(p.name for p in (tmp_path / 'plain').iterdir())
+    assert names == sorted(p.name for p in (tmp_path / 'stream').iterdir()) and len(names) == 4
+    for name in names:
+        assert parts((tmp_path / 'stream' / name).read_bytes()) == parts((tmp_path / 'plain' / name).read_bytes())
+
+
+def test_cli_stream_rejects_incremental(tmp_path, capsys):
+    with pytest.raises(SystemExit) as e:
+        deck_engine.main([str(tmp_path / 'people.json'), '--stream', '--incremental'])
+    assert e.value.code == 2 and '--incremental' in capsys.readouterr().err
+
+
+def test_profile_has_the_same_stages_as_a_normal_render():
+    from profiler import Profiler
+
+    stages = {}
+    for stream in (False, True):
+        prof = Profiler()
+        with prof:
+            deck_engine.write_deck(io.BytesIO(), {'name': 'A. Person'}, 'dark', stream=stream)
+        stages[stream] = set(prof.report()['stages'])
+    assert stages[True] == stages[False]
+    assert {'plan', 'new_presentation', 'save', 'slide 01'} <= stages[True]
@@ -0,0 +1,34 @@
+"""Text fitting: sizes shrink only as far as needed, and fitted themes reach pool workers."""
+
+import pickle
+from dataclasses import replace
+
+from pptx.util import Inches
+
+import deck_engine
+import text_fit
+from theme import THEMES
+
+
+def test_short_text_keeps_its_size():
+    assert text_fit.fit('Short', Inches(3), Inches(0.4), 14)[0] == 14
+
+
+def test_long_text_shrinks_until_it_fits():
+    text = 'A description long enough to need several lines in a narrow card ' * 3
+    size, _ = text_fit.fit(text, Inches(2), Inches(0.8), 14)
+    assert text_fit.MIN_SIZE <= size < 14
+    if size > text_fit.MIN_SIZE:
+        assert text_fit.text_height(text, size, Inches(2)) <= Inches(0.8)
+
+
+def test_themes_pickle_with_their_colours():
+    theme = replace(THEMES['white'], fit_text=True)
+    copy = pickle.loads(pickle.dumps(theme))
+    assert copy == theme and copy.color('purple') == theme.color('purple')
+
+
+def test_fitted_decks_render_in_a_process_pool(tmp_path):
+    themes = [replace(THEMES['dark'], fit_text=True)]   # what `deck_engine.py -j N --fit` sends to the workers
+    paths = deck_engine.render_many([{'name': 'A. Person'}, {'name': 'B. Person'}], str(tmp_path), themes, jobs=2)
+    assert len(paths) == 2
@@ -0,0 +1,87 @@
+"""Shared text styles: every paragraph resolves to the same formatting as per-paragraph styling."""
+
+import io
+import zipfile
+from dataclasses import replace
+
+import pytest
+from lxml import etree
+
+import deck_content
+import zip_writer
+from renderer import render
+from theme import THEMES
+
+NS = {'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+      'p': 'http://schemas.openxmlformats.org/presentationml/2006/main'}
+PPR_ATTRS = ('algn', 'marL', 'indent')
+RPR_ATTRS = ('sz', 'b')
+
+
+def _props(pPr):
+    """Formatting set directly on a paragraph (or list level) properties element."""
+    props = {}
+    if pPr is None:
+        return props
+    for name in PPR_ATTRS:
+        if pPr.get(name) is not None:
+            props[name] = pPr.get(name)
+    for tag in ('spcBef', 'spcAft'):
+        pts = pPr.find(f'a:{tag}/a:spcPts', NS)
+        if pts is not None:
+            props[tag] = pts.get('val')
+    rpr = pPr.find('a:defRPr', NS)
+    if rpr is not None:
+        for name in RPR_ATTRS:
+            if rpr.get(name) is not None:
+                props[name] = rpr.get(name)
+        color = rpr.find('a:solidFill/*', NS)
+        if color is not None:
+            props['color'] = color.get('val')
+        latin = rpr.find('a:latin', NS)
+        if latin is not None:
+            props['typeface'] = latin.get('typeface')
+    return props
+
+
+def effective_formatting(data):
+    """[(slide part, shape id, paragraph, {property: value})] of every text paragraph in a .pptx."""
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        style = etree.fromstring(z.read('ppt/presentation.xml')).find('p:defaultTextStyle', NS)
+        levels = [_props(style.find(f'a:lvl{n}pPr', NS)) for n in range(1, 10)]
+        out = []
+        for name in sorted(n for n in z.namelist() if n.startswith('ppt/slides/slide')):
+            for sp in etree.fromstring(z.read(name)).iterfind('.//p:sp', NS):
+                shape_id = sp.find('p:nvSpPr/p:cNvPr', NS).get('id')
+                for i, p in enumerate(sp.iterfind('p:txBody/a:p', NS)):
+                    if p.find('a:r', NS) is None:
+                        continue
+                    pPr = p.find('a:pPr', NS)
+                    level = int(pPr.get('lvl', 0)) if pPr is not None else 0
+                    # indent="0" is the schema default, which the style levels spell out
+                    out.append((name, shape_id, i, {'indent': '0', **levels[level], **_props(pPr)}))
+    return out
+
+
+def build(deck, theme):
+    buf = io.BytesIO()
+    zip_writer.save(render(deck_content.build(None, deck), theme), buf)
+    return buf.getvalue()
+
+
+@pytest.mark.parametrize('direct', [False, True], ids=['python-pptx', 'direct'])
+@pytest.mark.parametrize('theme', sorted(THEMES))
+@pytest.mark.parametrize('deck', list(deck_content.DECKS))
+def test_effective_formatting_unchanged(deck, theme, direct):
+    theme = replace(THEMES[theme], direct_xml=direct)
+    plain = effective_formatting(build(deck, theme))
+    styled = effective_formatting(build(deck, replace(theme, text_styles=True)))
+    assert len(plain) == len(styled)
+    assert [a[:3] for a, b in zip(plain, styled) if a != b] == []
+
+
+def test_slide_xml_shrinks():
+    def slide_bytes(theme):
+        with zipfile.ZipFile(io.BytesIO(build('q3', theme))) as z:
+            return sum(i.file_size for i in z.infolist() if i.filename.startswith('ppt/slides/slide'))
+    assert slide_bytes(replace(THEMES['dark'], text_styles=True)) < slide_bytes(THEMES['dark'])
@@ -0,0 +1,85 @@
+"""zip_writer: same parts as Presentation.save(), at every level, on any writable file object."""
+
+import io
+import zipfile
+from dataclasses import replace
+
+import pytest
+
+import deck_content
+import zip_writer
+from renderer import render
+from slide_cache import TemplateCache
+from theme import DARK
+
+
+class WriteOnly:
+    """A file object with nothing but write() and flush(), like a pipe."""
+
+    def __init__(self):
+        self.buf = io.BytesIO()
+
+    def write(self, data):
+        return self.buf.write(data)
+
+    def flush(self):
+        pass
+
+
+@pytest.fixture(scope='module')
+def prs():
+    return render(deck_content.build({'name': 'Ada'}, 'q3'), replace(DARK, direct_xml=True))
+
+
+def parts(data):
+    with zipfile.ZipFile(io.BytesIO(data)) as z:
+        assert z.testzip() is None
+        return {info.filename: (z.read(info), info.compress_type) for info in z.infolist()}
+
+
+@pytest.mark.parametrize('level', [0, 1, 6])
+def test_save_matches_presentation_save(prs, level):
+    expected = io.BytesIO()
+    prs.save(expected)
+    out = WriteOnly()
+    zip_writer.save(prs, out, level, cache=TemplateCache())
+    ours, theirs = parts(out.buf.getvalue()), parts(expected.getvalue())
+    assert list(ours) == list(theirs)
+    assert {name: blob for name, (blob, _) in ours.items()} == {name: blob for name, (blob, _) in theirs.items()}
+    if level == 0:
+        assert {method for _, method in ours.values()} == {zip_writer.STORED}
+
+
+def test_boilerplate_is_compressed_once(prs):
+    cache = TemplateCache()
+    first, second = io.BytesIO(), io.BytesIO()
+    zip_writer.save(prs, first, cache=cache)
+    misses, hits = cache.misses, cache.hits
+    zip_writer.save(prs, second, cache=cache)
+    assert misses > 0 and cache.misses == misses
+    assert cache.hits - hits == misses + hits  # every boilerplate write of the second deck
+    assert parts(first.getvalue()) == parts(second.getvalue())
+
+
+def test_copy_keeps_compressed_bytes(prs, tmp_path):
+    src = tmp_path / 'deck.pptx'
+    zip_writer.save(prs, str(src))
+    out = io.BytesIO()
+    with zipfile.ZipFile(src) as z:
+        stream = zip_writer.ZipStream(out)
+        for info in z.infolist():
+            stream.copy(z, info, 'copy/' + info.filename)
+        stream.close()
+        expected = {'copy/' + info.filename: z.read(info) for info in z.infolist()}
+    assert {name: blob for name, (blob, _) in parts(out.getvalue()).items()} == expected
+
+
+def test_zip64_past_65535_entries():
+    out = io.BytesIO()
+    z = zip_writer.ZipStream(out, level=0)
+    for i in range(0x10000):
+        z.write(f'{i}', b'')
+    z.close()
+    with zipfile.ZipFile(out) as zf:
+        names = zf.namelist()
+    assert len(names) == 0x10000 and names[-1] == '65535'
@@ -0,0 +1,214 @@
+"""
+Text measurement and fitting with real font metrics.
+
+Advance widths are read straight from the TrueType file of the requested face
+(Calibri, else its metric-compatible clone Carlito, else a common sans
+fallback) once per process into a {codepoint: em width} table. Widths are
+memoized per (face, string) and wrap()/fit() per (face, size, string, box),
+so fitting every text box of a large batch is mostly dictionary lookups.
+
+    from text_fit import fit
+    size, lines = fit('A long card description ...', Inches(3.5), Inches(0.8), 10)
+"""
+
+import functools
+import os
+import struct
+
+EMU_PER_PT = 12700
+LINE_SPACING = 1.2          # PowerPoint single spacing, as a multiple of the font size
+INSET_X = 2 * 0.1 * 72      # default text box insets (pt): 0.1in left + right
+INSET_Y = 2 * 0.05 * 72     #                               0.05in top + bottom
+MIN_SIZE = 7
+SIZE_STEP = 0.5
+
+AVG_EM = 0.5   # per-glyph width when no font file can be found at all
+WIDE_EM = 1.0  # glyphs the face lacks (emoji), drawn by PowerPoint from a fallback font
+
+FONT_DIRS = [
+    os.path.join(os.environ.get('WINDIR', r'C:\Windows'), 'Fonts'),
+    '/Library/Fonts', '/System/Library/Fonts', os.path.expanduser('~/Library/Fonts'),
+    '/usr/share/fonts', '/usr/local/share/fonts', os.path.expanduser('~/.fonts'),
+    os.path.expanduser('~/.local/share/fonts'),
+]
+
+# (family, bold) -> candidate file names, best first
+FACES = {
+    ('Calibri', False): ['calibri.ttf', 'carlito-regular.ttf'],
+    ('Calibri', True): ['calibrib.ttf', 'carlito-bold.ttf'],
+}
+FALLBACK = {
+    False: ['arial.ttf', 'liberationsans-regular.ttf', 'dejavusans.ttf'],
+    True: ['arialbd.ttf', 'liberationsans-bold.ttf', 'dejavusans-bold.ttf'],
+}
+
+
+# ── Font files ──
+
+@functools.lru_cache(maxsize=None)
+def _font_index():
+    """{lowercased file name: path} of every font under FONT_DIRS (walked once)."""
+    index = {}
+    for root_dir in FONT_DIRS:
+        for root, _, files in os.walk(root_dir):
+            for name in files:
+                if name.lower().endswith(('.ttf', '.otf', '.ttc')):
+                    index.setdefault(name.lower(), os.path.join(root, name))
+    return index
+
+
+def find_font(family='Calibri', bold=False):
+    """Path of the TrueType file used to measure *family*, or None."""
+    index = _font_index()
+    for name in FACES.get((family, bold), []) + [f'{family.lower()}.ttf'] + FALLBACK[bold]:
+        if name in index:
+            return index[name]
+    return None
+
+
+def _cmap4(data, off):
+    seg2 = struct.unpack_from('>H', data, off + 6)[0]
+    n = seg2 // 2
+    ends = struct.unpack_from(f'>{n}H', data, off + 14)
+    starts = struct.unpack_from(f'>{n}H', data, off + 16 + seg2)
+    deltas = struct.unpack_from(f'>{n}h', data, off + 16 + 2 * seg2)
+    ro_base = off + 16 + 3 * seg2
+    range_offsets = struct.unpack_from(f'>{n}H', data, ro_base)
+    cmap = {}
+    for i in range(n):
+        start, end, delta, ro = starts[i], ends[i], deltas[i], range_offsets[i]
+        if start == 0xFFFF:
+            continue
+        for c in range(start, end + 1):
+            if ro == 0:
+                g = (c + delta) & 0xFFFF
+            else:
+                g = struct.unpack_from('>H', data, ro_base + 2 * i + ro + 2 * (c - start))[0]
+                g = (g + delta) & 0xFFFF if g else 0
+            if g:
+                cmap[c] = g
+    return cmap
+
+
+def _cmap12(data, off):
+    n_groups = struct.unpack_from('>I', data, off + 12)[0]
+    cmap = {}
+    for i in range(n_groups):
+        start, end, glyph = struct.unpack_from('>3I', data, off + 16 + 12 * i)
+        for c in range(start, end + 1):
+            cmap[c] = glyph + c - start
+    return cmap
+
+
+def read_widths(path):
+    """{codepoint: advance width in em} from the hmtx/cmap tables of a TrueType font."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    base = struct.unpack_from('>I', data, 12)[0] if data[:4] == b'ttcf' else 0  # first face of a .ttc
+    n_tables = struct.unpack_from('>H', data, base + 4)[0]
+    tables = {}
+    for i in range(n_tables):
+        tag, _, offset, _ = struct.unpack_from('>4sIII', data, base + 12 + 16 * i)
+        tables[tag] = offset
+
+    units = struct.unpack_from('>H', data, tables[b'head'] + 18)[0]
+    n_metrics = struct.unpack_from('>H', data, tables[b'hhea'] + 34)[0]
+    advances = struct.unpack_from('>' + 'Hh' * n_metrics, data, tables[b'hmtx'])[::2]
+
+    cmap_off = tables[b'cmap']
+    subtables = {}
+    for i in range(struct.unpack_from('>H', data, cmap_off + 2)[0]):
+        platform, encoding, offset = struct.unpack_from('>HHI', data, cmap_off + 4 + 8 * i)
+        subtables[platform, encoding] = cmap_off + offset
+    for ids, parse in (((3, 10), _cmap12), ((0, 4), _cmap12), ((3, 1), _cmap4), ((0, 3), _cmap4)):
+        if ids in subtables:
+            cmap = parse(data, subtables[ids])
+            break
+    else:
+        raise ValueError(f'{path}: no Unicode cmap subtable')
+
+    last = advances[-1]
+    return {c: (advances[g] if g < n_metrics else last) / units for c, g in cmap.items()}
+
+
+@functools.lru_cache(maxsize=None)
+def glyph_widths(family='Calibri', bold=False):
+    """Glyph-width table for a face ({} when no usable font file exists)."""
+    path = find_font(family, bold)
+    if path is None:
+        return {}
+    try:
+        return read_widths(path)
+    except (OSError, KeyError, ValueError, struct.error):
+        return {}
+
+
+# ── Measuring ──
+
+@functools.lru_cache(maxsize=1 << 16)
+def text_width(text, family='Calibri', bold=False):
+    """Width of a single line of *text* in em (multiply by the font size in pt)."""
+    widths = glyph_widths(family, bold)
+    if not widths:
+        return len(text) * AVG_EM
+    get = widths.get
+    return sum(get(ord(ch), WIDE_EM) for ch in text if ch not in '\u200d\ufe0f')
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def wrap(text, size, width, family='Calibri', bold=False):
+    """Greedy word wrap of *text* at *size* pt into a box *width* EMU wide. Returns a tuple of lines."""
+    avail = max(width / EMU_PER_PT - INSET_X, 1) / size  # em
+    space = text_width(' ', family, bold)
+    lines = []
+    for para in text.split('\n'):
+        line, line_w = [], 0.0
+        for word in para.split(' '):
+            w = text_width(word, family, bold)
+            if line and line_w + space + w > avail:
+                lines.append(' '.join(line))
+                line, line_w = [], 0.0
+            # Words longer than the box are broken mid-word, one line per box width
+            while not line and w > avail and len(word) > 1:
+                cut = len(word) - 1
+                while cut > 1 and text_width(word[:cut], family, bold) > avail:
+                    cut -= 1
+                lines.append(word[:cut])
+                word = word[cut:]
+                w = text_width(word, family, bold)
+            line_w = line_w + space + w if line else w
+            line.append(word)
+        lines.append(' '.join(line))
+    return tuple(lines)
+
+
+def text_height(text, size, width, family='Calibri', bold=False, para_space=0):
+    """Height in EMU of *text* wrapped at *size* pt into *width* EMU (insets included)."""
+    lines = wrap(text, size, width, family, bold)
+    paras = text.count('\n') + 1
+    pt = len(lines) * size * LINE_SPACING + paras * para_space + INSET_Y
+    return int(pt * EMU_PER_PT)
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def fit(text, width, height, size, family='Calibri', bold=False, para_space=0, min_size=MIN_SIZE):
+    """Largest font size <= *size* (in SIZE_STEP steps) at which *text* fits the box.
+
+    Text fits when no paragraph has to wrap (boxes are often sized as single
+    line slots) or when the wrapped lines fit *height*. *width*/*height* are
+    in EMU, *para_space* is extra pt per paragraph (space before/after).
+    Returns (size, lines); text that does not fit even at *min_size* comes
+    back at *min_size*.
+    """
+    paras = text.count('\n') + 1
+    while True:
+        lines = wrap(text, size, width, family, bold)
+        if (len(lines) <= paras or size <= min_size
+                or text_height(text, size, width, family, bold, para_space) <= height):
+            return size, lines
+        size = max(size - SIZE_STEP, min_size)
+
+
+def cache_info():
+    """lru_cache statistics of the memoized measuring functions."""
+    return {f.__name__: f.cache_info() for f in (text_width, wrap, fit)}
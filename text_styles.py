@@ -0,0 +1,133 @@
+"""
+Named text styles, registered once per deck instead of repeated on every paragraph.
+
+Without them every paragraph carries its full formatting: size, bold, color,
+typeface, alignment and spacing in its own <a:pPr>. With Theme.text_styles,
+apply() writes the styles below into the deck's default text style
+(presentation.xml) and the slide master's "other" text style, one per list
+level, and each paragraph only names its level (<a:pPr lvl="3"/>) plus
+whatever differs from that style. There are nine list levels, so nine named
+styles; a paragraph takes the style that leaves the least to override.
+
+    prs = new_presentation()
+    text_styles.apply(prs, theme)        # renderer.render() does this itself
+    level, overrides = text_styles.match(text_styles.levels(theme), 12, rgb, False, PP_ALIGN.LEFT,
+                                         'Calibri', 0, 0)
+
+The rendered text is unchanged; only the XML gets smaller.
+"""
+
+import functools
+from xml.sax.saxutils import quoteattr
+
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Emu
+
+# Position = list level. (name, size pt or theme metric, color role, bold, align, space before/after pt)
+STYLES = (
+    ('body',       18,           'text1',  False, 'l',   0,  0),
+    ('title',      34,           'text1',  True,  'l',   0,  0),
+    ('eyebrow',    11,           'purple', True,  'l',   0,  0),
+    ('subtitle',   13,           'text2',  False, 'l',   0,  0),
+    ('bullet',     12,           'text2',  False, 'l',   10, 2),
+    ('emoji',      'card.emoji', 'text1',  False, 'ctr', 0,  0),
+    ('card_title', 'card.title', 'text1',  True,  'ctr', 0,  0),
+    ('card_desc',  10,           'text2',  False, 'ctr', 0,  0),
+    ('caption',    8,            'text3',  False, 'ctr', 0,  0),
+)
+LEVEL = {name: i for i, (name, *_) in enumerate(STYLES)}
+
+# Cost of overriding each property in a paragraph, roughly its XML size
+_COST = (1, 1, 4, 3, 1, 2, 2)   # size, bold, color, typeface, align, space before, space after
+
+_LEVEL_XML = ('<a:lvl{n}pPr marL="0" indent="0" algn="{algn}" defTabSz="457200" rtl="0" eaLnBrk="1" '
+              'latinLnBrk="0" hangingPunct="1"><a:spcBef><a:spcPts val="{before}"/></a:spcBef>'
+              '<a:spcAft><a:spcPts val="{after}"/></a:spcAft><a:buNone/>'
+              '<a:defRPr sz="{sz}" b="{b}" kern="1200"><a:solidFill><a:srgbClr val="{color}"/></a:solidFill>'
+              '<a:latin typeface={font}/><a:ea typeface="+mn-ea"/><a:cs typeface="+mn-cs"/></a:defRPr>'
+              '</a:lvl{n}pPr>')
+_levels = {}  # (palette id, font, theme sizes) -> (palette, levels)
+_LEVEL_TAGS = tuple(qn(f'a:lvl{n}pPr') for n in range(1, 10))
+_THEME_SIZES = {'card.emoji': lambda t: t.card['emoji'][3], 'card.title': lambda t: t.card['title'][2]}
+
+
+def _cp(emu):
+    """EMU -> centipoints, the way python-pptx writes sz and spcPts."""
+    return int(emu) // 127
+
+
+def levels(theme):
+    """STYLES resolved for *theme*: per level (sz, bold, color hex, typeface, algn, before, after), centipoints."""
+    key = (id(theme.palette), theme.font, *(get(theme) for get in _THEME_SIZES.values()))
+    cached = _levels.get(key)
+    if cached is not None and cached[0] is theme.palette:
+        return cached[1]
+    out = []
+    for _, size, role, bold, algn, before, after in STYLES:
+        size = _THEME_SIZES[size](theme) if isinstance(size, str) else size
+        out.append((_cp(size * 12700), bold, str(theme.color(role)), theme.font, algn,
+                    before * 100, after * 100))
+    _levels[key] = theme.palette, tuple(out)
+    return _levels[key][1]
+
+
+@functools.lru_cache(maxsize=4096)
+def _match(styles, want):
+    best = None
+    for level, style in enumerate(styles):
+        mask = tuple(a != b for a, b in zip(style, want))
+        cost = sum(c for c, m in zip(_COST, mask) if m)
+        if best is None or cost < best[0]:
+            best = cost, level, mask
+    return best[1:]
+
+
+def match(styles, size, color, bold, align, font, before, after):
+    """(level, overrides) for a paragraph: the closest of *styles* (see levels()) and, per
+    property (size, bold, color, typeface, align, space before, space after), whether it
+    must still be set on the paragraph. *size* is in points, *before*/*after* in EMU."""
+    return _match(styles, (_cp(size * 12700), bool(bold), str(color), font, align.xml_value,
+                           _cp(before), _cp(after)))
+
+
+def style_paragraph(p, styles, size, color, bold, align, font, before, after):
+    """Give python-pptx paragraph *p* its style level and only the overriding properties."""
+    level, (o_size, o_bold, o_color, o_font, o_align, o_before, o_after) = match(
+        styles, size, color, bold, align, font, before, after)
+    p.level = level
+    if o_size:
+        p.font.size = Emu(_cp(size * 12700) * 127)
+    if o_color:
+        p.font.color.rgb = color
+    if o_bold:
+        p.font.bold = bold
+    if o_font:
+        p.font.name = font
+    if o_align:
+        p.alignment = align
+    if o_before:
+        p.space_before = before
+    if o_after:
+        p.space_after = after
+
+
+def level_xml(styles):
+    return ''.join(_LEVEL_XML.format(n=n, sz=sz, color=color, b=int(bold), algn=algn, font=quoteattr(font),
+                                     before=before, after=after)
+                   for n, (sz, bold, color, font, algn, before, after) in enumerate(styles, 1))
+
+
+def apply(prs, theme):
+    """Register the theme's styles as the list levels of the deck's default and master 'other' text styles."""
+    xml = level_xml(levels(theme))
+    master = prs.slide_masters[0]._element.find(qn('p:txStyles')).find(qn('p:otherStyle'))
+    for style in (prs.part._element.find(qn('p:defaultTextStyle')), master):
+        for old in list(style.iterchildren(*_LEVEL_TAGS)):
+            style.remove(old)
+        ext = style.find(qn('a:extLst'))
+        for lvl in parse_xml('<a:lstStyle %s>%s</a:lstStyle>' % (nsdecls('a'), xml)):
+            if ext is None:
+                style.append(lvl)
+            else:
+                ext.addprevious(lvl)
@@ -0,0 +1,116 @@
+"""
+Deck themes: palette, fonts and the small card/flow metric differences
+between the dark and white designs.
+
+Slide content refers to colors by role ('text1', 'card_bg', 'purple', ...);
+a Theme maps each role to an RGBColor at render time, so the same content
+model can be rendered in any theme.
+"""
+
+import copyreg
+from dataclasses import dataclass, field, fields
+from functools import cached_property
+
+from pptx.dml.color import RGBColor
+
+# RGBColor is a tuple subclass whose __new__ takes (r, g, b), which the default
+# pickle protocol gets wrong; themes must pickle to reach worker processes.
+copyreg.pickle(RGBColor, lambda c: (RGBColor, tuple(c)))
+
+
+@dataclass(frozen=True)
+class Theme:
+    name: str
+    palette: dict
+    font: str = 'Calibri'
+    # add_card: emoji (dx, dy, h, size), title (dx, dy, size), desc top offset
+    card: dict = field(default_factory=dict)
+    # add_flow_step: emoji (h, size), title/desc top offsets, arrow (dy, w)
+    flow: dict = field(default_factory=dict)
+    # Shrink text that would overflow its box (see text_fit.py)
+    fit_text: bool = False
+    # Write shapes as XML directly instead of through python-pptx proxies (see ooxml.py)
+    direct_xml: bool = False
+    # Refer to deck-level named text styles instead of formatting every paragraph (see text_styles.py)
+    text_styles: bool = False
+    # Generate the slide master and layouts, and put header text in their placeholders (see slide_master.py)
+    slide_master: bool = False
+    # Draw emoji as pictures rasterized from a local emoji font (see emoji_images.py)
+    emoji_images: bool = False
+
+    @cached_property
+    def key(self):
+        """Hashable value of every field, for cache keys (the dict fields make a Theme itself unhashable)."""
+        values = (getattr(self, f.name) for f in fields(self))
+        return tuple(tuple(sorted(v.items())) if isinstance(v, dict) else v for v in values)
+
+    def color(self, role):
+        """Resolve a palette role; RGBColor values and None pass through."""
+        if role is None or isinstance(role, RGBColor):
+            return role
+        return self.palette[role]
+
+
+DARK = Theme(
+    name='dark',
+    palette={
+        'bg':          RGBColor(0x0B, 0x0D, 0x17),
+        'card_bg':     RGBColor(0x16, 0x18, 0x2D),
+        'card_bd':     RGBColor(0x25, 0x28, 0x45),
+        'purple':      RGBColor(0x7C, 0x6A, 0xFF),
+        'blue':        RGBColor(0x4D, 0xA8, 0xFF),
+        'teal':        RGBColor(0x3E, 0xDD, 0xC6),
+        'pink':        RGBColor(0xFF, 0x6B, 0x9D),
+        'gold':        RGBColor(0xFF, 0xB7, 0x4D),
+        'green':       RGBColor(0x66, 0xDE, 0x93),
+        'white':       RGBColor(0xFF, 0xFF, 0xFF),
+        'text1':       RGBColor(0xFF, 0xFF, 0xFF),
+        'text2':       RGBColor(0xB0, 0xB0, 0xC0),
+        'text3':       RGBColor(0x70, 0x70, 0x90),
+        'red_soft':    RGBColor(0x40, 0x1A, 0x28),
+        'grn_soft':    RGBColor(0x14, 0x3A, 0x30),
+        'banner_p':    RGBColor(0x3A, 0x35, 0x7A),
+        'banner_t':    RGBColor(0x24, 0x5A, 0x5A),
+        'banner_label': RGBColor(0xDD, 0xDD, 0xEE),
+    },
+    card={'emoji': (0.25, 0.2, 0.5, 28), 'title': (0.15, 0.7, 13), 'desc_dy': 1.1},
+    flow={'emoji': (0.45, 24), 'title_dy': 0.55, 'desc_dy': 0.9, 'arrow': (0.4, 0.4)},
+)
+
+WHITE = Theme(
+    name='white',
+    palette={
+        'bg':          RGBColor(0xFF, 0xFF, 0xFF),
+        'card_bg':     RGBColor(0xF5, 0xF5, 0xF9),
+        'card_bd':     RGBColor(0xE0, 0xE0, 0xE8),
+        'purple':      RGBColor(0x5B, 0x4C, 0xDB),
+        'blue':        RGBColor(0x2E, 0x86, 0xDE),
+        'teal':        RGBColor(0x0F, 0xA3, 0x8E),
+        'pink':        RGBColor(0xE0, 0x40, 0x6E),
+        'gold':        RGBColor(0xD4, 0x8A, 0x20),
+        'green':       RGBColor(0x28, 0xA7, 0x5B),
+        'white':       RGBColor(0xFF, 0xFF, 0xFF),
+        'text1':       RGBColor(0x22, 0x22, 0x33),
+        'text2':       RGBColor(0x55, 0x55, 0x70),
+        'text3':       RGBColor(0x88, 0x88, 0x9A),
+        'red_soft':    RGBColor(0xFD, 0xED, 0xF0),
+        'grn_soft':    RGBColor(0xE8, 0xF8, 0xF0),
+        'banner_p':    RGBColor(0x5B, 0x4C, 0xDB),
+        'banner_t':    RGBColor(0x0F, 0xA3, 0x8E),
+        'banner_label': RGBColor(0xE8, 0xE8, 0xF0),
+    },
+    card={'emoji': (0.2, 0.15, 0.45, 26), 'title': (0.12, 0.6, 12), 'desc_dy': 0.95},
+    flow={'emoji': (0.4, 22), 'title_dy': 0.5, 'desc_dy': 0.85, 'arrow': (0.35, 0.45)},
+)
+
+THEMES = {t.name: t for t in (DARK, WHITE)}
+
+
+def get_theme(theme):
+    """Accept a Theme or a theme name."""
+    if isinstance(theme, Theme):
+        return theme
+    try:
+        return THEMES[theme]
+    except KeyError:
+        raise ValueError(f'unknown theme {theme!r}, expected one of {sorted(THEMES)}') from None
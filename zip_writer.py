@@ -0,0 +1,174 @@
+"""
+Streaming .pptx writer with tunable compression.
+
+Presentation.save() deflates every part at zlib's default level through
+zipfile, including the slide master, layouts, theme and the other template
+parts that are identical in every deck of a batch. save() here walks the
+package the same way python-pptx does but writes each part straight to the
+output as it is serialized, at any compression level (0 = store only, for
+intermediate artifacts), and keeps the compressed bytes of boilerplate parts
+in a process-wide cache keyed by content hash, so after the first deck they
+are copied out without deflating again.
+
+    from zip_writer import save
+    save(prs, 'deck.pptx')              # level 6, like prs.save()
+    save(prs, 'deck.pptx', level=1)     # faster, slightly larger
+    save(prs, buf, level=0)             # stored, any writable file object
+
+ZipStream is the underlying writer; it can also copy entries from an
+existing zip without recompressing them (see incremental.py and deck_merge.py).
+"""
+
+import hashlib
+import re
+import struct
+import time
+import zlib
+
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI
+from pptx.opc.serialized import _ContentTypesItem
+
+from slide_cache import TemplateCache
+
+DEFAULT_LEVEL = 6
+# Template parts every deck shares; their compressed bytes are cached by content hash
+BOILERPLATE = re.compile(r'ppt/(slideMasters|slideLayouts|theme|printerSettings)/'
+                         r'|ppt/(presProps|viewProps|tableStyles)\.xml$|docProps/thumbnail')
+
+STORED, DEFLATED = 0, 8
+_LOCAL = struct.Struct('<IHHHHHIIIHH')
+_CENTRAL = struct.Struct('<IHHHHHHIIIHHHHHII')
+_END = struct.Struct('<IHHHHIIH')
+_END64 = struct.Struct('<IQHHIIQQQQ')
+_LOCATOR64 = struct.Struct('<IIQI')
+_EXTRA64 = struct.Struct('<HHQ')     # zip64 extra field holding a local header offset
+_VERSION = 20
+_VERSION64 = 45
+_MADE_BY = 3 << 8 | _VERSION        # unix, like zipfile
+_EXTERNAL_ATTR = 0o600 << 16        # what zipfile.writestr() sets
+
+CACHE = TemplateCache(maxsize=128)
+
+
+def _dos_time(t=None):
+    t = time.localtime(t)
+    return (t.tm_hour << 11 | t.tm_min << 5 | t.tm_sec // 2,
+            (t.tm_year - 1980) << 9 | t.tm_mon << 5 | t.tm_mday)
+
+
+def compress(data, level=DEFAULT_LEVEL):
+    """(method, crc, compressed bytes) for *data*; stored when deflate would not shrink it."""
+    crc = zlib.crc32(data)
+    if level:
+        c = zlib.compressobj(level, zlib.DEFLATED, -15)
+        packed = c.compress(data) + c.flush()
+        if len(packed) < len(data):
+            return DEFLATED, crc, packed
+    return STORED, crc, data
+
+
+class ZipStream:
+    """Write-once zip archive on a file object; entries go out as soon as they are added.
+
+    Zip64 records are only added when the archive needs them (more than 65535
+    entries or 4 GiB, as a merge of thousands of decks can reach); a single
+    entry must stay under 4 GiB. The file object only needs write(), so pipes
+    and sockets work too.
+    """
+
+    def __init__(self, fp, level=DEFAULT_LEVEL, cache=None):
+        self.fp = fp
+        self.level = level
+        self.cache = cache
+        self.offset = 0
+        self.central = bytearray()      # the central directory, one record packed per entry as it is added
+        self.count = 0
+        self.time, self.date = _dos_time()
+
+    def _emit(self, name, method, crc, size, data):
+        raw = name.encode('utf-8')
+        flags = 0 if raw.isascii() else 0x800
+        extra = _EXTRA64.pack(1, 8, self.offset) if self.offset > 0xFFFFFFFF else b''
+        self.central += _CENTRAL.pack(0x02014B50, _MADE_BY, _VERSION64 if extra else _VERSION, flags, method,
+                                      self.time, self.date, crc, len(data), size, len(raw), len(extra), 0, 0, 0,
+                                      _EXTERNAL_ATTR, min(self.offset, 0xFFFFFFFF)) + raw + extra
+        self.count += 1
+        header = _LOCAL.pack(0x04034B50, _VERSION, flags, method, self.time, self.date,
+                             crc, len(data), size, len(raw), 0)
+        self.fp.write(header + raw)
+        self.fp.write(data)
+        self.offset += len(header) + len(raw) + len(data)
+
+    def write(self, name, data, cacheable=False):
+        """Add *name* with *data*, compressed at the stream's level (or taken from the cache)."""
+        if cacheable and self.cache is not None:
+            key = (hashlib.sha1(data).digest(), self.level)
+            entry = self.cache.get(key)
+            if entry is None:
+                self.cache.misses += 1
+                entry = compress(data, self.level)
+                self.cache.put(key, entry)
+            else:
+                self.cache.hits += 1
+        else:
+            entry = compress(data, self.level)
+        method, crc, packed = entry
+        self._emit(name, method, crc, len(data), packed)
+
+    def copy(self, src, info, name=None):
+        """Copy entry *info* of the open zipfile.ZipFile *src* (as *name*, if given) without recompressing it."""
+        name = name or info.filename
+        if info.compress_type not in (STORED, DEFLATED):
+            return self.write(name, src.read(info))
+        src.fp.seek(info.header_offset)
+        header = src.fp.read(_LOCAL.size)
+        name_len, extra_len = struct.unpack_from('<HH', header, 26)
+        src.fp.seek(info.header_offset + _LOCAL.size + name_len + extra_len)
+        self._emit(name, info.compress_type, info.CRC, info.file_size, src.fp.read(info.compress_size))
+
+    def close(self):
+        """Write the central directory, with zip64 records if the archive outgrew the classic format."""
+        start, n, length = self.offset, self.count, len(self.central)
+        self.fp.write(self.central)
+        self.offset += length
+        if n >= 0xFFFF or max(start, length) >= 0xFFFFFFFF:  # 0xFFFF... in the classic record means 'see zip64'
+            end64 = self.offset
+            self.fp.write(_END64.pack(0x06064B50, _END64.size - 12, _MADE_BY, _VERSION64, 0, 0, n, n, length, start)
+                          + _LOCATOR64.pack(0x07064B50, 0, end64, 1))
+        self.fp.write(_END.pack(0x06054B50, 0, 0, min(n, 0xFFFF), min(n, 0xFFFF), min(length, 0xFFFFFFFF),
+                                min(start, 0xFFFFFFFF), 0))
+        self.fp.flush()
+
+
+def write_parts(z, parts):
+    """Write each of *parts* and its relationships to the ZipStream *z*."""
+    for part in parts:
+        name = part.partname.membername
+        boilerplate = BOILERPLATE.match(name) is not None
+        z.write(name, part.blob, boilerplate)
+        if part._rels:
+            z.write(part.partname.rels_uri.membername, part.rels.xml, boilerplate)
+
+
+def content_types_xml(parts):
+    """[Content_Types].xml for *parts*, as python-pptx writes it."""
+    return serialize_part_xml(_ContentTypesItem.xml_for(parts))
+
+
+def write_package(package, fp, level=DEFAULT_LEVEL, cache=CACHE):
+    """Stream an OPC package (content types, package rels, then each part and its rels) to *fp*."""
+    parts = tuple(package.iter_parts())
+    z = ZipStream(fp, level, cache)
+    z.write(CONTENT_TYPES_URI.membername, content_types_xml(parts))
+    z.write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+    write_parts(z, parts)
+    z.close()
+
+
+def save(prs, file, level=DEFAULT_LEVEL, cache=CACHE):
+    """Save Presentation *prs* to a path or a writable binary file object."""
+    if isinstance(file, str):
+        with open(file, 'wb') as fp:
+            return write_package(prs.part.package, fp, level, cache)
+    return write_package(prs.part.package, file, level, cache)